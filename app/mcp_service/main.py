@@ -16,6 +16,7 @@ Deployment:
 
 import logging
 import json
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import JSONResponse
@@ -26,7 +27,11 @@ from fastapi.middleware.cors import CORSMiddleware
 # from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 
 # Import routers (created in next step)
-from routers import rss, api, webpage, storage, briefs, logging as log_router, notifications
+from routers import rss, api, webpage, websub, storage, briefs, logging as log_router, notifications
+from services import http_clients, parse_executor
+from services.host_limiter import get_host_limiter
+from services.single_flight import single_flight_stats
+from services.dates import date_parse_stats
 
 # Configure structured logging
 logging.basicConfig(
@@ -35,13 +40,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create shared resources on startup and release them on shutdown.
+
+    The pooled outbound HTTP client lives for the whole process so feed
+    fetches reuse keep-alive connections instead of new TCP/TLS handshakes;
+    the parse executor keeps feedparser off the event loop.
+    """
+    await http_clients.startup()
+    await parse_executor.startup()
+    try:
+        yield
+    finally:
+        await parse_executor.shutdown()
+        await http_clients.shutdown()
+
+
 # FastAPI app
 app = FastAPI(
     title="Perception MCP Service",
     description="Model Context Protocol tools for Perception agents",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS middleware (for local development)
@@ -71,6 +96,22 @@ async def health_check():
     }
 
 
+# Outbound fetch metrics
+@app.get("/metrics/outbound")
+async def outbound_metrics():
+    """
+    Per-host politeness counters: requests, time spent waiting on rate
+    limits, and 429/503 throttle responses seen; plus how many fetches were
+    shared by single-flight coalescing and how feed dates were parsed.
+    """
+    return {
+        "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+        **get_host_limiter().stats(),
+        "single_flight": single_flight_stats(),
+        "date_parse": date_parse_stats()
+    }
+
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -81,10 +122,19 @@ async def root():
         "service": "Perception MCP Service",
         "docs": "/docs",
         "health": "/health",
+        "metrics": "/metrics/outbound",
         "tools": [
             "/mcp/tools/fetch_rss_feed",
+            "/mcp/tools/fetch_rss_feeds",
+            "/mcp/tools/fetch_rss_feeds/stream",
             "/mcp/tools/fetch_api_feed",
             "/mcp/tools/fetch_webpage",
+            "/mcp/tools/fetch_webpages",
+            "/mcp/tools/websub_subscribe",
+            "/mcp/tools/websub_unsubscribe",
+            "/mcp/tools/websub_sync",
+            "/mcp/tools/websub_pending",
+            "/mcp/tools/websub_ack",
             "/mcp/tools/store_articles",
             "/mcp/tools/generate_brief",
             "/mcp/tools/log_ingestion_run",
@@ -97,11 +147,15 @@ async def root():
 app.include_router(rss.router, prefix="/mcp/tools", tags=["RSS Tools"])
 app.include_router(api.router, prefix="/mcp/tools", tags=["API Tools"])
 app.include_router(webpage.router, prefix="/mcp/tools", tags=["Web Scraping Tools"])
+app.include_router(websub.router, prefix="/mcp/tools", tags=["WebSub Tools"])
 app.include_router(storage.router, prefix="/mcp/tools", tags=["Storage Tools"])
 app.include_router(briefs.router, prefix="/mcp/tools", tags=["Brief Generation Tools"])
 app.include_router(log_router.router, prefix="/mcp/tools", tags=["Logging Tools"])
 app.include_router(notifications.router, prefix="/mcp/tools", tags=["Notification Tools"])
 
+# Hub-facing WebSub callback (not an MCP tool; must be reachable at WEBSUB_CALLBACK_BASE_URL)
+app.include_router(websub.callback_router, prefix="/websub", tags=["WebSub Callback"])
+
 
 # Global exception handler
 @app.exception_handler(Exception)
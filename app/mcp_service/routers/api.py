@@ -1,28 +1,118 @@
 """
 API Feed Tool Router
 
-Fetches articles from custom API endpoints (NewsAPI, etc.).
+Fetches articles from custom JSON API endpoints (NewsAPI, etc.).
 
-Phase 4: Returns fake but structurally correct responses.
-Phase 5: Wire up real HTTP client + API integrations.
+Each API source is described by an APISourceConfig: the endpoint, where the
+items live in the response, how item fields map onto articles and how the
+API paginates. The config comes from the source's /sources/{feed_id}
+document (field apiConfig) or inline in the request.
+
+Pagination:
+- page / offset: the first page is fetched alone (it may report the total);
+  the remaining pages are fetched `concurrency` at a time
+- cursor: pages are fetched one after another, following the cursor (or
+  next-page URL) found at cursor_path
+
+Pages are scanned in order and fetching stops once the window is exhausted
+(a run of stale items in a newest-first API), max_items is reached or the
+API runs out of pages.
 """
 
+import asyncio
 import logging
 import json
+import os
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from typing import Any, Dict, List, Literal, Optional, Tuple
+from urllib.parse import urlparse
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+import httpx
+from pydantic import BaseModel, Field, ValidationError
+
+from routers.rss import (
+    STALE_RUN_TO_STOP,
+    STALE_STOP_MIN_DATED,
+    ArticleRecord,
+    format_timestamp,
+    since_cutoff,
+    window_cutoff,
+)
+from services.http_clients import get_client
+from services.bounded_download import DownloadError, fetch_bounded
+from services.host_limiter import get_host_limiter
+from services.encoding import FastJSONResponse
+from services.dates import parse_date
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+API_FETCH_TIMEOUT_SECONDS = float(os.getenv("API_FETCH_TIMEOUT_SECONDS", "30"))
+# Largest (decoded) page body accepted from an API
+API_MAX_BYTES = int(os.getenv("API_MAX_BYTES", str(10 * 1024 * 1024)))
+# Hard cap on pages per request, whatever the source config asks for
+API_MAX_PAGES = int(os.getenv("API_MAX_PAGES", "50"))
+# Source configs read from Firestore are reused for this long
+SOURCE_CONFIG_TTL_SECONDS = float(os.getenv("SOURCE_CONFIG_TTL_SECONDS", "300"))
+SOURCES_COLLECTION = os.getenv("SOURCES_COLLECTION", "sources")
+# api_key_env may only name variables with this prefix, so a config (inline
+# ones come from the caller) can't read any other secret of the service
+API_KEY_ENV_PREFIX = "API_KEY_"
+
+# Article field -> dotted path in an API item (NewsAPI layout)
+DEFAULT_FIELD_MAP = {
+    "title": "title",
+    "url": "url",
+    "published_at": "publishedAt",
+    "summary": "description",
+    "author": "author",
+    "content": "content",
+    "source": "source.name",
+    "categories": "categories",
+    "guid": "id",
+}
+
 
 # Pydantic Models
+class APIPagination(BaseModel):
+    """How an API source paginates."""
+    type: Literal["none", "page", "offset", "cursor"] = Field("none", description="Pagination style")
+    page_param: str = Field("page", description="Query parameter carrying the page number (page)")
+    start_page: int = Field(1, description="Number of the first page (page)", ge=0)
+    offset_param: str = Field("offset", description="Query parameter carrying the item offset (offset)")
+    page_size_param: Optional[str] = Field("pageSize", description="Query parameter carrying the page size")
+    page_size: int = Field(100, description="Items requested per page", ge=1, le=1000)
+    cursor_param: str = Field("cursor", description="Query parameter carrying the cursor (cursor)")
+    cursor_path: str = Field("next_cursor", description="Dotted path of the next cursor or next-page URL in a response (cursor)")
+    total_path: Optional[str] = Field(None, description="Dotted path of the total item count in a response (page/offset)")
+    max_pages: int = Field(10, description="Max pages fetched per request", ge=1)
+    concurrency: int = Field(4, description="Max pages fetched at once (page/offset)", ge=1, le=16)
+
+
+class APISourceConfig(BaseModel):
+    """Describes one API source (stored as apiConfig on its /sources document)."""
+    url: str = Field(..., description="Endpoint URL")
+    params: Dict[str, Any] = Field(default_factory=dict, description="Query parameters sent on every page")
+    headers: Dict[str, str] = Field(default_factory=dict, description="Extra request headers")
+    api_key_env: Optional[str] = Field(None, description=f"Environment variable holding the API key (must start with {API_KEY_ENV_PREFIX})")
+    api_key_param: Optional[str] = Field(None, description="Query parameter to send the API key in")
+    api_key_header: Optional[str] = Field(None, description="Header to send the API key in")
+    items_path: str = Field("articles", description="Dotted path of the item list in a response ('' = the response itself)")
+    fields: Dict[str, str] = Field(default_factory=dict, description="Article field -> dotted item path (overrides DEFAULT_FIELD_MAP)")
+    pagination: APIPagination = Field(default_factory=APIPagination)
+
+
 class FetchAPIFeedRequest(BaseModel):
     """Request schema for fetch_api_feed tool."""
     feed_id: str = Field(..., description="Firestore document ID from /sources collection")
     api_params: Optional[Dict[str, Any]] = Field(None, description="Source-specific API parameters")
+    source_config: Optional[APISourceConfig] = Field(None, description="Inline source config (skips the /sources lookup)")
+    time_window_hours: Optional[int] = Field(24, description="Only return articles from last N hours", ge=1, le=720)
+    max_items: Optional[int] = Field(50, description="Maximum number of articles to return", ge=1, le=500)
+    since: Optional[datetime] = Field(None, description="Only return articles published at or after this time (caller's watermark)")
+    request_id: Optional[str] = Field(None, description="Optional request tracking ID")
 
 
 class APIArticle(BaseModel):
@@ -33,8 +123,11 @@ class APIArticle(BaseModel):
     summary: Optional[str] = None
     author: Optional[str] = None
     content_snippet: Optional[str] = None
+    raw_content: Optional[str] = None
     source: Optional[str] = None
     categories: List[str] = Field(default_factory=list)
+    guid: Optional[str] = None
+    date_missing: bool = Field(False, description="True if the item had no usable date (published_at is the fetch time)")
 
 
 class FetchAPIFeedResponse(BaseModel):
@@ -44,6 +137,365 @@ class FetchAPIFeedResponse(BaseModel):
     fetched_at: str
     article_count: int
     articles: List[APIArticle]
+    pages_fetched: int = Field(0, description="API pages downloaded")
+    pages_failed: int = Field(0, description="Pages after the first that failed (articles before them are returned)")
+    items_examined: int = Field(0, description="API items looked at before stopping")
+    stopped_early: bool = Field(False, description="True if pagination stopped at the time window or max_items")
+    bytes_downloaded: int = Field(0, description="Response body bytes downloaded")
+    bytes_transferred: int = Field(0, description="Body bytes received on the wire (before decompression)")
+    throttle_wait_ms: int = Field(0, description="Time spent waiting on per-host rate limits")
+    latency_ms: int = Field(0, description="Total time spent serving this feed")
+
+
+@dataclass(slots=True)
+class APIArticleRecord(ArticleRecord):
+    """ArticleRecord plus the publisher name APIs report per item."""
+    source: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        record = ArticleRecord.to_dict(self)
+        record["source"] = self.source
+        return record
+
+
+# Helper functions
+def get_path(data: Any, path: Optional[str]) -> Any:
+    """Follow a dotted path ("data.items", "links.0.href") through dicts and lists."""
+    if not path:
+        return data
+    for part in path.split("."):
+        if isinstance(data, dict):
+            data = data.get(part)
+        elif isinstance(data, list) and part.isdigit() and int(part) < len(data):
+            data = data[int(part)]
+        else:
+            return None
+        if data is None:
+            return None
+    return data
+
+
+def value_timestamp(value: Any) -> Optional[float]:
+    """Epoch seconds from an API date: epoch seconds/milliseconds or a date string."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value / 1000 if value > 1e11 else float(value)
+    if not isinstance(value, str) or not value:
+        return None
+    return parse_date(value)
+
+
+def _text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
+def normalize_item(item: Dict[str, Any], field_map: Dict[str, str], published_ts: Optional[float]) -> APIArticleRecord:
+    """Build an APIArticleRecord from one API item using the source's field map."""
+    summary = _text(get_path(item, field_map["summary"]))
+    categories = get_path(item, field_map["categories"]) or []
+    if isinstance(categories, str):
+        categories = [categories]
+    url = _text(get_path(item, field_map["url"])) or ""
+
+    return APIArticleRecord(
+        title=_text(get_path(item, field_map["title"])) or "Untitled",
+        url=url,
+        published_at=format_timestamp(published_ts),
+        summary=summary,
+        author=_text(get_path(item, field_map["author"])),
+        content_snippet=summary[:500] if summary else None,
+        raw_content=_text(get_path(item, field_map["content"])),
+        categories=[_text(c) for c in categories if c],
+        guid=_text(get_path(item, field_map["guid"])) or url or None,
+        published_ts=published_ts,
+        source=_text(get_path(item, field_map["source"])),
+    )
+
+
+class ItemScanner:
+    """
+    Normalizes items page by page, in API order, and decides when to stop.
+
+    Same rule as the RSS window scan (routers.rss.normalize_entries): while
+    the dated items seen so far are newest-first, STALE_RUN_TO_STOP stale
+    items in a row mean every later item (and page) is older still, once an
+    in-window dated item was seen or STALE_STOP_MIN_DATED dated items were
+    examined.
+    """
+
+    def __init__(self, field_map: Dict[str, str], cutoff: Optional[float], max_items: Optional[int]):
+        self.field_map = field_map
+        self.cutoff = cutoff
+        self.max_items = max_items
+        self.articles: List[APIArticleRecord] = []
+        self.examined = 0
+        self.done = False
+        self._previous_ts: Optional[float] = None
+        self._ordered = True
+        self._stale_run = 0
+        self._dated = 0
+        self._seen_in_window = False
+
+    def add_page(self, items: List[Any]) -> None:
+        for item in items:
+            if self.done:
+                return
+            if not isinstance(item, dict):
+                continue
+            self.examined += 1
+            published_ts = value_timestamp(get_path(item, self.field_map["published_at"]))
+            if published_ts is not None:
+                self._dated += 1
+                if self._previous_ts is not None and published_ts > self._previous_ts:
+                    self._ordered = False
+                self._previous_ts = published_ts
+
+                if self.cutoff is not None and published_ts < self.cutoff:
+                    self._stale_run += 1
+                    can_stop = self._seen_in_window or self._dated >= STALE_STOP_MIN_DATED
+                    if self._ordered and can_stop and self._stale_run >= STALE_RUN_TO_STOP:
+                        self.done = True
+                    continue
+                self._seen_in_window = True
+
+            self._stale_run = 0
+            self.articles.append(normalize_item(item, self.field_map, published_ts))
+            if self.max_items and len(self.articles) >= self.max_items:
+                self.done = True
+
+
+def api_error(status_code: int, code: str, message: str, feed_id: str, details: Optional[dict] = None) -> HTTPException:
+    """HTTPException with the tool's structured error body."""
+    error = {"code": code, "message": message, "feed_id": feed_id}
+    if details:
+        error["details"] = details
+    return HTTPException(status_code=status_code, detail={"error": error})
+
+
+_source_configs: Dict[str, Tuple[float, APISourceConfig]] = {}
+_db_client = None
+
+
+def _read_source_document(feed_id: str) -> Optional[Dict[str, Any]]:
+    """Blocking Firestore read of /sources/{feed_id} (run in a thread)."""
+    global _db_client
+    if _db_client is None:
+        from google.cloud import firestore
+        _db_client = firestore.Client()
+    doc = _db_client.collection(SOURCES_COLLECTION).document(feed_id).get()
+    return doc.to_dict() if doc.exists else None
+
+
+async def load_source_config(feed_id: str) -> APISourceConfig:
+    """
+    APISourceConfig for a source, from its /sources document's apiConfig field.
+
+    Configs are kept in-process for SOURCE_CONFIG_TTL_SECONDS.
+    """
+    cached = _source_configs.get(feed_id)
+    if cached and time.monotonic() - cached[0] < SOURCE_CONFIG_TTL_SECONDS:
+        return cached[1]
+
+    try:
+        document = await asyncio.to_thread(_read_source_document, feed_id)
+    except Exception as e:
+        raise api_error(503, "SOURCE_CONFIG_UNAVAILABLE", f"Could not read source config: {str(e)}", feed_id)
+    if document is None:
+        raise api_error(404, "SOURCE_NOT_FOUND", f"No source document for {feed_id}", feed_id)
+    if not document.get("apiConfig"):
+        raise api_error(422, "API_CONFIG_MISSING", f"Source {feed_id} has no apiConfig", feed_id)
+    try:
+        config = APISourceConfig.model_validate(document["apiConfig"])
+    except ValidationError as e:
+        raise api_error(422, "API_CONFIG_INVALID", f"Invalid apiConfig: {e.errors()[0]['msg']}", feed_id)
+
+    _source_configs[feed_id] = (time.monotonic(), config)
+    return config
+
+
+def request_template(config: APISourceConfig, api_params: Optional[Dict[str, Any]], feed_id: str) -> Tuple[dict, dict]:
+    """Query parameters and headers shared by every page (API key included)."""
+    params = {**config.params, **(api_params or {})}
+    headers = dict(config.headers)
+    if config.pagination.type != "none" and config.pagination.page_size_param:
+        params[config.pagination.page_size_param] = config.pagination.page_size
+
+    if config.api_key_env:
+        if not config.api_key_env.startswith(API_KEY_ENV_PREFIX):
+            raise api_error(
+                422, "API_CONFIG_INVALID",
+                f"api_key_env must name a {API_KEY_ENV_PREFIX}* environment variable", feed_id
+            )
+        api_key = os.getenv(config.api_key_env)
+        if not api_key:
+            raise api_error(500, "API_KEY_MISSING", f"Environment variable {config.api_key_env} is not set", feed_id)
+        if config.api_key_header:
+            headers[config.api_key_header] = api_key
+        else:
+            params[config.api_key_param or "apiKey"] = api_key
+    return params, headers
+
+
+class PageFetcher:
+    """Fetches API pages over the pooled client, within the host's politeness limits."""
+
+    def __init__(self, headers: dict, feed_id: str):
+        self.client = get_client()
+        self.host_limiter = get_host_limiter()
+        self.headers = headers
+        self.feed_id = feed_id
+        self.pages = 0
+        self.bytes_downloaded = 0
+        self.bytes_transferred = 0
+        self.throttle_wait_ms = 0
+
+    async def get(self, url: str, params: Optional[dict], headers: Optional[dict] = None) -> Any:
+        """Decoded JSON body of one page (raises HTTPException on failure; headers default to the source's)."""
+        try:
+            async with self.host_limiter.slot(url) as slot:
+                self.throttle_wait_ms += slot.wait_ms
+                response = await fetch_bounded(
+                    self.client, url,
+                    max_bytes=API_MAX_BYTES,
+                    params=params,
+                    headers=self.headers if headers is None else headers,
+                    timeout=API_FETCH_TIMEOUT_SECONDS
+                )
+            self.host_limiter.note_response(url, response.status_code, response.headers)
+            response.raise_for_status()
+        except DownloadError as e:
+            self.bytes_transferred += e.bytes_transferred
+            raise api_error(e.http_status, e.code, e.message, self.feed_id, {"max_bytes": API_MAX_BYTES})
+        except httpx.TimeoutException:
+            raise api_error(
+                504, "API_FETCH_FAILED", f"API fetch timeout after {API_FETCH_TIMEOUT_SECONDS:g} seconds",
+                self.feed_id, {"timeout_seconds": int(API_FETCH_TIMEOUT_SECONDS)}
+            )
+        except httpx.HTTPStatusError as e:
+            raise api_error(
+                e.response.status_code, "API_FETCH_FAILED", f"API returned HTTP {e.response.status_code}",
+                self.feed_id, {"http_status": e.response.status_code}
+            )
+        except httpx.HTTPError as e:
+            raise api_error(502, "API_FETCH_FAILED", f"API fetch failed: {str(e) or type(e).__name__}", self.feed_id)
+
+        self.pages += 1
+        self.bytes_downloaded += len(response.content)
+        self.bytes_transferred += response.bytes_transferred
+        try:
+            return response.json()
+        except ValueError:
+            raise api_error(502, "API_RESPONSE_INVALID", "API returned a non-JSON body", self.feed_id)
+
+
+def same_origin(url: str, other: str) -> bool:
+    """True if both URLs have the same scheme and host (port included)."""
+    a, b = urlparse(url), urlparse(other)
+    return (a.scheme.lower(), a.netloc.lower()) == (b.scheme.lower(), b.netloc.lower())
+
+
+def page_items(data: Any, items_path: str) -> List[Any]:
+    items = get_path(data, items_path)
+    return items if isinstance(items, list) else []
+
+
+async def paginate(
+    config: APISourceConfig,
+    params: dict,
+    fetcher: PageFetcher,
+    scanner: ItemScanner,
+) -> int:
+    """
+    Fetch pages into the scanner until it is done or the API runs out.
+
+    The first page's failure propagates; a later page's failure ends
+    pagination with the pages fetched so far.
+
+    Returns:
+        Number of pages that failed after the first
+    """
+    pagination = config.pagination
+    max_pages = min(pagination.max_pages, API_MAX_PAGES) if pagination.type != "none" else 1
+
+    def numbered(page_index: int) -> dict:
+        if pagination.type == "offset":
+            return {**params, pagination.offset_param: page_index * pagination.page_size}
+        return {**params, pagination.page_param: pagination.start_page + page_index}
+
+    first_params = numbered(0) if pagination.type in ("page", "offset") else params
+    data = await fetcher.get(config.url, first_params)
+    items = page_items(data, config.items_path)
+    scanner.add_page(items)
+
+    if pagination.type == "none" or scanner.done:
+        return 0
+
+    if pagination.type == "cursor":
+        for _ in range(max_pages - 1):
+            cursor = get_path(data, pagination.cursor_path)
+            if not cursor or not items or scanner.done:
+                break
+            # Some APIs hand out the next page's full URL instead of a cursor
+            page_headers = None
+            if isinstance(cursor, str) and cursor.startswith(("http://", "https://")):
+                url, page_params = cursor, None
+                if not same_origin(url, config.url):
+                    # Never send the source's headers (API key included) to another host
+                    page_headers = {}
+            else:
+                url, page_params = config.url, {**params, pagination.cursor_param: cursor}
+            try:
+                data = await fetcher.get(url, page_params, page_headers)
+            except HTTPException as e:
+                _log_page_failure(fetcher.feed_id, fetcher.pages, e)
+                return 1
+            items = page_items(data, config.items_path)
+            scanner.add_page(items)
+        return 0
+
+    # page / offset: the remaining page numbers are known up front, so fetch them in waves
+    if len(items) < pagination.page_size:
+        return 0
+    total = get_path(data, pagination.total_path) if pagination.total_path else None
+    if isinstance(total, (int, float)):
+        max_pages = min(max_pages, -(-int(total) // pagination.page_size))
+
+    next_index = 1
+    while next_index < max_pages and not scanner.done:
+        # No more pages than max_items can still use
+        wave_size = pagination.concurrency
+        if scanner.max_items:
+            wanted = scanner.max_items - len(scanner.articles)
+            wave_size = min(wave_size, max(1, -(-wanted // pagination.page_size)))
+        wave = range(next_index, min(next_index + wave_size, max_pages))
+        next_index = wave.stop
+        pages = await asyncio.gather(
+            *(fetcher.get(config.url, numbered(i)) for i in wave), return_exceptions=True
+        )
+        # Scan in page order; a short page or a failure ends the API's results
+        for index, page in zip(wave, pages):
+            if isinstance(page, Exception):
+                _log_page_failure(fetcher.feed_id, index, page)
+                return 1
+            items = page_items(page, config.items_path)
+            scanner.add_page(items)
+            if scanner.done or len(items) < pagination.page_size:
+                return 0
+    return 0
+
+
+def _log_page_failure(feed_id: str, page_index: int, error: Exception) -> None:
+    logger.warning(json.dumps({
+        "severity": "WARNING",
+        "message": "API page fetch failed, returning earlier pages",
+        "mcp_tool": "fetch_api_feed",
+        "feed_id": feed_id,
+        "page_index": page_index,
+        "error": str(error.detail) if isinstance(error, HTTPException) else str(error)
+    }))
 
 
 # Tool Endpoint
@@ -52,48 +504,95 @@ async def fetch_api_feed(request: FetchAPIFeedRequest):
     """
     Fetch articles from a custom API endpoint.
 
-    Phase 4: Returns fake data.
-    Phase 5 TODO:
-    - Query Firestore /sources/{feed_id} for API config
-    - Make HTTP request with proper headers/auth
-    - Parse response based on source type
-    - Handle pagination if needed
+    Uses the source's apiConfig (or the inline source_config), follows its
+    pagination until the time window, max_items or the API's last page, and
+    maps items onto articles.
+    """
+    return FastJSONResponse(await fetch_api_feed_data(request), model=FetchAPIFeedResponse)
+
+
+async def fetch_api_feed_data(request: FetchAPIFeedRequest) -> Dict[str, Any]:
     """
+    fetch_api_feed without the HTTP layer.
+
+    Returns:
+        FetchAPIFeedResponse-shaped dict (raises HTTPException on failure)
+    """
+    start_time = datetime.now(tz=timezone.utc)
+
     logger.info(json.dumps({
         "severity": "INFO",
         "message": "Fetching API feed",
         "mcp_tool": "fetch_api_feed",
-        "feed_id": request.feed_id
+        "feed_id": request.feed_id,
+        "time_window_hours": request.time_window_hours,
+        "max_items": request.max_items,
+        "request_id": request.request_id
     }))
 
-    # PHASE 4: Fake response
-    fake_articles = [
-        APIArticle(
-            title="Microsoft Launches New AI Tool",
-            url="https://example.com/microsoft-ai",
-            published_at=datetime.now(tz=timezone.utc).isoformat(),
-            summary="Microsoft today unveiled a new AI-powered tool.",
-            author="John Doe",
-            content_snippet="Microsoft today unveiled...",
-            source="TechCrunch",
-            categories=["AI", "Microsoft"]
-        )
-    ]
-
-    response = FetchAPIFeedResponse(
-        feed_id=request.feed_id,
-        api_url=f"https://api.example.com/{request.feed_id}",
-        fetched_at=datetime.now(tz=timezone.utc).isoformat(),
-        article_count=len(fake_articles),
-        articles=fake_articles
-    )
+    config = request.source_config or await load_source_config(request.feed_id)
+    params, headers = request_template(config, request.api_params, request.feed_id)
+
+    # No cache to fill here, so the watermark can narrow the scan itself
+    cutoff = since_cutoff(window_cutoff(request.time_window_hours), request.since)
+    scanner = ItemScanner({**DEFAULT_FIELD_MAP, **config.fields}, cutoff, request.max_items)
+    fetcher = PageFetcher(headers, request.feed_id)
+
+    try:
+        pages_failed = await paginate(config, params, fetcher, scanner)
+    except HTTPException as e:
+        logger.error(json.dumps({
+            "severity": "ERROR",
+            "message": "API feed fetch failed",
+            "feed_id": request.feed_id,
+            "api_url": config.url,
+            "status_code": e.status_code,
+            "request_id": request.request_id
+        }))
+        raise
+    except Exception as e:
+        logger.error(json.dumps({
+            "severity": "ERROR",
+            "message": "Unexpected error fetching API feed",
+            "feed_id": request.feed_id,
+            "api_url": config.url,
+            "error": str(e),
+            "request_id": request.request_id
+        }))
+        raise api_error(500, "API_FETCH_FAILED", f"Unexpected error: {str(e)}", request.feed_id)
+
+    end_time = datetime.now(tz=timezone.utc)
+    latency_ms = int((end_time - start_time).total_seconds() * 1000)
 
     logger.info(json.dumps({
         "severity": "INFO",
         "message": "API feed fetched successfully",
         "mcp_tool": "fetch_api_feed",
         "feed_id": request.feed_id,
-        "article_count": response.article_count
+        "article_count": len(scanner.articles),
+        "pages_fetched": fetcher.pages,
+        "pages_failed": pages_failed,
+        "items_examined": scanner.examined,
+        "stopped_early": scanner.done,
+        "bytes_downloaded": fetcher.bytes_downloaded,
+        "bytes_transferred": fetcher.bytes_transferred,
+        "throttle_wait_ms": fetcher.throttle_wait_ms,
+        "latency_ms": latency_ms,
+        "request_id": request.request_id
     }))
 
-    return response
+    return {
+        "feed_id": request.feed_id,
+        "api_url": config.url,
+        "fetched_at": end_time.isoformat(),
+        "article_count": len(scanner.articles),
+        "articles": [article.to_dict() for article in scanner.articles],
+        "pages_fetched": fetcher.pages,
+        "pages_failed": pages_failed,
+        "items_examined": scanner.examined,
+        "stopped_early": scanner.done,
+        "bytes_downloaded": fetcher.bytes_downloaded,
+        "bytes_transferred": fetcher.bytes_transferred,
+        "throttle_wait_ms": fetcher.throttle_wait_ms,
+        "latency_ms": latency_ms,
+    }
@@ -6,16 +6,27 @@ Fetches and parses articles from RSS feeds.
 Phase 5: Real implementation with feedparser and HTTP fetching.
 """
 
+import asyncio
+import calendar
 import logging
 import json
-from datetime import datetime, timezone, timedelta
-from typing import List, Optional
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 import httpx
-import feedparser
-from dateutil import parser as date_parser
 from pydantic import BaseModel, Field
 
+from services.http_clients import get_client
+from services.bounded_download import FEED_MAX_BYTES, DownloadError, fetch_bounded
+from services.feed_cache import cache_get, cache_set
+from services.parse_executor import parse_feed
+from services.host_limiter import BatchLimits, get_host_limiter
+from services.encoding import FastJSONResponse, dumps
+from services.dates import parse_date
+from services.single_flight import LEADER, get_single_flight
+
 # TODO Phase 5: Import OpenTelemetry
 # from opentelemetry import trace
 # tracer = trace.get_tracer(__name__)
@@ -30,11 +41,12 @@ class FetchRSSFeedRequest(BaseModel):
     feed_url: str = Field(..., description="RSS feed URL to fetch")
     time_window_hours: Optional[int] = Field(24, description="Only return articles from last N hours", ge=1, le=720)
     max_items: Optional[int] = Field(50, description="Maximum number of articles to return", ge=1, le=500)
+    since: Optional[datetime] = Field(None, description="Only return articles published at or after this time (caller's watermark)")
     request_id: Optional[str] = Field(None, description="Optional request tracking ID")
 
 
 class Article(BaseModel):
-    """Individual article from RSS feed."""
+    """Individual article from RSS feed (response schema; built internally as ArticleRecord)."""
     title: str
     url: str
     published_at: str  # ISO 8601 timestamp
@@ -43,6 +55,8 @@ class Article(BaseModel):
     content_snippet: Optional[str] = None
     raw_content: Optional[str] = None
     categories: List[str] = Field(default_factory=list)
+    guid: Optional[str] = None  # Entry id/guid (falls back to the link)
+    date_missing: bool = Field(False, description="True if the entry had no usable date (published_at is the fetch time)")
 
 
 class FetchRSSFeedResponse(BaseModel):
@@ -52,6 +66,16 @@ class FetchRSSFeedResponse(BaseModel):
     fetched_at: str  # ISO 8601 timestamp
     article_count: int
     articles: List[Article]
+    from_cache: bool = Field(False, description="True if the feed answered 304 and cached articles were served")
+    bytes_downloaded: int = Field(0, description="Response body bytes downloaded (decoded)")
+    bytes_transferred: int = Field(0, description="Body bytes received on the wire (before gzip/deflate decoding)")
+    bytes_saved: int = Field(0, description="Body bytes not downloaded thanks to a 304")
+    parse_ms: int = Field(0, description="Time spent parsing and normalizing the feed")
+    parse_queue_ms: int = Field(0, description="Time the body waited for a parse worker")
+    throttle_wait_ms: int = Field(0, description="Time spent waiting on per-host rate limits")
+    parse_ms_saved: int = Field(0, description="Parse time avoided thanks to a 304")
+    latency_ms: int = Field(0, description="Total time spent serving this feed")
+    coalesced: bool = Field(False, description="True if the articles came from an identical concurrent or just-finished fetch")
 
 
 class ErrorDetail(BaseModel):
@@ -68,36 +92,120 @@ class ErrorResponse(BaseModel):
     details: Optional[ErrorDetail] = None
 
 
+class FetchRSSFeedsRequest(BaseModel):
+    """Request schema for fetch_rss_feeds (batch) tool."""
+    feeds: List[FetchRSSFeedRequest] = Field(..., description="Feeds to fetch, each with its own window and limit", min_length=1, max_length=500)
+    concurrency: Optional[int] = Field(16, description="Max feeds fetched at once", ge=1, le=64)
+    per_host_limit: Optional[int] = Field(2, description="Max feeds fetched at once from the same host", ge=1, le=16)
+    request_id: Optional[str] = Field(None, description="Optional request tracking ID")
+
+
+class FeedResult(BaseModel):
+    """Outcome of one feed in a batch: either a result or an error."""
+    feed_url: str
+    status: str  # "ok" | "error"
+    result: Optional[FetchRSSFeedResponse] = None
+    error: Optional[ErrorResponse] = None
+
+
+class FetchRSSFeedsResponse(BaseModel):
+    """Response schema for fetch_rss_feeds (batch) tool."""
+    fetched_at: str  # ISO 8601 timestamp
+    feed_count: int
+    succeeded: int
+    failed: int
+    article_count: int
+    latency_ms: int
+    results: List[FeedResult]  # Same order as request.feeds
+
+
+@dataclass(slots=True)
+class ArticleRecord:
+    """
+    Internal article representation used on the normalization hot path.
+
+    Same fields as Article, but a plain slotted dataclass: built without
+    validation (the values come from feedparser or our own cache) and turned
+    into a dict once, when the response is encoded.
+    """
+    title: str
+    url: str
+    published_at: str
+    summary: Optional[str] = None
+    author: Optional[str] = None
+    content_snippet: Optional[str] = None
+    raw_content: Optional[str] = None
+    categories: List[str] = field(default_factory=list)
+    guid: Optional[str] = None
+    # Epoch seconds of published_at (None if the entry had no date); not part of the response
+    published_ts: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "title": self.title,
+            "url": self.url,
+            "published_at": self.published_at,
+            "summary": self.summary,
+            "author": self.author,
+            "content_snippet": self.content_snippet,
+            "raw_content": self.raw_content,
+            "categories": self.categories,
+            "guid": self.guid,
+            "date_missing": self.published_ts is None,
+        }
+
+    def to_cache_dict(self) -> Dict[str, Any]:
+        """to_dict() plus published_ts, for the feed cache."""
+        record = self.to_dict()
+        del record["date_missing"]
+        record["published_ts"] = self.published_ts
+        return record
+
+
+# An ordered feed is cut off after this many consecutive entries older than the window
+STALE_RUN_TO_STOP = 3
+# ...but only once an in-window dated entry was seen, or this many dated entries
+# were examined (stale pinned posts can head an otherwise newest-first feed)
+STALE_STOP_MIN_DATED = 10
+
+
 # Helper functions
+def entry_timestamp(entry) -> Optional[float]:
+    """
+    Epoch seconds of an entry's publish date, or None if it has none.
+
+    Uses feedparser's already-parsed struct tuples (filled in by
+    services.dates' handler); parse_date's dateutil fallback is only tried
+    when feedparser couldn't parse the published string itself.
+    """
+    parsed = entry.get('published_parsed')
+    if parsed:
+        return float(calendar.timegm(parsed))
+
+    timestamp = parse_date(entry.get('published'))
+    if timestamp is not None:
+        return timestamp
+
+    parsed = entry.get('updated_parsed')
+    if parsed:
+        return float(calendar.timegm(parsed))
+    return None
+
+
+def format_timestamp(timestamp: Optional[float]) -> str:
+    """Epoch seconds -> ISO 8601 UTC string (now if the entry had no date)."""
+    if timestamp is None:
+        return datetime.now(tz=timezone.utc).isoformat()
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
 def normalize_published_date(entry) -> Optional[str]:
     """
     Extract and normalize published date from RSS entry.
 
-    Returns ISO 8601 timestamp or None if not available.
+    Returns ISO 8601 timestamp (falls back to now if the entry has no usable date).
     """
-    try:
-        # Try published_parsed first (time.struct_time)
-        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-            dt = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-            return dt.isoformat()
-
-        # Try published string
-        if hasattr(entry, 'published'):
-            dt = date_parser.parse(entry.published)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.isoformat()
-
-        # Try updated_parsed
-        if hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-            dt = datetime(*entry.updated_parsed[:6], tzinfo=timezone.utc)
-            return dt.isoformat()
-
-        # Fallback to now
-        return datetime.now(tz=timezone.utc).isoformat()
-    except Exception as e:
-        logger.warning(f"Date parsing failed: {e}")
-        return datetime.now(tz=timezone.utc).isoformat()
+    return format_timestamp(entry_timestamp(entry))
 
 
 def extract_categories(entry) -> List[str]:
@@ -113,14 +221,338 @@ def extract_categories(entry) -> List[str]:
     return list(set(categories))  # Deduplicate
 
 
-def is_within_time_window(published_at: str, time_window_hours: int) -> bool:
-    """Check if article is within the specified time window."""
+def window_cutoff(time_window_hours: Optional[int]) -> Optional[float]:
+    """Oldest publish time (epoch seconds) inside the window, computed once per request."""
+    if not time_window_hours:
+        return None
+    return datetime.now(tz=timezone.utc).timestamp() - time_window_hours * 3600
+
+
+def normalize_entry(entry, published_ts: Optional[float] = None) -> ArticleRecord:
+    """
+    Build a normalized ArticleRecord from a feedparser entry.
+
+    Args:
+        entry: feedparser entry
+        published_ts: entry_timestamp(entry) if the caller already has it
+    """
+    if published_ts is None:
+        published_ts = entry_timestamp(entry)
+
+    # Extract content snippet (prefer summary, fallback to description)
+    content_snippet = None
+    if hasattr(entry, 'summary'):
+        content_snippet = entry.summary[:500] if len(entry.summary) > 500 else entry.summary
+    elif hasattr(entry, 'description'):
+        content_snippet = entry.description[:500] if len(entry.description) > 500 else entry.description
+
+    return ArticleRecord(
+        title=entry.get('title', 'Untitled'),
+        url=entry.get('link', ''),
+        published_at=format_timestamp(published_ts),
+        summary=entry.get('summary'),
+        author=entry.get('author'),
+        content_snippet=content_snippet,
+        raw_content=entry.get('content', [{}])[0].get('value') if entry.get('content') else None,
+        categories=extract_categories(entry),
+        guid=entry.get('id') or entry.get('link'),
+        published_ts=published_ts
+    )
+
+
+def normalize_entries(entries: list, cutoff: Optional[float]) -> Tuple[List[ArticleRecord], int]:
+    """
+    Normalize the entries published at or after cutoff (undated entries are kept).
+
+    Stale entries are skipped before any normalization work. While the
+    dated entries seen so far are in reverse-chronological order, a run of
+    STALE_RUN_TO_STOP stale entries ends the scan: everything after them is
+    older still. The run only counts once an in-window dated entry was seen
+    (or STALE_STOP_MIN_DATED dated entries were examined), so stale pinned
+    posts at the top don't end the scan. A feed that turns out not to be
+    ordered is scanned in full.
+
+    Returns:
+        (articles in feed order, number of entries examined)
+    """
+    articles = []
+    previous_ts = None
+    ordered = True
+    stale_run = 0
+    examined = 0
+    dated = 0
+    seen_in_window = False
+
+    for entry in entries:
+        examined += 1
+        published_ts = entry_timestamp(entry)
+        if published_ts is not None:
+            dated += 1
+            if previous_ts is not None and published_ts > previous_ts:
+                ordered = False
+            previous_ts = published_ts
+
+            if cutoff is not None and published_ts < cutoff:
+                stale_run += 1
+                can_stop = seen_in_window or dated >= STALE_STOP_MIN_DATED
+                if ordered and can_stop and stale_run >= STALE_RUN_TO_STOP:
+                    break
+                continue
+            seen_in_window = True
+
+        stale_run = 0
+        articles.append(normalize_entry(entry, published_ts))
+
+    return articles, examined
+
+
+def select_articles(
+    articles: List[ArticleRecord], cutoff: Optional[float], max_items: Optional[int]
+) -> List[ArticleRecord]:
+    """Apply the request's window cutoff and max_items limit (feed order is kept)."""
+    selected = []
+    for article in articles:
+        # Filter by time window (undated articles are kept)
+        if cutoff is not None and article.published_ts is not None and article.published_ts < cutoff:
+            continue
+        selected.append(article)
+
+        # Respect max_items limit
+        if max_items and len(selected) >= max_items:
+            break
+    return selected
+
+
+def since_cutoff(cutoff: Optional[float], since: Optional[datetime]) -> Optional[float]:
+    """Narrow a window cutoff to the caller's watermark, if it is later."""
+    if since is None:
+        return cutoff
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return since.timestamp() if cutoff is None else max(cutoff, since.timestamp())
+
+
+def cache_covers(cached: Optional[dict], cutoff: Optional[float]) -> bool:
+    """
+    True if a cache entry holds every article the request's window needs.
+
+    The cache only stores the entries that were inside the window of the
+    request that filled it (complete_after; None = every entry).
+    """
+    if not cached or "complete_after" not in cached:
+        return False
+    complete_after = cached["complete_after"]
+    return complete_after is None or (cutoff is not None and cutoff >= complete_after)
+
+
+def conditional_headers(cached: Optional[dict]) -> dict:
+    """Build If-None-Match / If-Modified-Since headers from a cache entry."""
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
+
+
+def feed_response(feed_url: str, fetched_at: str, articles: List[ArticleRecord], **stats: Any) -> Dict[str, Any]:
+    """Build a FetchRSSFeedResponse-shaped dict (unset stats default to 0/False)."""
+    return {
+        "feed_id": "",  # No feed_id in Phase 5 spec
+        "feed_url": feed_url,
+        "fetched_at": fetched_at,
+        "article_count": len(articles),
+        "articles": [article.to_dict() for article in articles],
+        "from_cache": stats.get("from_cache", False),
+        "bytes_downloaded": stats.get("bytes_downloaded", 0),
+        "bytes_transferred": stats.get("bytes_transferred", 0),
+        "bytes_saved": stats.get("bytes_saved", 0),
+        "parse_ms": stats.get("parse_ms", 0),
+        "parse_queue_ms": stats.get("parse_queue_ms", 0),
+        "throttle_wait_ms": stats.get("throttle_wait_ms", 0),
+        "parse_ms_saved": stats.get("parse_ms_saved", 0),
+        "latency_ms": stats.get("latency_ms", 0),
+        "coalesced": stats.get("coalesced", False),
+    }
+
+
+def cutoff_covers(held: Optional[float], wanted: Optional[float]) -> bool:
+    """True if articles fetched for window cutoff `held` include everything cutoff `wanted` needs."""
+    return held is None or (wanted is not None and wanted >= held)
+
+
+async def fetch_feed_window(feed_url: str, cutoff: Optional[float]) -> Dict[str, Any]:
+    """
+    Download (conditionally), parse and normalize a feed's entries inside a window.
+
+    This is the upstream work fetch_rss_feed shares between identical
+    concurrent requests (see services.single_flight); it doesn't depend on
+    max_items or since, which are applied per request afterwards.
+
+    Returns:
+        {"articles": ArticleRecords in feed order (shared, don't mutate),
+         "entries_total", "entries_examined",
+         "stats": feed_response stats for the request that did the work}
+        Raises HTTPException on fetch failures.
+    """
+    # Conditional GET: send the validators we saw last time for this feed,
+    # provided the cached articles reach back far enough for this window
+    cached = await cache_get(feed_url)
+    if not cache_covers(cached, cutoff):
+        cached = None
+
+    # Fetch RSS feed via the shared pooled client, within the host's politeness limits
+    client = get_client()
+    host_limiter = get_host_limiter()
+    throttle_wait_ms = 0
     try:
-        article_time = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-        cutoff_time = datetime.now(tz=timezone.utc) - timedelta(hours=time_window_hours)
-        return article_time >= cutoff_time
-    except Exception:
-        return True  # Include if we can't parse date
+        async with host_limiter.slot(feed_url) as slot:
+            throttle_wait_ms = slot.wait_ms
+            # Streamed with a size cap: one huge or endless feed can't balloon memory
+            response = await fetch_bounded(
+                client,
+                feed_url,
+                max_bytes=FEED_MAX_BYTES,
+                headers=conditional_headers(cached),
+                timeout=30.0
+            )
+        host_limiter.note_response(feed_url, response.status_code, response.headers)
+        if response.status_code != 304:
+            response.raise_for_status()
+    except DownloadError as e:
+        logger.error(json.dumps({
+            "severity": "ERROR",
+            "message": "RSS feed body rejected",
+            "feed_url": feed_url,
+            "code": e.code,
+            "bytes_transferred": e.bytes_transferred,
+            "error": e.message
+        }))
+        raise HTTPException(
+            status_code=e.http_status,
+            detail={
+                "error": {
+                    "code": e.code,
+                    "message": e.message,
+                    "feed_url": feed_url,
+                    "details": {"http_status": e.http_status}
+                }
+            }
+        )
+    except httpx.TimeoutException:
+        logger.error(json.dumps({
+            "severity": "ERROR",
+            "message": "RSS feed fetch timeout",
+            "feed_url": feed_url,
+            "timeout_seconds": 30
+        }))
+        raise HTTPException(
+            status_code=504,
+            detail={
+                "error": {
+                    "code": "FEED_FETCH_FAILED",
+                    "message": "Feed fetch timeout after 30 seconds",
+                    "feed_url": feed_url,
+                    "details": {"timeout_seconds": 30}
+                }
+            }
+        )
+    except httpx.HTTPStatusError as e:
+        logger.error(json.dumps({
+            "severity": "ERROR",
+            "message": "RSS feed HTTP error",
+            "feed_url": feed_url,
+            "status_code": e.response.status_code
+        }))
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail={
+                "error": {
+                    "code": "FEED_FETCH_FAILED",
+                    "message": f"Feed returned HTTP {e.response.status_code}",
+                    "feed_url": feed_url,
+                    "details": {"http_status": e.response.status_code}
+                }
+            }
+        )
+
+    from_cache = response.status_code == 304 and cached is not None
+    bytes_transferred = response.bytes_transferred
+    bytes_downloaded = 0
+    parse_ms = 0
+    parse_queue_ms = 0
+    entries_total = 0
+    entries_examined = 0
+
+    if from_cache:
+        # Not modified: serve the articles normalized on the last full fetch
+        all_articles = [ArticleRecord(**a) for a in cached.get("articles", [])]
+    else:
+        bytes_downloaded = len(response.content)
+
+        # Parse RSS with feedparser (raw bytes, off the event loop for large bodies)
+        feed, parse_stats = await parse_feed(response.content, response.headers)
+        parse_queue_ms = parse_stats["queue_wait_ms"]
+        normalize_start = datetime.now(tz=timezone.utc)
+
+        if feed.bozo and not feed.entries:
+            # Feed is malformed and has no entries
+            logger.warning(json.dumps({
+                "severity": "WARNING",
+                "message": "Malformed RSS feed",
+                "feed_url": feed_url,
+                "bozo_exception": str(feed.bozo_exception) if hasattr(feed, 'bozo_exception') else None
+            }))
+            # Return empty list instead of failing
+            return {
+                "articles": [],
+                "entries_total": 0,
+                "entries_examined": 0,
+                "stats": {
+                    "from_cache": False,
+                    "bytes_downloaded": bytes_downloaded,
+                    "bytes_transferred": bytes_transferred,
+                    "parse_ms": parse_stats["parse_ms"],
+                    "parse_queue_ms": parse_queue_ms,
+                    "throttle_wait_ms": throttle_wait_ms
+                }
+            }
+
+        # Normalize only the entries inside the window (stops early on ordered feeds)
+        all_articles, entries_examined = normalize_entries(feed.entries, cutoff)
+        entries_total = len(feed.entries)
+        normalize_ms = int((datetime.now(tz=timezone.utc) - normalize_start).total_seconds() * 1000)
+        parse_ms = parse_stats["parse_ms"] + normalize_ms
+
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if etag or last_modified:
+            await cache_set(feed_url, {
+                "etag": etag,
+                "last_modified": last_modified,
+                "articles": [a.to_cache_dict() for a in all_articles],
+                "complete_after": cutoff,
+                "body_bytes": bytes_downloaded,
+                "parse_ms": parse_ms,
+                "stored_at": datetime.now(tz=timezone.utc).isoformat()
+            })
+
+    return {
+        "articles": all_articles,
+        "entries_total": entries_total,
+        "entries_examined": entries_examined,
+        "stats": {
+            "from_cache": from_cache,
+            "bytes_downloaded": bytes_downloaded,
+            "bytes_transferred": bytes_transferred,
+            "bytes_saved": cached.get("body_bytes", 0) if from_cache else 0,
+            "parse_ms": parse_ms,
+            "parse_queue_ms": parse_queue_ms,
+            "throttle_wait_ms": throttle_wait_ms,
+            "parse_ms_saved": cached.get("parse_ms", 0) if from_cache else 0
+        }
+    }
 
 
 # Tool Endpoint
@@ -131,6 +563,16 @@ async def fetch_rss_feed(request: FetchRSSFeedRequest):
 
     Phase 5: Real implementation with feedparser and HTTP fetching.
     """
+    return FastJSONResponse(await fetch_rss_feed_data(request), model=FetchRSSFeedResponse)
+
+
+async def fetch_rss_feed_data(request: FetchRSSFeedRequest) -> Dict[str, Any]:
+    """
+    fetch_rss_feed without the HTTP layer.
+
+    Returns:
+        FetchRSSFeedResponse-shaped dict (raises HTTPException on failure)
+    """
     start_time = datetime.now(tz=timezone.utc)
 
     # TODO Phase 5: Add OpenTelemetry span
@@ -149,112 +591,30 @@ async def fetch_rss_feed(request: FetchRSSFeedRequest):
     }))
 
     try:
-        # Fetch RSS feed via HTTP
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.get(request.feed_url, follow_redirects=True)
-                response.raise_for_status()
-            except httpx.TimeoutException:
-                logger.error(json.dumps({
-                    "severity": "ERROR",
-                    "message": "RSS feed fetch timeout",
-                    "feed_url": request.feed_url,
-                    "timeout_seconds": 30
-                }))
-                raise HTTPException(
-                    status_code=504,
-                    detail={
-                        "error": {
-                            "code": "FEED_FETCH_FAILED",
-                            "message": "Feed fetch timeout after 30 seconds",
-                            "feed_url": request.feed_url,
-                            "details": {"timeout_seconds": 30}
-                        }
-                    }
-                )
-            except httpx.HTTPStatusError as e:
-                logger.error(json.dumps({
-                    "severity": "ERROR",
-                    "message": "RSS feed HTTP error",
-                    "feed_url": request.feed_url,
-                    "status_code": e.response.status_code
-                }))
-                raise HTTPException(
-                    status_code=e.response.status_code,
-                    detail={
-                        "error": {
-                            "code": "FEED_FETCH_FAILED",
-                            "message": f"Feed returned HTTP {e.response.status_code}",
-                            "feed_url": request.feed_url,
-                            "details": {"http_status": e.response.status_code}
-                        }
-                    }
-                )
-
-        # Parse RSS with feedparser
-        feed_content = response.text
-        feed = feedparser.parse(feed_content)
-
-        if feed.bozo and not feed.entries:
-            # Feed is malformed and has no entries
-            logger.warning(json.dumps({
-                "severity": "WARNING",
-                "message": "Malformed RSS feed",
-                "feed_url": request.feed_url,
-                "bozo_exception": str(feed.bozo_exception) if hasattr(feed, 'bozo_exception') else None
-            }))
-            # Return empty list instead of failing
-            return FetchRSSFeedResponse(
-                feed_id="",  # No feed_id in Phase 5 spec
-                feed_url=request.feed_url,
-                fetched_at=datetime.now(tz=timezone.utc).isoformat(),
-                article_count=0,
-                articles=[]
-            )
-
-        # Normalize articles
-        articles = []
-        for entry in feed.entries:
-            published_at = normalize_published_date(entry)
-
-            # Filter by time window
-            if request.time_window_hours and not is_within_time_window(published_at, request.time_window_hours):
-                continue
-
-            # Extract content snippet (prefer summary, fallback to description)
-            content_snippet = None
-            if hasattr(entry, 'summary'):
-                content_snippet = entry.summary[:500] if len(entry.summary) > 500 else entry.summary
-            elif hasattr(entry, 'description'):
-                content_snippet = entry.description[:500] if len(entry.description) > 500 else entry.description
-
-            # Build normalized article
-            article = Article(
-                title=entry.get('title', 'Untitled'),
-                url=entry.get('link', ''),
-                published_at=published_at,
-                summary=entry.get('summary'),
-                author=entry.get('author'),
-                content_snippet=content_snippet,
-                raw_content=entry.get('content', [{}])[0].get('value') if entry.get('content') else None,
-                categories=extract_categories(entry)
-            )
-            articles.append(article)
+        # Identical concurrent requests (same feed, window covered) share one fetch and parse
+        cutoff = window_cutoff(request.time_window_hours)
+        upstream, served_by = await get_single_flight("rss", covers=cutoff_covers).run(
+            request.feed_url, cutoff, lambda: fetch_feed_window(request.feed_url, cutoff)
+        )
+        coalesced = served_by != LEADER
+        all_articles = upstream["articles"]
+        # Work done by another request isn't reported again
+        stats = {"from_cache": upstream["stats"]["from_cache"]} if coalesced else upstream["stats"]
 
-            # Respect max_items limit
-            if request.max_items and len(articles) >= request.max_items:
-                break
+        # The cache keeps the whole window; the watermark only narrows what is returned
+        articles = select_articles(all_articles, since_cutoff(cutoff, request.since), request.max_items)
 
         # Build response
         end_time = datetime.now(tz=timezone.utc)
         latency_ms = int((end_time - start_time).total_seconds() * 1000)
 
-        result = FetchRSSFeedResponse(
-            feed_id="",  # No feed_id in Phase 5 spec
-            feed_url=request.feed_url,
-            fetched_at=end_time.isoformat(),
-            article_count=len(articles),
-            articles=articles
+        result = feed_response(
+            request.feed_url,
+            end_time.isoformat(),
+            articles,
+            latency_ms=latency_ms,
+            coalesced=coalesced,
+            **stats
         )
 
         logger.info(json.dumps({
@@ -262,13 +622,21 @@ async def fetch_rss_feed(request: FetchRSSFeedRequest):
             "message": "RSS feed fetched successfully",
             "mcp_tool": "fetch_rss_feed",
             "feed_url": request.feed_url,
-            "article_count": result.article_count,
+            "article_count": result["article_count"],
+            "from_cache": result["from_cache"],
+            "coalesced": served_by,
+            "bytes_downloaded": result["bytes_downloaded"],
+            "entries_total": upstream["entries_total"],
+            "entries_examined": upstream["entries_examined"],
+            "parse_ms": result["parse_ms"],
+            "parse_queue_ms": result["parse_queue_ms"],
+            "throttle_wait_ms": result["throttle_wait_ms"],
             "latency_ms": latency_ms,
             "request_id": request.request_id
         }))
 
         # TODO Phase 5: Set OpenTelemetry attributes
-        # span.set_attribute("articles.count", result.article_count)
+        # span.set_attribute("articles.count", result["article_count"])
         # span.set_attribute("latency_ms", latency_ms)
 
         return result
@@ -295,3 +663,205 @@ async def fetch_rss_feed(request: FetchRSSFeedRequest):
                 }
             }
         )
+
+
+def error_from_exception(exc: Exception) -> ErrorResponse:
+    """Convert a fetch_rss_feed failure into a per-feed ErrorResponse."""
+    if isinstance(exc, HTTPException) and isinstance(exc.detail, dict):
+        error = exc.detail.get("error", {})
+        details = dict(error.get("details") or {})
+        details.setdefault("http_status", exc.status_code)
+        return ErrorResponse(
+            code=error.get("code", "FEED_FETCH_FAILED"),
+            message=error.get("message", "Feed fetch failed"),
+            details=ErrorDetail(**details)
+        )
+    return ErrorResponse(
+        code="FEED_FETCH_FAILED",
+        message=f"Unexpected error: {str(exc)}",
+        details=ErrorDetail(http_status=500)
+    )
+
+
+async def fetch_feed_result(spec: FetchRSSFeedRequest, limits: BatchLimits) -> Dict[str, Any]:
+    """Run fetch_rss_feed for one batch entry, capturing failures as a FeedResult-shaped dict."""
+    # Take the host slot first so a feed waiting on a busy host doesn't hold a global slot
+    async with limits.for_host(spec.feed_url), limits.global_limit:
+        try:
+            result = await fetch_rss_feed_data(spec)
+            return {"feed_url": spec.feed_url, "status": "ok", "result": result, "error": None}
+        except Exception as e:
+            return {
+                "feed_url": spec.feed_url,
+                "status": "error",
+                "result": None,
+                "error": error_from_exception(e).model_dump()
+            }
+
+
+@router.post("/fetch_rss_feeds", response_model=FetchRSSFeedsResponse)
+async def fetch_rss_feeds(request: FetchRSSFeedsRequest):
+    """
+    Fetch many RSS feeds concurrently in one tool call.
+
+    Each feed goes through the same path as fetch_rss_feed (conditional GET,
+    parsing, normalization). A failing feed is reported in its own result
+    entry instead of failing the whole batch. Results keep request order.
+    """
+    return FastJSONResponse(await fetch_rss_feeds_data(request), model=FetchRSSFeedsResponse)
+
+
+async def fetch_rss_feeds_data(request: FetchRSSFeedsRequest) -> Dict[str, Any]:
+    """fetch_rss_feeds without the HTTP layer; returns a FetchRSSFeedsResponse-shaped dict."""
+    start_time = datetime.now(tz=timezone.utc)
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "message": "Fetching RSS feed batch",
+        "mcp_tool": "fetch_rss_feeds",
+        "feed_count": len(request.feeds),
+        "concurrency": request.concurrency,
+        "request_id": request.request_id
+    }))
+
+    limits = BatchLimits(request.concurrency or 16, request.per_host_limit or 2)
+    results = await asyncio.gather(*(fetch_feed_result(spec, limits) for spec in request.feeds))
+
+    end_time = datetime.now(tz=timezone.utc)
+    latency_ms = int((end_time - start_time).total_seconds() * 1000)
+    succeeded = sum(1 for r in results if r["status"] == "ok")
+
+    response = {
+        "fetched_at": end_time.isoformat(),
+        "feed_count": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "article_count": sum(r["result"]["article_count"] for r in results if r["result"]),
+        "latency_ms": latency_ms,
+        "results": results
+    }
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "message": "RSS feed batch fetched",
+        "mcp_tool": "fetch_rss_feeds",
+        "feed_count": response["feed_count"],
+        "succeeded": succeeded,
+        "failed": response["failed"],
+        "article_count": response["article_count"],
+        "latency_ms": latency_ms,
+        "request_id": request.request_id
+    }))
+
+    return response
+
+
+async def iter_feed_events(request: FetchRSSFeedsRequest) -> AsyncIterator[dict]:
+    """
+    Yield event dicts for a batch as each feed finishes.
+
+    Event types:
+    - {"type": "article", "index", "feed_url", "article"}: one per article
+    - {"type": "feed", "index", "feed_url", "article_count", "from_cache", "latency_ms", ...}:
+      after a feed's articles
+    - {"type": "error", "index", "feed_url", "error"}: a feed that failed
+    - {"type": "done", "feed_count", "succeeded", "failed", "article_count", "latency_ms"}: last line
+
+    "index" is the feed's position in request.feeds.
+    """
+    start_time = datetime.now(tz=timezone.utc)
+    limits = BatchLimits(request.concurrency or 16, request.per_host_limit or 2)
+
+    async def indexed(index: int, spec: FetchRSSFeedRequest) -> Tuple[int, Dict[str, Any]]:
+        return index, await fetch_feed_result(spec, limits)
+
+    tasks = [asyncio.create_task(indexed(i, spec)) for i, spec in enumerate(request.feeds)]
+    succeeded = 0
+    article_count = 0
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            index, feed_result = await next_done
+
+            if feed_result["status"] != "ok":
+                yield {
+                    "type": "error",
+                    "index": index,
+                    "feed_url": feed_result["feed_url"],
+                    "error": feed_result["error"]
+                }
+                continue
+
+            result = feed_result["result"]
+            for article in result["articles"]:
+                yield {
+                    "type": "article",
+                    "index": index,
+                    "feed_url": result["feed_url"],
+                    "article": article
+                }
+
+            summary = {key: value for key, value in result.items() if key != "articles"}
+            summary.update({"type": "feed", "index": index})
+            yield summary
+
+            succeeded += 1
+            article_count += result["article_count"]
+    finally:
+        # Client went away mid-stream: don't keep fetching feeds nobody will read
+        for task in tasks:
+            task.cancel()
+
+    latency_ms = int((datetime.now(tz=timezone.utc) - start_time).total_seconds() * 1000)
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "message": "RSS feed stream completed",
+        "mcp_tool": "fetch_rss_feeds_stream",
+        "feed_count": len(tasks),
+        "succeeded": succeeded,
+        "failed": len(tasks) - succeeded,
+        "article_count": article_count,
+        "latency_ms": latency_ms,
+        "request_id": request.request_id
+    }))
+
+    yield {
+        "type": "done",
+        "feed_count": len(tasks),
+        "succeeded": succeeded,
+        "failed": len(tasks) - succeeded,
+        "article_count": article_count,
+        "latency_ms": latency_ms
+    }
+
+
+async def stream_feed_events(request: FetchRSSFeedsRequest) -> AsyncIterator[bytes]:
+    """Encode iter_feed_events as NDJSON lines."""
+    events = iter_feed_events(request)
+    try:
+        async for event in events:
+            yield dumps(event) + b"\n"
+    finally:
+        await events.aclose()
+
+
+@router.post("/fetch_rss_feeds/stream")
+async def fetch_rss_feeds_stream(request: FetchRSSFeedsRequest):
+    """
+    Streaming variant of fetch_rss_feeds.
+
+    Returns application/x-ndjson with one article per line, sent as soon as
+    each feed is parsed, so callers can start work before the slowest feed
+    returns. See iter_feed_events for the line format.
+    """
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "message": "Streaming RSS feed batch",
+        "mcp_tool": "fetch_rss_feeds_stream",
+        "feed_count": len(request.feeds),
+        "concurrency": request.concurrency,
+        "request_id": request.request_id
+    }))
+
+    return StreamingResponse(stream_feed_events(request), media_type="application/x-ndjson")
@@ -3,20 +3,38 @@ Webpage Scraping Tool Router
 
 Fetches and extracts content from individual web pages.
 
-Phase 4: Returns fake but structurally correct responses.
-Phase 5: Wire up real BeautifulSoup/Playwright scraping.
+Phase 5: Real fetching (shared pooled client, per-host politeness limits)
+and lxml extraction of main content and metadata on the parse executor.
+Extractions are cached per URL + ETag (services.page_cache).
 """
 
+import asyncio
 import logging
 import json
+import os
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
+import httpx
 from pydantic import BaseModel, Field, HttpUrl
 
+from services.http_clients import get_client
+from services.bounded_download import DownloadError, fetch_bounded
+from services.host_limiter import BatchLimits, get_host_limiter
+from services.parse_executor import offload
+from services.page_cache import page_cache_get, page_cache_set
+from services.html_extract import extract_page
+from services.encoding import FastJSONResponse
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Pages larger than this are rejected rather than parsed
+PAGE_MAX_BYTES = int(os.getenv("PAGE_MAX_BYTES", str(5 * 1024 * 1024)))
+PAGE_FETCH_TIMEOUT_SECONDS = float(os.getenv("PAGE_FETCH_TIMEOUT_SECONDS", "20"))
+
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
 
 # Pydantic Models
 class FetchWebpageRequest(BaseModel):
@@ -24,6 +42,7 @@ class FetchWebpageRequest(BaseModel):
     url: HttpUrl = Field(..., description="URL to scrape")
     extract_content: bool = Field(True, description="Extract main article content")
     extract_metadata: bool = Field(True, description="Extract meta tags and Open Graph data")
+    request_id: Optional[str] = Field(None, description="Optional request tracking ID")
 
 
 class WebpageMetadata(BaseModel):
@@ -44,6 +63,72 @@ class FetchWebpageResponse(BaseModel):
     content: Optional[str] = None
     metadata: Optional[WebpageMetadata] = None
     word_count: int
+    from_cache: bool = Field(False, description="True if the extraction was reused for an unchanged page (same ETag or 304)")
+    bytes_downloaded: int = Field(0, description="Response body bytes downloaded")
+    bytes_transferred: int = Field(0, description="Body bytes received on the wire (before decompression)")
+    extract_ms: int = Field(0, description="Time spent parsing and extracting the page")
+    extract_queue_ms: int = Field(0, description="Time the page waited for a parse worker")
+    throttle_wait_ms: int = Field(0, description="Time spent waiting on per-host rate limits")
+    latency_ms: int = Field(0, description="Total time spent serving this page")
+
+
+class FetchWebpagesRequest(BaseModel):
+    """Request schema for fetch_webpages (batch) tool."""
+    pages: List[FetchWebpageRequest] = Field(..., description="Pages to fetch and extract", min_length=1, max_length=200)
+    concurrency: Optional[int] = Field(16, description="Max pages fetched at once", ge=1, le=64)
+    per_host_limit: Optional[int] = Field(2, description="Max pages fetched at once from the same host", ge=1, le=16)
+    request_id: Optional[str] = Field(None, description="Optional request tracking ID")
+
+
+class PageError(BaseModel):
+    """Error for one page in a batch."""
+    code: str
+    message: str
+    http_status: Optional[int] = None
+
+
+class PageResult(BaseModel):
+    """Outcome of one page in a batch: either a result or an error."""
+    url: str
+    status: str  # "ok" | "error"
+    result: Optional[FetchWebpageResponse] = None
+    error: Optional[PageError] = None
+
+
+class FetchWebpagesResponse(BaseModel):
+    """Response schema for fetch_webpages (batch) tool."""
+    fetched_at: str
+    page_count: int
+    succeeded: int
+    failed: int
+    latency_ms: int
+    results: List[PageResult]  # Same order as request.pages
+
+
+def page_error(status_code: int, code: str, message: str, url: str) -> HTTPException:
+    """HTTPException in the tool error format."""
+    return HTTPException(
+        status_code=status_code,
+        detail={
+            "error": {
+                "code": code,
+                "message": message,
+                "url": url,
+                "details": {"http_status": status_code}
+            }
+        }
+    )
+
+
+def validator_headers(cached: Optional[dict]) -> dict:
+    """Build If-None-Match / If-Modified-Since headers from a cache entry."""
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
 
 
 # Tool Endpoint
@@ -52,44 +137,227 @@ async def fetch_webpage(request: FetchWebpageRequest):
     """
     Scrape article content from a webpage.
 
-    Phase 4: Returns fake data.
-    Phase 5 TODO:
-    - Use httpx to fetch webpage
-    - Parse HTML with BeautifulSoup4
-    - Extract main content (remove nav, ads, etc.)
-    - Parse meta tags and Open Graph data
-    - Handle JavaScript-heavy sites with Playwright (optional)
+    Fetches the page (conditional GET when we have its validators), then
+    extracts the title, main content and meta / Open Graph data with lxml
+    off the event loop. JavaScript-rendered pages are returned as served.
+    """
+    return FastJSONResponse(await fetch_webpage_data(request), model=FetchWebpageResponse)
+
+
+async def fetch_webpage_data(request: FetchWebpageRequest) -> Dict[str, Any]:
     """
+    fetch_webpage without the HTTP layer.
+
+    Returns:
+        FetchWebpageResponse-shaped dict (raises HTTPException on failure)
+    """
+    url = str(request.url)
+    start_time = datetime.now(tz=timezone.utc)
+    options = [request.extract_content, request.extract_metadata]
+
     logger.info(json.dumps({
         "severity": "INFO",
         "message": "Fetching webpage",
         "mcp_tool": "fetch_webpage",
-        "url": str(request.url)
+        "url": url,
+        "request_id": request.request_id
     }))
 
-    # PHASE 4: Fake response
-    response = FetchWebpageResponse(
-        url=str(request.url),
-        fetched_at=datetime.now(tz=timezone.utc).isoformat(),
-        status_code=200,
-        title="Example Article Title",
-        content="This is the extracted main content of the article. " * 20,
-        metadata=WebpageMetadata(
-            description="Meta description from page",
-            keywords=["AI", "Technology"],
-            author="Jane Smith",
-            published_at=datetime.now(tz=timezone.utc).isoformat(),
-            og_image="https://example.com/image.jpg"
-        ),
-        word_count=250
+    cached = await page_cache_get(url)
+    if cached and cached.get("extract_options") != options:
+        cached = None
+
+    client = get_client()
+    host_limiter = get_host_limiter()
+    try:
+        async with host_limiter.slot(url) as slot:
+            throttle_wait_ms = slot.wait_ms
+            response = await fetch_bounded(
+                client, url,
+                max_bytes=PAGE_MAX_BYTES,
+                headers=validator_headers(cached),
+                timeout=PAGE_FETCH_TIMEOUT_SECONDS
+            )
+        host_limiter.note_response(url, response.status_code, response.headers)
+        if response.status_code != 304:
+            response.raise_for_status()
+    except DownloadError as e:
+        logger.error(json.dumps({
+            "severity": "ERROR",
+            "message": "Webpage body rejected",
+            "url": url,
+            "code": e.code,
+            "bytes_transferred": e.bytes_transferred
+        }))
+        raise page_error(e.http_status, "PAGE_TOO_LARGE" if e.http_status == 413 else e.code, e.message, url)
+    except httpx.TimeoutException:
+        logger.error(json.dumps({
+            "severity": "ERROR",
+            "message": "Webpage fetch timeout",
+            "url": url,
+            "timeout_seconds": PAGE_FETCH_TIMEOUT_SECONDS
+        }))
+        raise page_error(504, "PAGE_FETCH_FAILED", f"Page fetch timeout after {PAGE_FETCH_TIMEOUT_SECONDS:g} seconds", url)
+    except httpx.HTTPStatusError as e:
+        logger.error(json.dumps({
+            "severity": "ERROR",
+            "message": "Webpage HTTP error",
+            "url": url,
+            "status_code": e.response.status_code
+        }))
+        raise page_error(e.response.status_code, "PAGE_FETCH_FAILED", f"Page returned HTTP {e.response.status_code}", url)
+    except httpx.HTTPError as e:
+        raise page_error(502, "PAGE_FETCH_FAILED", f"Page fetch failed: {str(e) or type(e).__name__}", url)
+
+    etag = response.headers.get("etag")
+    unchanged = cached is not None and (
+        response.status_code == 304 or (etag is not None and etag == cached.get("etag"))
     )
 
+    bytes_downloaded = 0 if response.status_code == 304 else len(response.content)
+    bytes_transferred = response.bytes_transferred
+    extract_ms = 0
+    extract_queue_ms = 0
+
+    if unchanged:
+        extraction = cached["extraction"]
+    else:
+        content_type = response.headers.get("content-type", "")
+        if content_type and content_type.split(";")[0].strip().lower() not in HTML_CONTENT_TYPES:
+            raise page_error(415, "UNSUPPORTED_CONTENT_TYPE", f"Not an HTML page ({content_type})", url)
+
+        extraction, stats = await offload(
+            extract_page, response.content, content_type or None,
+            request.extract_content, request.extract_metadata,
+            size=bytes_downloaded
+        )
+        extract_ms = stats["run_ms"]
+        extract_queue_ms = stats["queue_wait_ms"]
+
+        last_modified = response.headers.get("last-modified")
+        if etag or last_modified:
+            await page_cache_set(url, {
+                "etag": etag,
+                "last_modified": last_modified,
+                "extraction": extraction,
+                "extract_options": options,
+                "body_bytes": bytes_downloaded,
+                "extract_ms": extract_ms,
+                "stored_at": datetime.now(tz=timezone.utc).isoformat()
+            })
+
+    end_time = datetime.now(tz=timezone.utc)
+    latency_ms = int((end_time - start_time).total_seconds() * 1000)
+
+    result = {
+        "url": url,
+        "fetched_at": end_time.isoformat(),
+        "status_code": response.status_code,
+        "title": extraction.get("title"),
+        "content": extraction.get("content"),
+        "metadata": extraction.get("metadata"),
+        "word_count": extraction.get("word_count", 0),
+        "from_cache": unchanged,
+        "bytes_downloaded": bytes_downloaded,
+        "bytes_transferred": bytes_transferred,
+        "extract_ms": extract_ms,
+        "extract_queue_ms": extract_queue_ms,
+        "throttle_wait_ms": throttle_wait_ms,
+        "latency_ms": latency_ms,
+    }
+
     logger.info(json.dumps({
         "severity": "INFO",
         "message": "Webpage fetched successfully",
         "mcp_tool": "fetch_webpage",
-        "url": str(request.url),
-        "word_count": response.word_count
+        "url": url,
+        "word_count": result["word_count"],
+        "from_cache": unchanged,
+        "bytes_downloaded": bytes_downloaded,
+        "bytes_transferred": bytes_transferred,
+        "extract_ms": extract_ms,
+        "extract_queue_ms": extract_queue_ms,
+        "throttle_wait_ms": throttle_wait_ms,
+        "latency_ms": latency_ms,
+        "request_id": request.request_id
+    }))
+
+    return result
+
+
+def page_error_from_exception(exc: Exception) -> Dict[str, Any]:
+    """Convert a fetch_webpage failure into a per-page PageError dict."""
+    if isinstance(exc, HTTPException) and isinstance(exc.detail, dict):
+        error = exc.detail.get("error", {})
+        return {
+            "code": error.get("code", "PAGE_FETCH_FAILED"),
+            "message": error.get("message", "Page fetch failed"),
+            "http_status": exc.status_code,
+        }
+    return {"code": "PAGE_FETCH_FAILED", "message": f"Unexpected error: {str(exc)}", "http_status": 500}
+
+
+async def fetch_page_result(spec: FetchWebpageRequest, limits: BatchLimits) -> Dict[str, Any]:
+    """Run fetch_webpage for one batch entry, capturing failures as a PageResult-shaped dict."""
+    url = str(spec.url)
+    # Take the host slot first so a page waiting on a busy host doesn't hold a global slot
+    async with limits.for_host(url), limits.global_limit:
+        try:
+            return {"url": url, "status": "ok", "result": await fetch_webpage_data(spec), "error": None}
+        except Exception as e:
+            return {"url": url, "status": "error", "result": None, "error": page_error_from_exception(e)}
+
+
+@router.post("/fetch_webpages", response_model=FetchWebpagesResponse)
+async def fetch_webpages(request: FetchWebpagesRequest):
+    """
+    Fetch and extract many pages concurrently in one tool call.
+
+    Downloads overlap under the batch's global and per-host limits (plus
+    the service-wide host politeness limits); extraction of large pages runs
+    in parallel on the parse executor. A failing page is reported in its own
+    result entry. Results keep request order.
+    """
+    return FastJSONResponse(await fetch_webpages_data(request), model=FetchWebpagesResponse)
+
+
+async def fetch_webpages_data(request: FetchWebpagesRequest) -> Dict[str, Any]:
+    """fetch_webpages without the HTTP layer; returns a FetchWebpagesResponse-shaped dict."""
+    start_time = datetime.now(tz=timezone.utc)
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "message": "Fetching webpage batch",
+        "mcp_tool": "fetch_webpages",
+        "page_count": len(request.pages),
+        "concurrency": request.concurrency,
+        "request_id": request.request_id
+    }))
+
+    limits = BatchLimits(request.concurrency or 16, request.per_host_limit or 2)
+    results = await asyncio.gather(*(fetch_page_result(spec, limits) for spec in request.pages))
+
+    end_time = datetime.now(tz=timezone.utc)
+    latency_ms = int((end_time - start_time).total_seconds() * 1000)
+    succeeded = sum(1 for r in results if r["status"] == "ok")
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "message": "Webpage batch fetched",
+        "mcp_tool": "fetch_webpages",
+        "page_count": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "from_cache": sum(1 for r in results if r["result"] and r["result"]["from_cache"]),
+        "latency_ms": latency_ms,
+        "request_id": request.request_id
     }))
 
-    return response
+    return {
+        "fetched_at": end_time.isoformat(),
+        "page_count": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "latency_ms": latency_ms,
+        "results": results
+    }
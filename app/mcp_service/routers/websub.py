@@ -0,0 +1,735 @@
+"""
+WebSub Subscriber Router
+
+Push ingestion for feeds that advertise a WebSub hub, so they don't have to
+be polled.
+
+Tools (under /mcp/tools):
+- websub_subscribe: find the feed's hub (HTTP Link headers, then
+  <atom:link rel="hub"> in the feed) and send it a subscription request
+- websub_unsubscribe: ask the hub to stop pushing a feed
+- websub_sync: bring the subscriptions of a list of feeds up to date
+  (subscribe new feeds, renew leases about to expire, retry failures and
+  unverified requests, re-check feeds without a hub now and then) and
+  report which feeds are currently pushed, so the harvester can skip them
+- websub_pending / websub_ack: pushed articles queued for the next pipeline
+  pass; acked once the run that consumed them succeeded, so a failed run
+  sees them again
+
+Hub callback (under /websub; the URL is WEBSUB_CALLBACK_BASE_URL + path):
+- GET  /websub/callback/{callback_id}: intent verification
+- POST /websub/callback/{callback_id}: content distribution. Only accepted
+  for pending/active subscriptions; the body is size-capped, checked
+  against X-Hub-Signature (HMAC with the subscription's secret; unsigned
+  bodies are dropped), parsed and normalized exactly like fetch_rss_feed,
+  and queued in the WebSub store.
+
+The callback_id is "{subscription_id}.{callback_token}": subscription_id
+is derived from the feed URL, so a random per-subscription token is added
+to keep the callback URL unguessable.
+
+Subscription states: pending (request sent, not verified yet), active,
+unsubscribing, unsubscribed, denied, failed (hub request failed), no_hub.
+A feed counts as pushed only while it is active and its lease hasn't run
+out; when a renewal is missed the harvester simply polls it again.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import os
+import secrets
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import PlainTextResponse
+import httpx
+from pydantic import BaseModel, Field
+
+from routers.rss import Article, normalize_entries
+from services.http_clients import get_client
+from services.bounded_download import FEED_MAX_BYTES, fetch_bounded
+from services.host_limiter import get_host_limiter
+from services.parse_executor import parse_feed
+from services.encoding import FastJSONResponse
+from services.websub_store import get_websub_store, subscription_id
+
+logger = logging.getLogger(__name__)
+router = APIRouter()           # MCP tools
+callback_router = APIRouter()  # called by hubs
+
+# Public base URL of this service, as hubs reach it (e.g. the Cloud Run URL)
+WEBSUB_CALLBACK_BASE_URL = os.getenv("WEBSUB_CALLBACK_BASE_URL", "").rstrip("/")
+WEBSUB_LEASE_SECONDS = int(os.getenv("WEBSUB_LEASE_SECONDS", str(10 * 86400)))
+# Renew a lease once less than this is left (more than the time between pipeline runs)
+WEBSUB_RENEW_BEFORE_SECONDS = int(os.getenv("WEBSUB_RENEW_BEFORE_SECONDS", str(2 * 86400)))
+# Re-send a request the hub never verified after this long
+WEBSUB_PENDING_TIMEOUT_SECONDS = int(os.getenv("WEBSUB_PENDING_TIMEOUT_SECONDS", "3600"))
+# Retry failed or denied subscriptions after this long
+WEBSUB_RETRY_SECONDS = int(os.getenv("WEBSUB_RETRY_SECONDS", str(6 * 3600)))
+# Look for a hub again on feeds that had none after this long
+WEBSUB_HUB_RECHECK_SECONDS = int(os.getenv("WEBSUB_HUB_RECHECK_SECONDS", str(7 * 86400)))
+WEBSUB_SYNC_CONCURRENCY = int(os.getenv("WEBSUB_SYNC_CONCURRENCY", "8"))
+
+HUB_TIMEOUT_SECONDS = 30.0
+
+_SIGNATURE_METHODS = {
+    "sha1": hashlib.sha1,
+    "sha256": hashlib.sha256,
+    "sha384": hashlib.sha384,
+    "sha512": hashlib.sha512,
+}
+
+# Fields of a subscription record returned by the tools (everything but the secret)
+_PUBLIC_FIELDS = (
+    "subscription_id", "feed_url", "topic", "hub_url", "source_id", "category", "state",
+    "lease_seconds", "lease_expires_at", "requested_at", "verified_at", "hub_checked_at",
+    "last_push_at", "push_count", "error",
+)
+
+
+# Pydantic Models
+class WebSubSubscribeRequest(BaseModel):
+    """Request schema for websub_subscribe tool."""
+    feed_url: str = Field(..., description="Feed URL (as harvested)")
+    source_id: Optional[str] = Field(None, description="Source the pushed articles belong to")
+    category: Optional[str] = Field(None, description="Source category")
+    hub_url: Optional[str] = Field(None, description="Hub to use (skips discovery)")
+    topic_url: Optional[str] = Field(None, description="Topic URL the hub knows the feed by (defaults to its rel=self link)")
+    lease_seconds: Optional[int] = Field(None, description="Lease to ask for", ge=3600, le=30 * 86400)
+    request_id: Optional[str] = Field(None, description="Optional request tracking ID")
+
+
+class WebSubUnsubscribeRequest(BaseModel):
+    """Request schema for websub_unsubscribe tool."""
+    feed_url: str = Field(..., description="Feed URL the subscription was made for")
+    request_id: Optional[str] = Field(None, description="Optional request tracking ID")
+
+
+class WebSubSubscription(BaseModel):
+    """A subscription record (response schema)."""
+    subscription_id: str
+    feed_url: str
+    topic: Optional[str] = None
+    hub_url: Optional[str] = None
+    source_id: Optional[str] = None
+    category: Optional[str] = None
+    state: str
+    lease_seconds: Optional[int] = None
+    lease_expires_at: Optional[str] = None  # ISO 8601 timestamp
+    requested_at: Optional[str] = None
+    verified_at: Optional[str] = None
+    hub_checked_at: Optional[str] = None
+    last_push_at: Optional[str] = None
+    push_count: int = 0
+    error: Optional[str] = None
+
+
+class WebSubFeed(BaseModel):
+    """One feed in a websub_sync request."""
+    feed_url: str
+    source_id: Optional[str] = None
+    category: Optional[str] = None
+
+
+class WebSubSyncRequest(BaseModel):
+    """Request schema for websub_sync tool."""
+    feeds: List[WebSubFeed] = Field(..., description="Feeds that should be pushed when their hub allows", max_length=5000)
+    renew_before_seconds: Optional[int] = Field(None, description="Renew leases with less than this left (defaults to WEBSUB_RENEW_BEFORE_SECONDS)", ge=0)
+    request_id: Optional[str] = Field(None, description="Optional request tracking ID")
+
+
+class WebSubSyncResponse(BaseModel):
+    """Response schema for websub_sync tool."""
+    synced_at: str  # ISO 8601 timestamp
+    feed_count: int
+    active_feeds: List[str] = Field(..., description="Feeds currently pushed (active, unexpired lease)")
+    subscribed: int = Field(0, description="Subscription requests sent for new or retried feeds")
+    renewed: int = Field(0, description="Leases renewed")
+    pending: int = Field(0, description="Feeds waiting for the hub to verify")
+    no_hub: int = Field(0, description="Feeds that advertise no hub")
+    failed: int = Field(0, description="Feeds whose hub request or discovery failed")
+    latency_ms: int = 0
+    subscriptions: List[WebSubSubscription]
+
+
+class WebSubPendingRequest(BaseModel):
+    """Request schema for websub_pending tool."""
+    max_batches: Optional[int] = Field(200, description="Maximum pushes to return (oldest first)", ge=1, le=1000)
+    request_id: Optional[str] = Field(None, description="Optional request tracking ID")
+
+
+class PushBatch(BaseModel):
+    """Articles from one content distribution request."""
+    push_id: str
+    subscription_id: str
+    feed_url: str
+    source_id: Optional[str] = None
+    category: Optional[str] = None
+    received_at: str  # ISO 8601 timestamp
+    article_count: int
+    articles: List[Article]
+
+
+class WebSubPendingResponse(BaseModel):
+    """Response schema for websub_pending tool."""
+    batch_count: int
+    article_count: int
+    remaining: int = Field(0, description="Pushes left in the queue beyond max_batches")
+    batches: List[PushBatch]
+
+
+class WebSubAckRequest(BaseModel):
+    """Request schema for websub_ack tool."""
+    push_ids: List[str] = Field(..., description="push_id of every batch the run consumed", max_length=10000)
+    request_id: Optional[str] = Field(None, description="Optional request tracking ID")
+
+
+class WebSubAckResponse(BaseModel):
+    """Response schema for websub_ack tool."""
+    acked: int
+
+
+# Helper functions
+def _now() -> datetime:
+    return datetime.now(tz=timezone.utc)
+
+
+def _seconds_since(value: Optional[str], now: datetime) -> float:
+    """Seconds from an ISO 8601 timestamp to now (infinite if unset)."""
+    if not value:
+        return float("inf")
+    return (now - datetime.fromisoformat(value)).total_seconds()
+
+
+def callback_url(record: Dict[str, Any]) -> str:
+    return f"{WEBSUB_CALLBACK_BASE_URL}/websub/callback/{record['subscription_id']}.{record['callback_token']}"
+
+
+async def _callback_subscription(callback_id: str) -> Optional[Dict[str, Any]]:
+    """The subscription a callback URL belongs to (None if unknown or the token doesn't match)."""
+    sub_id, _, token = callback_id.partition(".")
+    record = await get_websub_store().get_subscription(sub_id)
+    if record is None or not record.get("callback_token") or not token:
+        return None
+    return record if hmac.compare_digest(token, record["callback_token"]) else None
+
+
+def public_subscription(record: Dict[str, Any]) -> Dict[str, Any]:
+    """WebSubSubscription-shaped dict (the secret is left out)."""
+    result = {key: record.get(key) for key in _PUBLIC_FIELDS}
+    result["push_count"] = record.get("push_count") or 0
+    return result
+
+
+def is_active(record: Optional[Dict[str, Any]], now: datetime) -> bool:
+    """True if the hub is pushing this feed: verified and the lease hasn't run out."""
+    if not record or record.get("state") != "active" or not record.get("lease_expires_at"):
+        return False
+    return datetime.fromisoformat(record["lease_expires_at"]) > now
+
+
+def sync_action(record: Optional[Dict[str, Any]], now: datetime, renew_before: float) -> Optional[str]:
+    """What websub_sync should do for a feed: "subscribe", "renew" or None."""
+    if record is None:
+        return "subscribe"
+    state = record.get("state")
+    if state == "active":
+        # Subscribed before callback tokens: re-subscribe under a tokenized callback URL
+        if not record.get("lease_expires_at") or not record.get("callback_token"):
+            return "renew"
+        remaining = (datetime.fromisoformat(record["lease_expires_at"]) - now).total_seconds()
+        return "renew" if remaining <= renew_before else None
+    if state == "pending":
+        stale = _seconds_since(record.get("requested_at"), now) > WEBSUB_PENDING_TIMEOUT_SECONDS
+        return "subscribe" if stale else None
+    if state == "no_hub":
+        stale = _seconds_since(record.get("hub_checked_at"), now) > WEBSUB_HUB_RECHECK_SECONDS
+        return "subscribe" if stale else None
+    if state in ("failed", "denied"):
+        return "subscribe" if _seconds_since(record.get("requested_at"), now) > WEBSUB_RETRY_SECONDS else None
+    # unsubscribing / unsubscribed: an explicit unsubscribe sticks until websub_subscribe
+    return None
+
+
+def websub_error(status_code: int, code: str, message: str, feed_url: Optional[str] = None) -> HTTPException:
+    """HTTPException with the MCP tools' structured error detail."""
+    return HTTPException(
+        status_code=status_code,
+        detail={
+            "error": {
+                "code": code,
+                "message": message,
+                "feed_url": feed_url,
+                "details": {"http_status": status_code}
+            }
+        }
+    )
+
+
+def _require_callback_url() -> None:
+    if not WEBSUB_CALLBACK_BASE_URL:
+        raise websub_error(
+            503, "WEBSUB_NOT_CONFIGURED",
+            "WEBSUB_CALLBACK_BASE_URL is not set; hubs would have nowhere to deliver"
+        )
+
+
+async def discover_hub(feed_url: str) -> Tuple[Optional[str], str]:
+    """
+    Fetch a feed and find its hub and topic URL.
+
+    HTTP Link headers win over <atom:link> elements in the feed, as the
+    WebSub spec asks.
+
+    Returns:
+        (hub URL or None, topic URL: the rel=self link, else feed_url)
+    """
+    client = get_client()
+    host_limiter = get_host_limiter()
+    async with host_limiter.slot(feed_url):
+        response = await fetch_bounded(client, feed_url, max_bytes=FEED_MAX_BYTES, timeout=HUB_TIMEOUT_SECONDS)
+    host_limiter.note_response(feed_url, response.status_code, response.headers)
+    response.raise_for_status()
+
+    links = response.response.links
+    hub = links.get("hub", {}).get("url")
+    topic = links.get("self", {}).get("url")
+    if not hub:
+        feed, _ = await parse_feed(response.content, response.headers)
+        for link in feed.feed.get("links", []):
+            if link.get("rel") == "hub" and not hub:
+                hub = link.get("href")
+            elif link.get("rel") == "self" and not topic:
+                topic = link.get("href")
+    return hub, topic or feed_url
+
+
+async def _hub_request(record: Dict[str, Any], mode: str) -> Optional[str]:
+    """
+    Send a subscribe/unsubscribe request to the record's hub.
+
+    Returns:
+        None if the hub accepted it (it verifies asynchronously), else an error message
+    """
+    data = {
+        "hub.mode": mode,
+        "hub.topic": record["topic"],
+        "hub.callback": callback_url(record),
+    }
+    if mode == "subscribe":
+        data["hub.lease_seconds"] = str(record["lease_seconds"])
+        data["hub.secret"] = record["secret"]
+
+    hub_url = record["hub_url"]
+    host_limiter = get_host_limiter()
+    try:
+        async with host_limiter.slot(hub_url):
+            response = await get_client().post(hub_url, data=data, timeout=HUB_TIMEOUT_SECONDS)
+        host_limiter.note_response(hub_url, response.status_code, response.headers)
+    except httpx.HTTPError as e:
+        return f"Hub request failed: {str(e) or type(e).__name__}"
+    if not 200 <= response.status_code < 300:
+        return f"Hub answered HTTP {response.status_code}: {response.text[:200]}"
+    return None
+
+
+async def subscribe_feed(
+    feed_url: str,
+    source_id: Optional[str] = None,
+    category: Optional[str] = None,
+    hub_url: Optional[str] = None,
+    topic_url: Optional[str] = None,
+    lease_seconds: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Discover the hub (unless given) and send a subscription request.
+
+    Renewing an active subscription keeps it active (and its secret) while
+    the hub re-verifies. Discovery and hub failures are recorded in the
+    subscription (state "failed"), not raised.
+
+    Returns:
+        The subscription record as stored after the request
+    """
+    store = get_websub_store()
+    sub_id = subscription_id(feed_url)
+    record = await store.get_subscription(sub_id) or {
+        "subscription_id": sub_id,
+        "feed_url": feed_url,
+        "push_count": 0,
+    }
+    now = _now().isoformat()
+    record.update({"source_id": source_id, "category": category, "error": None})
+
+    if not hub_url:
+        try:
+            hub_url, discovered_topic = await discover_hub(feed_url)
+        except Exception as e:
+            record.update({"state": "failed", "requested_at": now, "error": f"Hub discovery failed: {str(e) or type(e).__name__}"})
+            await store.save_subscription(record)
+            return record
+        topic_url = topic_url or discovered_topic
+        record["hub_checked_at"] = now
+    if not hub_url:
+        record.update({"state": "no_hub", "hub_url": None})
+        await store.save_subscription(record)
+        return record
+
+    renewing = record.get("state") == "active"
+    record.update({
+        "hub_url": hub_url,
+        "topic": topic_url or record.get("topic") or feed_url,
+        "secret": record.get("secret") or secrets.token_hex(32),
+        "callback_token": record.get("callback_token") or secrets.token_hex(16),
+        "lease_seconds": lease_seconds or WEBSUB_LEASE_SECONDS,
+        "state": "active" if renewing else "pending",
+        "requested_at": now,
+    })
+    # Saved before the request: some hubs verify before answering it
+    await store.save_subscription(record)
+
+    error = await _hub_request(record, "subscribe")
+    current = await store.get_subscription(sub_id) or record
+    if error:
+        current["error"] = error
+        if current.get("state") == "pending":
+            current["state"] = "failed"
+        await store.save_subscription(current)
+
+    logger.info(json.dumps({
+        "severity": "WARNING" if error else "INFO",
+        "message": "WebSub subscription requested",
+        "feed_url": feed_url,
+        "hub_url": hub_url,
+        "topic": current.get("topic"),
+        "renewal": renewing,
+        "state": current.get("state"),
+        "error": error
+    }))
+    return current
+
+
+# Tool Endpoints
+@router.post("/websub_subscribe", response_model=WebSubSubscription)
+async def websub_subscribe(request: WebSubSubscribeRequest):
+    """Subscribe to a feed's WebSub hub."""
+    return FastJSONResponse(await websub_subscribe_data(request), model=WebSubSubscription)
+
+
+async def websub_subscribe_data(request: WebSubSubscribeRequest) -> Dict[str, Any]:
+    """
+    websub_subscribe without the HTTP layer.
+
+    Returns:
+        WebSubSubscription-shaped dict (state "no_hub" if the feed has no hub)
+    """
+    _require_callback_url()
+    record = await subscribe_feed(
+        request.feed_url,
+        source_id=request.source_id,
+        category=request.category,
+        hub_url=request.hub_url,
+        topic_url=request.topic_url,
+        lease_seconds=request.lease_seconds,
+    )
+    return public_subscription(record)
+
+
+@router.post("/websub_unsubscribe", response_model=WebSubSubscription)
+async def websub_unsubscribe(request: WebSubUnsubscribeRequest):
+    """Ask the hub to stop pushing a feed."""
+    return FastJSONResponse(await websub_unsubscribe_data(request), model=WebSubSubscription)
+
+
+async def websub_unsubscribe_data(request: WebSubUnsubscribeRequest) -> Dict[str, Any]:
+    """
+    websub_unsubscribe without the HTTP layer.
+
+    Returns:
+        WebSubSubscription-shaped dict (state "unsubscribing" until the hub verifies)
+    """
+    _require_callback_url()
+    store = get_websub_store()
+    record = await store.get_subscription(subscription_id(request.feed_url))
+    if record is None or not record.get("hub_url"):
+        raise websub_error(404, "SUBSCRIPTION_NOT_FOUND", "No WebSub subscription for this feed", request.feed_url)
+
+    error = await _hub_request(record, "unsubscribe")
+    if error:
+        raise websub_error(502, "HUB_REQUEST_FAILED", error, request.feed_url)
+    current = await store.get_subscription(record["subscription_id"]) or record
+    if current.get("state") != "unsubscribed":
+        current["state"] = "unsubscribing"
+        await store.save_subscription(current)
+    return public_subscription(current)
+
+
+@router.post("/websub_sync", response_model=WebSubSyncResponse)
+async def websub_sync(request: WebSubSyncRequest):
+    """Subscribe / renew the given feeds and report which are pushed."""
+    return FastJSONResponse(await websub_sync_data(request), model=WebSubSyncResponse)
+
+
+async def websub_sync_data(request: WebSubSyncRequest) -> Dict[str, Any]:
+    """
+    websub_sync without the HTTP layer.
+
+    Hub discovery and requests run WEBSUB_SYNC_CONCURRENCY at a time; a feed
+    whose request fails is reported, never fails the whole sync.
+
+    Returns:
+        WebSubSyncResponse-shaped dict
+    """
+    _require_callback_url()
+    started = time.perf_counter()
+    store = get_websub_store()
+    renew_before = WEBSUB_RENEW_BEFORE_SECONDS if request.renew_before_seconds is None else request.renew_before_seconds
+    now = _now()
+    limit = asyncio.Semaphore(WEBSUB_SYNC_CONCURRENCY)
+    counts = {"subscribed": 0, "renewed": 0}
+
+    async def sync_feed(feed: WebSubFeed) -> Dict[str, Any]:
+        record = await store.get_subscription(subscription_id(feed.feed_url))
+        action = sync_action(record, now, renew_before)
+        if action is None:
+            if record and (record.get("source_id"), record.get("category")) != (feed.source_id, feed.category):
+                # Keep pushes attributed to the source's current id/category
+                record.update({"source_id": feed.source_id, "category": feed.category})
+                await store.save_subscription(record)
+            return record
+        async with limit:
+            # A renewal goes to the hub we already know; new/retried feeds re-discover
+            hub_url = record.get("hub_url") if action == "renew" else None
+            record = await subscribe_feed(
+                feed.feed_url, source_id=feed.source_id, category=feed.category,
+                hub_url=hub_url, topic_url=record.get("topic") if hub_url else None,
+            )
+        if record.get("state") in ("pending", "active"):
+            counts["renewed" if action == "renew" else "subscribed"] += 1
+        return record
+
+    records = await asyncio.gather(*(sync_feed(feed) for feed in request.feeds))
+    records = [record for record in records if record]
+    check_time = _now()
+    active_feeds = [record["feed_url"] for record in records if is_active(record, check_time)]
+
+    result = {
+        "synced_at": check_time.isoformat(),
+        "feed_count": len(request.feeds),
+        "active_feeds": active_feeds,
+        "subscribed": counts["subscribed"],
+        "renewed": counts["renewed"],
+        "pending": sum(1 for r in records if r.get("state") == "pending"),
+        "no_hub": sum(1 for r in records if r.get("state") == "no_hub"),
+        "failed": sum(1 for r in records if r.get("state") in ("failed", "denied")),
+        "latency_ms": int((time.perf_counter() - started) * 1000),
+        "subscriptions": [public_subscription(record) for record in records],
+    }
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "message": "WebSub subscriptions synced",
+        "mcp_tool": "websub_sync",
+        **{key: value for key, value in result.items() if key not in ("active_feeds", "subscriptions")},
+        "active": len(active_feeds),
+        "request_id": request.request_id
+    }))
+    return result
+
+
+@router.post("/websub_pending", response_model=WebSubPendingResponse)
+async def websub_pending(request: WebSubPendingRequest):
+    """Pushed articles waiting for the pipeline (oldest push first)."""
+    return FastJSONResponse(await websub_pending_data(request), model=WebSubPendingResponse)
+
+
+async def websub_pending_data(request: WebSubPendingRequest) -> Dict[str, Any]:
+    """
+    websub_pending without the HTTP layer.
+
+    Pushes stay queued until websub_ack; calling this twice returns them twice.
+
+    Returns:
+        WebSubPendingResponse-shaped dict
+    """
+    store = get_websub_store()
+    batches = await store.list_pushes(request.max_batches)
+    remaining = max(0, await store.count_pushes() - len(batches))
+    for batch in batches:
+        batch["article_count"] = len(batch.get("articles", []))
+    return {
+        "batch_count": len(batches),
+        "article_count": sum(batch["article_count"] for batch in batches),
+        "remaining": remaining,
+        "batches": batches,
+    }
+
+
+@router.post("/websub_ack", response_model=WebSubAckResponse)
+async def websub_ack(request: WebSubAckRequest):
+    """Drop pushes the pipeline has consumed."""
+    return FastJSONResponse(await websub_ack_data(request), model=WebSubAckResponse)
+
+
+async def websub_ack_data(request: WebSubAckRequest) -> Dict[str, Any]:
+    """
+    websub_ack without the HTTP layer.
+
+    Returns:
+        WebSubAckResponse-shaped dict
+    """
+    acked = await get_websub_store().delete_pushes(request.push_ids)
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "message": "WebSub pushes acked",
+        "mcp_tool": "websub_ack",
+        "acked": acked,
+        "request_id": request.request_id
+    }))
+    return {"acked": acked}
+
+
+# Hub callback
+@callback_router.get("/callback/{callback_id}")
+async def websub_verify(callback_id: str, request: Request):
+    """Intent verification: echo hub.challenge for requests we actually made."""
+    params = request.query_params
+    mode = params.get("hub.mode")
+    challenge = params.get("hub.challenge")
+    store = get_websub_store()
+    record = await _callback_subscription(callback_id)
+    sub_id = callback_id.partition(".")[0]
+
+    if record is None or params.get("hub.topic") != record.get("topic"):
+        logger.warning(json.dumps({
+            "severity": "WARNING",
+            "message": "WebSub verification for unknown subscription",
+            "subscription_id": sub_id,
+            "hub_mode": mode,
+            "topic": params.get("hub.topic")
+        }))
+        raise HTTPException(status_code=404, detail="Unknown subscription")
+
+    now = _now()
+    if mode == "denied":
+        record.update({"state": "denied", "error": params.get("hub.reason") or "Denied by hub"})
+        await store.save_subscription(record)
+        response = PlainTextResponse("")
+    elif mode == "subscribe" and challenge and record.get("state") in ("pending", "active"):
+        lease = int(params.get("hub.lease_seconds") or record.get("lease_seconds") or WEBSUB_LEASE_SECONDS)
+        record.update({
+            "state": "active",
+            "lease_seconds": lease,
+            "lease_expires_at": (now + timedelta(seconds=lease)).isoformat(),
+            "verified_at": now.isoformat(),
+            "error": None,
+        })
+        await store.save_subscription(record)
+        response = PlainTextResponse(challenge)
+    elif mode == "unsubscribe" and challenge and record.get("state") == "unsubscribing":
+        record.update({"state": "unsubscribed", "lease_expires_at": None})
+        await store.save_subscription(record)
+        response = PlainTextResponse(challenge)
+    else:
+        raise HTTPException(status_code=404, detail="No matching request")
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "message": "WebSub verification",
+        "subscription_id": sub_id,
+        "feed_url": record.get("feed_url"),
+        "hub_mode": mode,
+        "state": record.get("state"),
+        "lease_seconds": record.get("lease_seconds")
+    }))
+    return response
+
+
+async def _read_push_body(request: Request) -> bytes:
+    """Request body, refusing anything over FEED_MAX_BYTES (413)."""
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > FEED_MAX_BYTES:
+        raise HTTPException(status_code=413, detail="Payload too large")
+    parts: List[bytes] = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > FEED_MAX_BYTES:
+            raise HTTPException(status_code=413, detail="Payload too large")
+        parts.append(chunk)
+    return b"".join(parts)
+
+
+def signature_valid(secret: Optional[str], header: Optional[str], body: bytes) -> bool:
+    """Check X-Hub-Signature ("method=hexdigest") against the subscription's secret (False without one)."""
+    if not secret or not header or "=" not in header:
+        return False
+    method, _, digest = header.partition("=")
+    hash_func = _SIGNATURE_METHODS.get(method.strip().lower())
+    if hash_func is None:
+        return False
+    expected = hmac.new(secret.encode(), body, hash_func).hexdigest()
+    return hmac.compare_digest(expected, digest.strip().lower())
+
+
+@callback_router.post("/callback/{callback_id}")
+async def websub_receive(callback_id: str, request: Request):
+    """
+    Content distribution: normalize the pushed feed and queue its articles.
+
+    Answers 202 as soon as the articles are queued. Only pending or active
+    subscriptions with a secret take content; anything else (unknown
+    callback, no_hub, failed, unsubscribed...) gets 410, which tells the hub
+    the subscription is gone. Unsigned bodies and bodies with a bad
+    signature are acknowledged but dropped, as the spec requires.
+    """
+    store = get_websub_store()
+    record = await _callback_subscription(callback_id)
+    if record is None or record.get("state") not in ("pending", "active") or not record.get("secret"):
+        return Response(status_code=410)
+    sub_id = record["subscription_id"]
+
+    body = await _read_push_body(request)
+    if not signature_valid(record.get("secret"), request.headers.get("x-hub-signature"), body):
+        logger.warning(json.dumps({
+            "severity": "WARNING",
+            "message": "WebSub push with invalid signature dropped",
+            "subscription_id": sub_id,
+            "feed_url": record.get("feed_url"),
+            "body_bytes": len(body)
+        }))
+        return Response(status_code=202)
+
+    feed, parse_stats = await parse_feed(body, request.headers)
+    # Same normalization as fetch_rss_feed; the hub sends only new/updated entries
+    articles, _ = normalize_entries(feed.entries, None)
+
+    received_at = _now().isoformat()
+    if articles:
+        await store.add_push({
+            "push_id": uuid.uuid4().hex,
+            "subscription_id": sub_id,
+            "feed_url": record["feed_url"],
+            "source_id": record.get("source_id"),
+            "category": record.get("category"),
+            "received_at": received_at,
+            "articles": [article.to_dict() for article in articles],
+        })
+    record.update({"last_push_at": received_at, "push_count": (record.get("push_count") or 0) + 1})
+    await store.save_subscription(record)
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "message": "WebSub push received",
+        "subscription_id": sub_id,
+        "feed_url": record["feed_url"],
+        "article_count": len(articles),
+        "body_bytes": len(body),
+        "parse_ms": parse_stats["parse_ms"]
+    }))
+    return Response(status_code=202)
@@ -0,0 +1,6 @@
+"""
+MCP Service Shared Services
+
+Long-lived resources and helpers shared across tool routers
+(HTTP clients, caches, executors).
+"""
@@ -0,0 +1,183 @@
+"""
+Bounded Streaming Downloads
+
+GET a feed, page or API body through the shared client without ever holding
+more than a fixed number of bytes per fetch:
+
+- the body is read as raw (still-compressed) chunks and gzip / deflate is
+  decoded incrementally with zlib, capping the decompressor output so a
+  small compressed body can't expand past the limit
+- a declared Content-Length over the limit is rejected before reading
+- bodies that end early (connection dropped, incomplete gzip stream) are
+  reported as truncated instead of being parsed half-way
+- the whole download has a deadline, so a server dripping bytes can't hold
+  a worker past `timeout`
+
+Failures raise DownloadError with a structured code the routers turn into
+their tool errors. bytes_transferred is what crossed the wire (compressed).
+"""
+
+import asyncio
+import json
+import os
+import zlib
+from typing import Dict, List, Optional
+
+import httpx
+
+FEED_MAX_BYTES = int(os.getenv("FEED_MAX_BYTES", str(10 * 1024 * 1024)))
+
+# We decode the body ourselves, so only ask for encodings zlib handles
+ACCEPT_ENCODING = "gzip, deflate"
+
+
+class DownloadError(Exception):
+    """A body that was too large, truncated or undecodable."""
+
+    def __init__(self, code: str, message: str, http_status: int, bytes_transferred: int = 0):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.http_status = http_status
+        self.bytes_transferred = bytes_transferred
+
+
+class BoundedResponse:
+    """A finished download: the httpx response (status, headers) plus the decoded body."""
+
+    def __init__(self, response: httpx.Response, content: bytes, bytes_transferred: int):
+        self.response = response
+        self.content = content
+        self.bytes_transferred = bytes_transferred
+
+    @property
+    def status_code(self) -> int:
+        return self.response.status_code
+
+    @property
+    def headers(self) -> httpx.Headers:
+        return self.response.headers
+
+    def raise_for_status(self) -> None:
+        self.response.raise_for_status()
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class _Decoder:
+    """Incremental Content-Encoding decoder (identity, gzip, deflate)."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding in ("gzip", "x-gzip"):
+            self._zlib = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            # Usually zlib-wrapped; some servers send raw deflate (feed() falls back)
+            self._zlib = zlib.decompressobj()
+            self._first = True
+        elif encoding in ("", "identity"):
+            self._zlib = None
+        else:
+            raise DownloadError("BODY_DECODE_FAILED", f"Unsupported Content-Encoding: {encoding}", 502)
+
+    def feed(self, data: bytes, limit: int) -> bytes:
+        """Decode one raw chunk, producing at most limit bytes (+1 to detect overflow)."""
+        if self._zlib is None:
+            return data
+        if self.encoding == "deflate" and self._first:
+            self._first = False
+            try:
+                return self._decompress(data, limit)
+            except zlib.error:
+                self._zlib = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._decompress(data, limit)
+
+    def _decompress(self, data: bytes, limit: int) -> bytes:
+        out: List[bytes] = []
+        produced = 0
+        while data and produced <= limit:
+            chunk = self._zlib.decompress(data, limit + 1 - produced)
+            out.append(chunk)
+            produced += len(chunk)
+            data = self._zlib.unconsumed_tail
+            if not chunk and data:
+                break
+        return b"".join(out)
+
+    def finish(self) -> bool:
+        """True if the compressed stream ended properly."""
+        return self._zlib is None or self._zlib.eof
+
+
+async def _read_body(response: httpx.Response, max_bytes: int) -> BoundedResponse:
+    transferred = 0
+    declared = response.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > max_bytes:
+        raise DownloadError(
+            "BODY_TOO_LARGE", f"Body of {int(declared)} bytes exceeds the {max_bytes} byte limit", 413
+        )
+
+    encoding = response.headers.get("content-encoding", "").strip().lower()
+    # Stacked encodings ("gzip, gzip") are too rare to be worth decoding
+    decoder = _Decoder(encoding)
+    parts: List[bytes] = []
+    size = 0
+    try:
+        async for raw in response.aiter_raw():
+            transferred += len(raw)
+            if transferred > max_bytes:
+                raise DownloadError(
+                    "BODY_TOO_LARGE", f"Body exceeds the {max_bytes} byte limit", 413, transferred
+                )
+            chunk = decoder.feed(raw, max_bytes - size)
+            size += len(chunk)
+            if size > max_bytes:
+                raise DownloadError(
+                    "BODY_TOO_LARGE", f"Decoded body exceeds the {max_bytes} byte limit", 413, transferred
+                )
+            parts.append(chunk)
+    except zlib.error as e:
+        raise DownloadError("BODY_DECODE_FAILED", f"Could not decode {encoding} body: {e}", 502, transferred)
+    except (httpx.RemoteProtocolError, httpx.ReadError) as e:
+        raise DownloadError("BODY_TRUNCATED", f"Body ended early: {e}", 502, transferred)
+
+    if not decoder.finish():
+        raise DownloadError("BODY_TRUNCATED", f"Incomplete {encoding} body", 502, transferred)
+    if declared and declared.isdigit() and transferred < int(declared):
+        raise DownloadError(
+            "BODY_TRUNCATED", f"Body ended after {transferred} of {declared} bytes", 502, transferred
+        )
+    return BoundedResponse(response, b"".join(parts), transferred)
+
+
+async def fetch_bounded(
+    client: httpx.AsyncClient,
+    url: str,
+    max_bytes: int,
+    timeout: float,
+    headers: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, str]] = None,
+) -> BoundedResponse:
+    """
+    GET url, reading at most max_bytes of (decoded) body.
+
+    Bodies of non-2xx responses are not read (their content is empty).
+
+    Raises:
+        DownloadError: body too large (413), truncated or undecodable (502)
+        httpx.TimeoutException: no complete response within timeout seconds
+        httpx.HTTPError: connection failures, as with client.get
+    """
+    request_headers = {"Accept-Encoding": ACCEPT_ENCODING, **(headers or {})}
+
+    async def download() -> BoundedResponse:
+        async with client.stream("GET", url, headers=request_headers, params=params, timeout=timeout) as response:
+            if not 200 <= response.status_code < 300:
+                return BoundedResponse(response, b"", 0)
+            return await _read_body(response, max_bytes)
+
+    try:
+        return await asyncio.wait_for(download(), timeout)
+    except asyncio.TimeoutError:
+        raise httpx.ReadTimeout(f"Download did not finish within {timeout:g} seconds")
@@ -0,0 +1,169 @@
+"""
+Feed Date Parsing
+
+Fast, memoised parsing of the date formats feeds and APIs actually use:
+
+- RFC 822 / 1123 / 850 (RSS pubDate): "Mon, 06 Jan 2025 14:32:10 GMT",
+  "6 Jan 25 14:32 +0100", "Monday, 06-Jan-2025 09:32:10 EST"
+- ISO 8601 / RFC 3339 (Atom, JSON APIs): "2025-01-06T14:32:10Z",
+  "2025-01-06T14:32:10.123+01:00", "2025-01-06"
+
+Both are handled with a regex / datetime.fromisoformat; dateutil is only
+tried for anything else. Results are kept in a bounded LRU keyed by the raw
+string: a feed's dates repeat on every poll, and the same string is seen
+again by the watermark and window checks.
+
+feed_date_handler is registered as feedparser's first date handler (see
+services.parse_executor), so entries' published_parsed comes from here too;
+strings it doesn't recognise fall through to feedparser's own handlers.
+
+All functions return epoch seconds (UTC). Naive dates are taken as UTC.
+"""
+
+import calendar
+import logging
+import os
+import re
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from dateutil import parser as date_parser
+
+logger = logging.getLogger(__name__)
+
+DATE_CACHE_SIZE = int(os.getenv("DATE_CACHE_SIZE", "8192"))
+
+_RFC822 = re.compile(
+    r"\s*(?:[A-Za-z]{3,9},?\s+)?"         # optional day name
+    r"(\d{1,2})[\s-]+([A-Za-z]{3})[A-Za-z]*\.?[\s-]+(\d{2}|\d{4})\s+"  # RFC 850 uses dashes
+    r"(\d{1,2}):(\d{2})(?::(\d{2}))?"
+    r"(?:\.\d+)?"                          # stray fractional seconds
+    r"\s*([A-Za-z]{1,5}|[+-]\d{2}:?\d{2})?\s*$"
+)
+
+_MONTHS = {
+    name: index
+    for index, name in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), start=1
+    )
+}
+
+# Zone names RFC 822 allows (plus UTC / Z); offsets in hours
+_ZONES = {
+    "ut": 0, "utc": 0, "gmt": 0, "z": 0,
+    "est": -5, "edt": -4, "cst": -6, "cdt": -5,
+    "mst": -7, "mdt": -6, "pst": -8, "pdt": -7,
+}
+
+_fallbacks = 0
+
+
+def _rfc822(value: str) -> Optional[float]:
+    match = _RFC822.match(value)
+    if match is None:
+        return None
+    day, month_name, year, hour, minute, second, zone = match.groups()
+    month = _MONTHS.get(month_name.lower())
+    if month is None:
+        return None
+    year = int(year)
+    if year < 100:
+        # RFC 2822 4.3: two-digit years below 50 are 20xx
+        year += 2000 if year < 50 else 1900
+
+    offset = 0
+    if zone:
+        if zone[0] in "+-":
+            digits = zone[1:].replace(":", "")
+            offset = int(digits[:2]) * 3600 + int(digits[2:]) * 60
+            if zone[0] == "-":
+                offset = -offset
+        elif zone.lower() in _ZONES:
+            offset = _ZONES[zone.lower()] * 3600
+        else:
+            return None
+
+    # datetime validates the fields (timegm would silently roll 31 Feb over)
+    dt = datetime(year, month, int(day), int(hour), int(minute), min(int(second or 0), 59))
+    return float(calendar.timegm(dt.timetuple()) - offset)
+
+
+def _iso8601(value: str) -> Optional[float]:
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date_fast(value: str) -> Optional[float]:
+    """
+    Epoch seconds of an RFC 822 or ISO 8601 date string.
+
+    Returns:
+        None if the string is in neither format (or not a valid date)
+    """
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        if value[0].isdigit():
+            timestamp = _iso8601(value)
+            if timestamp is not None:
+                return timestamp
+        return _rfc822(value)
+    except (ValueError, OverflowError):
+        return None
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_date_fallback(value: str) -> Optional[float]:
+    global _fallbacks
+    _fallbacks += 1
+    try:
+        dt = date_parser.parse(value)
+    except (ValueError, OverflowError) as e:
+        logger.warning(f"Date parsing failed: {e}")
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def parse_date(value: Optional[str]) -> Optional[float]:
+    """
+    Epoch seconds of a feed/API date string, or None if it can't be parsed.
+
+    Tries the fast RFC 822 / ISO 8601 parser, then dateutil.
+    """
+    if not value:
+        return None
+    timestamp = parse_date_fast(value)
+    if timestamp is None:
+        timestamp = _parse_date_fallback(value)
+    return timestamp
+
+
+def feed_date_handler(value: str) -> Optional[time.struct_time]:
+    """feedparser date handler: 9-tuple in GMT, or None to let the next handler try."""
+    timestamp = parse_date_fast(value)
+    if timestamp is None:
+        return None
+    return time.gmtime(timestamp)
+
+
+def date_parse_stats() -> Dict[str, Any]:
+    """Memo cache counters and how often dateutil was needed."""
+    fast = parse_date_fast.cache_info()
+    return {
+        "cache_hits": fast.hits,
+        "cache_misses": fast.misses,
+        "cache_size": fast.currsize,
+        "cache_max_size": fast.maxsize,
+        "dateutil_fallbacks": _fallbacks,
+    }
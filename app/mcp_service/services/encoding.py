@@ -0,0 +1,61 @@
+"""
+Fast JSON Encoding
+
+Hot-path tools build plain dicts and return them through FastJSONResponse
+instead of letting FastAPI re-validate a response_model and re-serialise it
+(the response_model stays on the route for the OpenAPI schema).
+
+That skips FastAPI's guarantee that a response matches its schema. Set
+VALIDATE_RESPONSES=true (tests, local debugging) to check each response
+against the model passed to FastJSONResponse; a mismatch fails the request
+with a ResponseValidationError, as FastAPI's own validation would.
+
+Uses orjson when installed, falling back to the standard library.
+"""
+
+import os
+import json
+from typing import Any, Dict, Optional
+
+from fastapi.exceptions import ResponseValidationError
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter, ValidationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+VALIDATE_RESPONSES = os.getenv("VALIDATE_RESPONSES", "false").lower() == "true"
+
+_adapters: Dict[Any, TypeAdapter] = {}
+
+
+def dumps(content: Any) -> bytes:
+    """Serialise content to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def validate_response(content: Any, model: Any) -> None:
+    """Check content against a response model (raises ResponseValidationError)."""
+    adapter = _adapters.get(model)
+    if adapter is None:
+        adapter = _adapters[model] = TypeAdapter(model)
+    try:
+        adapter.validate_python(content)
+    except ValidationError as e:
+        raise ResponseValidationError(e.errors(include_url=False), body=content)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with dumps(); checked against model when VALIDATE_RESPONSES is on."""
+
+    def __init__(self, content: Any, model: Optional[Any] = None, **kwargs: Any):
+        if model is not None and VALIDATE_RESPONSES:
+            validate_response(content, model)
+        super().__init__(content, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
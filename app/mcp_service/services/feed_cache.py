@@ -0,0 +1,199 @@
+"""
+Feed Validator Cache
+
+Remembers the ETag / Last-Modified validators and the normalized articles of
+each feed URL so fetch_rss_feed can send a conditional GET and skip the
+download and parse entirely when the feed answers 304 Not Modified.
+
+Backends (selected with FEED_CACHE_BACKEND):
+- memory: in-process LRU (default)
+- disk: one JSON file per feed under FEED_CACHE_DIR
+- firestore: one document per feed in FEED_CACHE_COLLECTION
+- none: caching disabled
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+FEED_CACHE_BACKEND = os.getenv("FEED_CACHE_BACKEND", "memory").lower()
+FEED_CACHE_MAX_ENTRIES = int(os.getenv("FEED_CACHE_MAX_ENTRIES", "1000"))
+FEED_CACHE_DIR = os.getenv("FEED_CACHE_DIR", "/tmp/perception-feed-cache")
+FEED_CACHE_COLLECTION = os.getenv("FEED_CACHE_COLLECTION", "feed_cache")
+
+# Firestore documents are capped at 1 MiB; leave headroom for the other fields
+_FIRESTORE_MAX_PAYLOAD_BYTES = 900_000
+
+
+def _cache_key(feed_url: str) -> str:
+    """Stable, filesystem/document-safe key for a feed URL."""
+    return hashlib.sha256(feed_url.encode()).hexdigest()
+
+
+class FeedCache:
+    """
+    Base class for validator cache backends.
+
+    Entries are plain dicts with:
+    - etag / last_modified: validators from the last 200 response
+    - articles: normalized article dicts from that response
+    - body_bytes: size of the body that produced them
+    - parse_ms: time it took to parse and normalize them
+    - stored_at: ISO 8601 timestamp
+    """
+
+    async def get(self, feed_url: str) -> Optional[Dict[str, Any]]:
+        return None
+
+    async def set(self, feed_url: str, entry: Dict[str, Any]) -> None:
+        return None
+
+
+class MemoryFeedCache(FeedCache):
+    """In-process LRU cache (lost on restart, per Cloud Run instance)."""
+
+    def __init__(self, max_entries: int = FEED_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    async def get(self, feed_url: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(feed_url)
+        if entry is not None:
+            self._entries.move_to_end(feed_url)
+        return entry
+
+    async def set(self, feed_url: str, entry: Dict[str, Any]) -> None:
+        self._entries[feed_url] = entry
+        self._entries.move_to_end(feed_url)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class DiskFeedCache(FeedCache):
+    """One JSON file per feed; survives restarts on the same machine."""
+
+    def __init__(self, directory: str = FEED_CACHE_DIR):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, feed_url: str) -> Path:
+        return self.directory / f"{_cache_key(feed_url)}.json"
+
+    def _read(self, feed_url: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(feed_url), "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _write(self, feed_url: str, entry: Dict[str, Any]) -> None:
+        path = self._path(feed_url)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)  # atomic, readers never see a partial file
+
+    async def get(self, feed_url: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._read, feed_url)
+
+    async def set(self, feed_url: str, entry: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self._write, feed_url, entry)
+
+
+class FirestoreFeedCache(FeedCache):
+    """Shared across Cloud Run instances via a Firestore collection."""
+
+    def __init__(self, collection: str = FEED_CACHE_COLLECTION):
+        self.collection = collection
+        self._db_client = None
+
+    def _get_db(self):
+        """Get or initialize Firestore client."""
+        if self._db_client is None:
+            from google.cloud import firestore
+            self._db_client = firestore.Client()
+        return self._db_client
+
+    def _read(self, feed_url: str) -> Optional[Dict[str, Any]]:
+        doc = self._get_db().collection(self.collection).document(_cache_key(feed_url)).get()
+        if not doc.exists:
+            return None
+        data = doc.to_dict()
+        entry = {k: v for k, v in data.items() if k != "articles_json"}
+        entry["articles"] = json.loads(data.get("articles_json") or "[]")
+        return entry
+
+    def _write(self, feed_url: str, entry: Dict[str, Any]) -> None:
+        articles_json = json.dumps(entry.get("articles", []))
+        if len(articles_json) > _FIRESTORE_MAX_PAYLOAD_BYTES:
+            logger.warning(json.dumps({
+                "severity": "WARNING",
+                "message": "Feed cache entry too large for Firestore, skipping",
+                "feed_url": feed_url,
+                "payload_bytes": len(articles_json)
+            }))
+            return
+        doc = {k: v for k, v in entry.items() if k != "articles"}
+        doc["feed_url"] = feed_url
+        doc["articles_json"] = articles_json
+        self._get_db().collection(self.collection).document(_cache_key(feed_url)).set(doc)
+
+    async def get(self, feed_url: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._read, feed_url)
+
+    async def set(self, feed_url: str, entry: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self._write, feed_url, entry)
+
+
+_feed_cache: Optional[FeedCache] = None
+
+
+def get_feed_cache() -> FeedCache:
+    """Return the configured cache backend (created on first use)."""
+    global _feed_cache
+    if _feed_cache is None:
+        if FEED_CACHE_BACKEND == "disk":
+            _feed_cache = DiskFeedCache()
+        elif FEED_CACHE_BACKEND == "firestore":
+            _feed_cache = FirestoreFeedCache()
+        elif FEED_CACHE_BACKEND == "none":
+            _feed_cache = FeedCache()
+        else:
+            _feed_cache = MemoryFeedCache()
+    return _feed_cache
+
+
+async def cache_get(feed_url: str) -> Optional[Dict[str, Any]]:
+    """Look up a feed; backend errors are logged and treated as a miss."""
+    try:
+        return await get_feed_cache().get(feed_url)
+    except Exception as e:
+        logger.warning(json.dumps({
+            "severity": "WARNING",
+            "message": "Feed cache read failed",
+            "feed_url": feed_url,
+            "backend": FEED_CACHE_BACKEND,
+            "error": str(e)
+        }))
+        return None
+
+
+async def cache_set(feed_url: str, entry: Dict[str, Any]) -> None:
+    """Store a feed; backend errors are logged and otherwise ignored."""
+    try:
+        await get_feed_cache().set(feed_url, entry)
+    except Exception as e:
+        logger.warning(json.dumps({
+            "severity": "WARNING",
+            "message": "Feed cache write failed",
+            "feed_url": feed_url,
+            "backend": FEED_CACHE_BACKEND,
+            "error": str(e)
+        }))
@@ -0,0 +1,219 @@
+"""
+Per-Host Politeness Limiter
+
+Every outbound fetch (feeds, pages) takes a slot from its host before going
+out:
+- a concurrency cap (HOST_MAX_CONCURRENCY requests in flight per host)
+- a token bucket (HOST_RATE_PER_SECOND sustained, HOST_BURST burst)
+- a Retry-After block: after a 429/503 with Retry-After, new requests to
+  that host wait until the server said it's ready again
+
+Counters per host (requests, time spent waiting, throttle responses) are
+exported via GET /metrics/outbound.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, Mapping, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+HOST_RATE_PER_SECOND = float(os.getenv("HOST_RATE_PER_SECOND", "2"))
+HOST_BURST = float(os.getenv("HOST_BURST", "4"))
+HOST_MAX_CONCURRENCY = int(os.getenv("HOST_MAX_CONCURRENCY", "4"))
+# Upper bound on how long a single Retry-After can block a host
+HOST_MAX_RETRY_AFTER_SECONDS = float(os.getenv("HOST_MAX_RETRY_AFTER_SECONDS", "300"))
+
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After header (delta-seconds or HTTP-date) -> seconds to wait."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(tz=timezone.utc)).total_seconds())
+
+
+class HostState:
+    """Token bucket, concurrency cap and counters for one host."""
+
+    def __init__(self, rate: float, burst: float, max_concurrency: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+
+        self.requests = 0
+        self.waited_requests = 0
+        self.wait_ms_total = 0
+        self.wait_ms_max = 0
+        self.throttle_responses = 0
+
+    async def take_token(self) -> None:
+        """Wait until a token is available (and any Retry-After block has passed)."""
+        while True:
+            now = time.monotonic()
+            if self.blocked_until > now:
+                await asyncio.sleep(self.blocked_until - now)
+                continue
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def record_wait(self, wait_ms: int) -> None:
+        self.requests += 1
+        if wait_ms > 0:
+            self.waited_requests += 1
+            self.wait_ms_total += wait_ms
+            self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "waited_requests": self.waited_requests,
+            "wait_ms_total": self.wait_ms_total,
+            "wait_ms_max": self.wait_ms_max,
+            "throttle_responses": self.throttle_responses,
+            "blocked_for_s": round(max(0.0, self.blocked_until - time.monotonic()), 1),
+        }
+
+
+class HostSlot:
+    """Handed to the caller while it holds a host slot."""
+
+    def __init__(self, host: str):
+        self.host = host
+        self.wait_ms = 0
+
+
+class HostLimiter:
+    """Registry of per-host limits for all outbound fetches."""
+
+    def __init__(
+        self,
+        rate: float = HOST_RATE_PER_SECOND,
+        burst: float = HOST_BURST,
+        max_concurrency: int = HOST_MAX_CONCURRENCY,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self._hosts: Dict[str, HostState] = {}
+
+    def _state(self, host: str) -> HostState:
+        if host not in self._hosts:
+            self._hosts[host] = HostState(self.rate, self.burst, self.max_concurrency)
+        return self._hosts[host]
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[HostSlot]:
+        """Hold a concurrency slot and one rate token for url's host."""
+        host = urlparse(url).netloc.lower()
+        state = self._state(host)
+        slot = HostSlot(host)
+        started = time.monotonic()
+        async with state.semaphore:
+            await state.take_token()
+            slot.wait_ms = int((time.monotonic() - started) * 1000)
+            state.record_wait(slot.wait_ms)
+            yield slot
+
+    def note_response(self, url: str, status_code: int, headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Record a response; on 429/503 honour Retry-After for the whole host.
+
+        Returns:
+            Seconds the host is now blocked for (None if not throttled)
+        """
+        if status_code not in THROTTLE_STATUS_CODES:
+            return None
+        host = urlparse(url).netloc.lower()
+        state = self._state(host)
+        state.throttle_responses += 1
+
+        retry_after = parse_retry_after(headers.get("retry-after"))
+        if retry_after is None:
+            # No hint: drain the bucket so the host gets at least a short breather
+            state.tokens = 0
+            return None
+
+        retry_after = min(retry_after, HOST_MAX_RETRY_AFTER_SECONDS)
+        state.blocked_until = max(state.blocked_until, time.monotonic() + retry_after)
+        logger.warning(json.dumps({
+            "severity": "WARNING",
+            "message": "Host throttled, honouring Retry-After",
+            "host": host,
+            "status_code": status_code,
+            "retry_after_seconds": retry_after
+        }))
+        return retry_after
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-host counters plus totals."""
+        hosts = {host: state.to_dict() for host, state in sorted(self._hosts.items())}
+        return {
+            "config": {
+                "rate_per_second": self.rate,
+                "burst": self.burst,
+                "max_concurrency": self.max_concurrency,
+            },
+            "totals": {
+                "requests": sum(h["requests"] for h in hosts.values()),
+                "waited_requests": sum(h["waited_requests"] for h in hosts.values()),
+                "wait_ms_total": sum(h["wait_ms_total"] for h in hosts.values()),
+                "throttle_responses": sum(h["throttle_responses"] for h in hosts.values()),
+            },
+            "hosts": hosts,
+        }
+
+
+class BatchLimits:
+    """
+    Global and per-host concurrency limits for one batch tool call.
+
+    Sits on top of the process-wide HostLimiter: these caps are what the
+    caller asked for, the HostLimiter's are what each host tolerates.
+    """
+
+    def __init__(self, concurrency: int, per_host_limit: int):
+        self.global_limit = asyncio.Semaphore(concurrency)
+        self.per_host_limit = per_host_limit
+        self.host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    def for_host(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc.lower()
+        if host not in self.host_limits:
+            self.host_limits[host] = asyncio.Semaphore(self.per_host_limit)
+        return self.host_limits[host]
+
+
+_host_limiter: Optional[HostLimiter] = None
+
+
+def get_host_limiter() -> HostLimiter:
+    """Return the process-wide limiter (created on first use)."""
+    global _host_limiter
+    if _host_limiter is None:
+        _host_limiter = HostLimiter()
+    return _host_limiter
@@ -0,0 +1,226 @@
+"""
+HTML Main-Content and Metadata Extraction
+
+lxml-based extraction for fetch_webpage:
+- metadata from <meta> / Open Graph / article:* tags, <time> and rel=author
+- main content: <article> / <main> / [role=main] when present, otherwise the
+  container holding the most paragraph text (a small readability-style
+  scoring pass), with navigation, ads and scripts stripped
+
+Boilerplate containers are recognised by whole words of their class/id
+tokens ("share-bar", "ad_slot"; not "unavailable" or "shadow"), and only
+stripped inside the chosen container, never the block holding its best
+paragraphs, so a wrapper like class="layout has-sidebar" can't take the
+article with it.
+
+extract_page is a plain module-level function returning
+(result, started_at, seconds) so it can run on the parse executor,
+including the process pool.
+"""
+
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import lxml.html
+from lxml import etree
+
+# Elements that never hold article text
+_STRIP_TAGS = (
+    "script", "style", "noscript", "template", "iframe", "svg", "canvas",
+    "form", "button", "select", "nav", "aside", "footer", "header",
+)
+
+# Words (of class/id tokens split on "-" / "_") marking boilerplate containers
+_BOILERPLATE_WORDS = frozenset((
+    "comment", "comments", "sidebar", "footer", "header", "nav", "navbar", "navigation",
+    "menu", "share", "sharing", "social", "related", "promo", "advert", "advertisement",
+    "ad", "ads", "cookie", "cookies", "banner", "newsletter", "subscribe",
+))
+_TOKEN_SEPARATORS = re.compile(r"[\s_-]+")
+
+# Blocks whose text makes up the extracted content
+_BLOCK_TAGS = ("p", "h1", "h2", "h3", "h4", "li", "blockquote", "pre")
+
+# Paragraphs shorter than this don't count towards a container's score
+_MIN_PARAGRAPH_CHARS = 25
+
+_WHITESPACE = re.compile(r"\s+")
+
+_CHARSET = re.compile(r"charset=([\w-]+)", re.IGNORECASE)
+
+
+def _clean_text(text: Optional[str]) -> str:
+    return _WHITESPACE.sub(" ", text or "").strip()
+
+
+def _meta(doc, *names: str) -> Optional[str]:
+    """First non-empty <meta name|property=...> content among names."""
+    for name in names:
+        for element in doc.xpath("//meta[@name=$n or @property=$n or @itemprop=$n]", n=name):
+            content = _clean_text(element.get("content"))
+            if content:
+                return content
+    return None
+
+
+def _parse_document(body: bytes, content_type: Optional[str]):
+    encoding = None
+    if content_type:
+        match = _CHARSET.search(content_type)
+        if match:
+            encoding = match.group(1)
+    try:
+        parser = lxml.html.HTMLParser(encoding=encoding, remove_comments=True)
+        return lxml.html.document_fromstring(body, parser=parser)
+    except LookupError:
+        # Unknown charset in the header: let lxml sniff it from the document
+        return lxml.html.document_fromstring(body, parser=lxml.html.HTMLParser(remove_comments=True))
+
+
+def extract_metadata(doc) -> Dict[str, Any]:
+    """Description, keywords, author, publish time and image from the page head."""
+    keywords_raw = _meta(doc, "keywords", "news_keywords") or ""
+    keywords = [k.strip() for k in keywords_raw.split(",") if k.strip()]
+    keywords.extend(
+        _clean_text(e.get("content")) for e in doc.xpath("//meta[@property='article:tag']") if e.get("content")
+    )
+
+    author = _meta(doc, "author", "article:author", "parsely-author", "dc.creator")
+    if not author:
+        links = doc.xpath("//*[@rel='author']")
+        if links:
+            author = _clean_text(links[0].text_content()) or None
+
+    published_at = _meta(
+        doc, "article:published_time", "datePublished", "pubdate", "publishdate",
+        "date", "dc.date", "parsely-pub-date", "og:updated_time",
+    )
+    if not published_at:
+        times = doc.xpath("//time[@datetime]")
+        if times:
+            published_at = times[0].get("datetime")
+
+    return {
+        "description": _meta(doc, "description", "og:description", "twitter:description"),
+        "keywords": list(dict.fromkeys(keywords)),
+        "author": author,
+        "published_at": published_at,
+        "og_image": _meta(doc, "og:image", "twitter:image"),
+    }
+
+
+def extract_title(doc) -> Optional[str]:
+    title = _meta(doc, "og:title", "twitter:title")
+    if title:
+        return title
+    titles = doc.xpath("//title")
+    if titles and _clean_text(titles[0].text_content()):
+        return _clean_text(titles[0].text_content())
+    headings = doc.xpath("//h1")
+    return _clean_text(headings[0].text_content()) if headings else None
+
+
+def _is_boilerplate(element) -> bool:
+    marker = f"{element.get('class', '')} {element.get('id', '')}".lower()
+    return any(word in _BOILERPLATE_WORDS for word in _TOKEN_SEPARATORS.split(marker))
+
+
+def _paragraph_scores(root, skip_boilerplate: bool) -> Dict[Any, float]:
+    """
+    Paragraph text length credited to each paragraph's parent (and half to
+    its grandparent); skip_boilerplate leaves out paragraphs whose parent or
+    grandparent is a boilerplate block.
+    """
+    scores: Dict[Any, float] = {}
+    for paragraph in root.iter("p"):
+        length = len(_clean_text(paragraph.text_content()))
+        if length < _MIN_PARAGRAPH_CHARS:
+            continue
+        parent = paragraph.getparent()
+        if parent is None:
+            continue
+        grandparent = parent.getparent()
+        if skip_boilerplate and any(c is not None and _is_boilerplate(c) for c in (parent, grandparent)):
+            continue
+        scores[parent] = scores.get(parent, 0) + length
+        if grandparent is not None:
+            scores[grandparent] = scores.get(grandparent, 0) + length / 2
+    return scores
+
+
+def _strip_boilerplate(container) -> None:
+    """Drop boilerplate blocks inside container, keeping the one holding its best paragraphs."""
+    scores = _paragraph_scores(container, skip_boilerplate=False)
+    keep = set()
+    if scores:
+        best = max(scores, key=scores.get)
+        keep = {best, *best.iterancestors()}
+    for element in container.xpath(".//*[@class or @id]"):
+        if element not in keep and _is_boilerplate(element) and element.getparent() is not None:
+            element.drop_tree()
+
+
+def _main_container(body):
+    """The element most likely to hold the article text."""
+    for xpath in ("//article", "//main", "//*[@role='main']"):
+        candidates = body.xpath(xpath)
+        if candidates:
+            # Several <article>s (e.g. teasers): take the one with the most text
+            return max(candidates, key=lambda e: len(e.text_content()))
+
+    # Comment threads and sidebars can hold a lot of text, but never win
+    scores = _paragraph_scores(body, skip_boilerplate=True)
+    if not scores:
+        return body
+    return max(scores, key=scores.get)
+
+
+def extract_content(doc) -> str:
+    """Main article text, one block per paragraph."""
+    body = doc.find("body")
+    if body is None:
+        body = doc
+    etree.strip_elements(body, *_STRIP_TAGS, with_tail=False)
+    container = _main_container(body)
+    _strip_boilerplate(container)
+
+    blocks: List[str] = []
+    for element in container.iter(*_BLOCK_TAGS):
+        # Nested blocks (p inside li/blockquote) are covered by their ancestor's text
+        if any(ancestor.tag in _BLOCK_TAGS for ancestor in element.iterancestors() if ancestor is not container):
+            continue
+        text = _clean_text(element.text_content())
+        if text:
+            blocks.append(text)
+    if not blocks:
+        return _clean_text(container.text_content())
+    return "\n\n".join(blocks)
+
+
+def extract_page(
+    body: bytes,
+    content_type: Optional[str],
+    with_content: bool = True,
+    with_metadata: bool = True,
+) -> Tuple[Dict[str, Any], float, float]:
+    """
+    Extract title, main content and metadata from an HTML body (runs in the worker).
+
+    Returns:
+        ({"title", "content", "metadata", "word_count"}, started_at, seconds)
+    """
+    started_at = time.time()
+    doc = _parse_document(body, content_type)
+
+    title = extract_title(doc)
+    metadata = extract_metadata(doc) if with_metadata else None
+    content = extract_content(doc) if with_content else None
+
+    result = {
+        "title": title,
+        "content": content,
+        "metadata": metadata,
+        "word_count": len(content.split()) if content else 0,
+    }
+    return result, started_at, time.time() - started_at
@@ -0,0 +1,94 @@
+"""
+Shared HTTP Clients
+
+Pooled httpx client used by the tool routers for outbound fetches.
+
+The client is created when the FastAPI app starts and closed when it shuts
+down (see main.lifespan), so connections and TLS sessions are reused across
+requests instead of being re-established for every feed.
+"""
+
+import logging
+import json
+import os
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Pool tuning (configurable via environment)
+OUTBOUND_MAX_CONNECTIONS = int(os.getenv("OUTBOUND_MAX_CONNECTIONS", "100"))
+OUTBOUND_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("OUTBOUND_MAX_KEEPALIVE_CONNECTIONS", "20"))
+OUTBOUND_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("OUTBOUND_KEEPALIVE_EXPIRY_SECONDS", "30"))
+OUTBOUND_HTTP2 = os.getenv("OUTBOUND_HTTP2", "true").lower() == "true"
+OUTBOUND_TIMEOUT_SECONDS = float(os.getenv("OUTBOUND_TIMEOUT_SECONDS", "30"))
+
+USER_AGENT = "Perception-MCP/1.0"
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_enabled() -> bool:
+    """HTTP/2 needs the optional h2 package (installed via httpx[http2])."""
+    if not OUTBOUND_HTTP2:
+        return False
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def create_client() -> httpx.AsyncClient:
+    """Build a pooled client with keep-alive and (when available) HTTP/2."""
+    return httpx.AsyncClient(
+        timeout=OUTBOUND_TIMEOUT_SECONDS,
+        limits=httpx.Limits(
+            max_connections=OUTBOUND_MAX_CONNECTIONS,
+            max_keepalive_connections=OUTBOUND_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=OUTBOUND_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        http2=_http2_enabled(),
+        follow_redirects=True,
+        headers={"User-Agent": USER_AGENT},
+    )
+
+
+async def startup() -> None:
+    """Create the shared client (called from the app lifespan)."""
+    global _client
+    if _client is None:
+        _client = create_client()
+        logger.info(json.dumps({
+            "severity": "INFO",
+            "message": "Outbound HTTP client started",
+            "max_connections": OUTBOUND_MAX_CONNECTIONS,
+            "max_keepalive_connections": OUTBOUND_MAX_KEEPALIVE_CONNECTIONS,
+            "http2": _http2_enabled()
+        }))
+
+
+async def shutdown() -> None:
+    """Close the shared client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info(json.dumps({
+            "severity": "INFO",
+            "message": "Outbound HTTP client closed"
+        }))
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Return the shared outbound client.
+
+    Created lazily if the app lifespan hasn't run (e.g. when routers are
+    called directly from scripts).
+    """
+    global _client
+    if _client is None:
+        _client = create_client()
+    return _client
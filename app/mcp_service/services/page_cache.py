@@ -0,0 +1,87 @@
+"""
+Page Extraction Cache
+
+Remembers, per page URL, the ETag / Last-Modified validators of the last 200
+response and what fetch_webpage extracted from it. An extraction is only
+reused for the same URL + ETag: when the page answers 304 Not Modified, or
+answers 200 with the ETag we already extracted (servers that ignore
+conditional requests), the download-and-parse result is served from here.
+
+Uses the same backends as the feed cache (services.feed_cache), selected
+with PAGE_CACHE_BACKEND (defaults to FEED_CACHE_BACKEND).
+"""
+
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+
+from services.feed_cache import (
+    FEED_CACHE_BACKEND,
+    DiskFeedCache,
+    FeedCache,
+    FirestoreFeedCache,
+    MemoryFeedCache,
+)
+
+logger = logging.getLogger(__name__)
+
+PAGE_CACHE_BACKEND = os.getenv("PAGE_CACHE_BACKEND", FEED_CACHE_BACKEND).lower()
+PAGE_CACHE_MAX_ENTRIES = int(os.getenv("PAGE_CACHE_MAX_ENTRIES", "5000"))
+PAGE_CACHE_DIR = os.getenv("PAGE_CACHE_DIR", "/tmp/perception-page-cache")
+PAGE_CACHE_COLLECTION = os.getenv("PAGE_CACHE_COLLECTION", "page_cache")
+
+_page_cache: Optional[FeedCache] = None
+
+
+def get_page_cache() -> FeedCache:
+    """
+    Return the configured cache backend (created on first use).
+
+    Entries are plain dicts with:
+    - etag / last_modified: validators from the last 200 response
+    - extraction: {"title", "content", "metadata", "word_count"} for that response
+    - extract_options: [extract_content, extract_metadata] the extraction was made with
+    - body_bytes / extract_ms: size and extraction time of that response
+    - stored_at: ISO 8601 timestamp
+    """
+    global _page_cache
+    if _page_cache is None:
+        if PAGE_CACHE_BACKEND == "disk":
+            _page_cache = DiskFeedCache(PAGE_CACHE_DIR)
+        elif PAGE_CACHE_BACKEND == "firestore":
+            _page_cache = FirestoreFeedCache(PAGE_CACHE_COLLECTION)
+        elif PAGE_CACHE_BACKEND == "none":
+            _page_cache = FeedCache()
+        else:
+            _page_cache = MemoryFeedCache(PAGE_CACHE_MAX_ENTRIES)
+    return _page_cache
+
+
+async def page_cache_get(url: str) -> Optional[Dict[str, Any]]:
+    """Look up a page; backend errors are logged and treated as a miss."""
+    try:
+        return await get_page_cache().get(url)
+    except Exception as e:
+        logger.warning(json.dumps({
+            "severity": "WARNING",
+            "message": "Page cache read failed",
+            "url": url,
+            "backend": PAGE_CACHE_BACKEND,
+            "error": str(e)
+        }))
+        return None
+
+
+async def page_cache_set(url: str, entry: Dict[str, Any]) -> None:
+    """Store a page extraction; backend errors are logged and otherwise ignored."""
+    try:
+        await get_page_cache().set(url, entry)
+    except Exception as e:
+        logger.warning(json.dumps({
+            "severity": "WARNING",
+            "message": "Page cache write failed",
+            "url": url,
+            "backend": PAGE_CACHE_BACKEND,
+            "error": str(e)
+        }))
@@ -0,0 +1,158 @@
+"""
+Feed Parse Executor
+
+Runs feedparser (and other CPU-bound parsing such as HTML extraction) off
+the event loop so a large document doesn't block every other request on the
+uvicorn worker.
+
+Modes (selected with FEED_PARSE_EXECUTOR):
+- inline: parse on the event loop (no offloading)
+- thread: thread pool (default; keeps the loop responsive, parses still share the GIL)
+- process: process pool (true parallelism, pays a pickling cost per feed)
+
+Bodies up to FEED_PARSE_INLINE_MAX_BYTES are always parsed inline: for small
+feeds the hand-off costs more than the parse itself.
+
+Each parse reports queue wait (time from submit until a worker picked it
+up) and parse time separately, so workers can be sized from the logs.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import feedparser
+
+from services.dates import feed_date_handler
+
+logger = logging.getLogger(__name__)
+
+# Try the memoised RFC 822 / ISO 8601 parser before feedparser's own handlers
+# (module level, so process-pool workers register it when they import us)
+feedparser.registerDateHandler(feed_date_handler)
+
+FEED_PARSE_EXECUTOR = os.getenv("FEED_PARSE_EXECUTOR", "thread").lower()
+FEED_PARSE_WORKERS = int(os.getenv("FEED_PARSE_WORKERS", "4"))
+FEED_PARSE_INLINE_MAX_BYTES = int(os.getenv("FEED_PARSE_INLINE_MAX_BYTES", "65536"))
+
+_executor: Optional[Executor] = None
+
+
+def _parse(body: bytes, content_type: Optional[str]) -> Tuple[Any, float, float]:
+    """
+    Parse a feed body (runs in the worker).
+
+    Returns:
+        (feed, started_at, parse_seconds); started_at is wall-clock time so it
+        can be compared across processes.
+    """
+    started_at = time.time()
+    headers = {"content-type": content_type} if content_type else None
+    feed = feedparser.parse(body, response_headers=headers)
+    if feed.get("bozo_exception") is not None:
+        # SAX exceptions hold file handles and can't be pickled back from a process
+        feed["bozo_exception"] = str(feed["bozo_exception"])
+    return feed, started_at, time.time() - started_at
+
+
+def _create_executor() -> Executor:
+    if FEED_PARSE_EXECUTOR == "process":
+        return ProcessPoolExecutor(max_workers=FEED_PARSE_WORKERS)
+    return ThreadPoolExecutor(max_workers=FEED_PARSE_WORKERS, thread_name_prefix="feed-parse")
+
+
+async def startup() -> None:
+    """Create the configured executor (called from the app lifespan)."""
+    global _executor
+    if _executor is not None or FEED_PARSE_EXECUTOR == "inline":
+        return
+    _executor = _create_executor()
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "message": "Feed parse executor started",
+        "executor": FEED_PARSE_EXECUTOR,
+        "workers": FEED_PARSE_WORKERS,
+        "inline_max_bytes": FEED_PARSE_INLINE_MAX_BYTES
+    }))
+
+
+async def shutdown() -> None:
+    """Shut down the executor, waiting for in-flight parses."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+
+def _get_executor() -> Optional[Executor]:
+    """Return the executor, creating it lazily outside the app lifespan."""
+    global _executor
+    if _executor is None and FEED_PARSE_EXECUTOR != "inline":
+        _executor = _create_executor()
+    return _executor
+
+
+async def run_in_executor(func, *args) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Run a CPU-bound callable on the parse executor.
+
+    The callable must return (value, started_at, seconds) like _parse does.
+
+    Returns:
+        (value, stats) where stats has executor, queue_wait_ms and run_ms
+    """
+    executor = _get_executor()
+    submitted_at = time.time()
+    if executor is None:
+        value, started_at, seconds = func(*args)
+        mode = "inline"
+    else:
+        loop = asyncio.get_running_loop()
+        value, started_at, seconds = await loop.run_in_executor(executor, func, *args)
+        mode = FEED_PARSE_EXECUTOR
+    return value, {
+        "executor": mode,
+        "queue_wait_ms": max(0, int((started_at - submitted_at) * 1000)),
+        "run_ms": int(seconds * 1000),
+    }
+
+
+async def offload(func, *args, size: int) -> Tuple[Any, Dict[str, Any]]:
+    """
+    run_in_executor, except that inputs up to FEED_PARSE_INLINE_MAX_BYTES run inline.
+
+    Args:
+        func: Callable returning (value, started_at, seconds)
+        size: Input size in bytes, to decide whether offloading is worth it
+
+    Returns:
+        (value, stats) where stats has executor, queue_wait_ms and run_ms
+    """
+    if size <= FEED_PARSE_INLINE_MAX_BYTES:
+        value, _, seconds = func(*args)
+        return value, {"executor": "inline", "queue_wait_ms": 0, "run_ms": int(seconds * 1000)}
+    return await run_in_executor(func, *args)
+
+
+async def parse_feed(body: bytes, headers: Optional[Mapping[str, str]] = None) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Parse raw feed bytes with feedparser, offloading large bodies.
+
+    Raw bytes (not decoded text) are passed so feedparser can detect the
+    encoding itself from the XML declaration and the Content-Type header.
+
+    Args:
+        body: Raw response body
+        headers: Response headers (only Content-Type is used)
+
+    Returns:
+        (feed, stats) where stats has executor, queue_wait_ms and parse_ms
+    """
+    content_type = headers.get("content-type") if headers else None
+    feed, stats = await offload(_parse, body, content_type, size=len(body))
+    stats["parse_ms"] = stats.pop("run_ms")
+    return feed, stats
@@ -0,0 +1,153 @@
+"""
+Single-Flight Request Coalescing
+
+Concurrent callers asking for the same key share one in-flight call instead
+of each doing the work; the result is also kept for a short TTL so
+near-simultaneous repeats reuse it.
+
+Each call carries a scope (for feeds: the window cutoff). A caller joins an
+in-flight call or reuses a recent result only when `covers(held, wanted)`
+says that call's scope includes everything the caller needs, e.g. a 48h
+fetch covers a 24h request for the same feed, but not the reverse.
+
+The shared call runs as its own task, so a caller that is cancelled (client
+disconnect, batch timeout) doesn't cancel the work for the others.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+FEED_SINGLE_FLIGHT = os.getenv("FEED_SINGLE_FLIGHT", "true").lower() == "true"
+# How long a finished fetch is reused for identical requests (0 = only coalesce in-flight ones)
+FEED_SINGLE_FLIGHT_TTL_SECONDS = float(os.getenv("FEED_SINGLE_FLIGHT_TTL_SECONDS", "15"))
+FEED_SINGLE_FLIGHT_MAX_ENTRIES = int(os.getenv("FEED_SINGLE_FLIGHT_MAX_ENTRIES", "1000"))
+
+# How a caller was served
+LEADER = "leader"   # did the work
+JOINED = "joined"   # waited on another caller's in-flight call
+RECENT = "recent"   # reused a result finished within the TTL
+
+
+def _same_scope(held: Any, wanted: Any) -> bool:
+    return held == wanted
+
+
+class SingleFlight:
+    """Coalesces calls per key; see the module docstring."""
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float = FEED_SINGLE_FLIGHT_TTL_SECONDS,
+        max_entries: int = FEED_SINGLE_FLIGHT_MAX_ENTRIES,
+        covers: Callable[[Any, Any], bool] = _same_scope,
+        enabled: bool = FEED_SINGLE_FLIGHT,
+    ):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.covers = covers
+        self.enabled = enabled
+        self._inflight: Dict[Hashable, List[Tuple[Any, asyncio.Task]]] = {}
+        self._recent: "OrderedDict[Hashable, Tuple[float, Any, Any]]" = OrderedDict()
+        self.counts = {LEADER: 0, JOINED: 0, RECENT: 0}
+
+    def _recent_result(self, key: Hashable, scope: Any) -> Tuple[bool, Any]:
+        entry = self._recent.get(key)
+        if entry is None:
+            return False, None
+        stored_at, held, result = entry
+        if time.monotonic() - stored_at >= self.ttl_seconds:
+            del self._recent[key]
+            return False, None
+        if not self.covers(held, scope):
+            return False, None
+        return True, result
+
+    def _remember(self, key: Hashable, scope: Any, task: asyncio.Task) -> None:
+        """Done-callback of a shared call: drop it from in-flight, keep a good result."""
+        calls = self._inflight.get(key, [])
+        calls[:] = [(s, t) for s, t in calls if t is not task]
+        if not calls:
+            self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None or self.ttl_seconds <= 0:
+            return
+        self._recent[key] = (time.monotonic(), scope, task.result())
+        self._recent.move_to_end(key)
+        while len(self._recent) > self.max_entries:
+            self._recent.popitem(last=False)
+
+    async def run(self, key: Hashable, scope: Any, func: Callable[[], Awaitable[Any]]) -> Tuple[Any, str]:
+        """
+        Return func()'s result for key, sharing it with overlapping callers.
+
+        Args:
+            key: What is being fetched (e.g. the feed URL)
+            scope: How much of it this caller needs (compared with covers)
+            func: Does the work when no shared call covers the caller
+
+        Returns:
+            (result, LEADER | JOINED | RECENT); the result object is shared,
+            so callers must not mutate it. Exceptions from the shared call
+            propagate to every caller waiting on it.
+        """
+        if not self.enabled:
+            return await func(), LEADER
+
+        found, result = self._recent_result(key, scope)
+        if found:
+            self.counts[RECENT] += 1
+            return result, RECENT
+
+        for held, task in self._inflight.get(key, []):
+            if self.covers(held, scope):
+                self.counts[JOINED] += 1
+                return await asyncio.shield(task), JOINED
+
+        task = asyncio.ensure_future(func())
+        self._inflight.setdefault(key, []).append((scope, task))
+        task.add_done_callback(lambda t: self._remember(key, scope, t))
+        self.counts[LEADER] += 1
+        return await asyncio.shield(task), LEADER
+
+    def stats(self) -> Dict[str, Any]:
+        calls = sum(self.counts.values())
+        return {
+            "calls": calls,
+            "leaders": self.counts[LEADER],
+            "joined": self.counts[JOINED],
+            "recent_hits": self.counts[RECENT],
+            "shared_ratio": round((calls - self.counts[LEADER]) / calls, 3) if calls else 0.0,
+            "inflight_keys": len(self._inflight),
+            "recent_entries": len(self._recent),
+        }
+
+
+_registry: Dict[str, SingleFlight] = {}
+
+
+def get_single_flight(name: str, **kwargs: Any) -> SingleFlight:
+    """Return the process-wide SingleFlight called name (created on first use)."""
+    if name not in _registry:
+        _registry[name] = SingleFlight(name, **kwargs)
+        logger.info(json.dumps({
+            "severity": "INFO",
+            "message": "Single-flight group created",
+            "group": name,
+            "enabled": _registry[name].enabled,
+            "ttl_seconds": _registry[name].ttl_seconds
+        }))
+    return _registry[name]
+
+
+def single_flight_stats() -> Dict[str, Dict[str, Any]]:
+    """Counters of every group, for /metrics/outbound."""
+    return {name: group.stats() for name, group in sorted(_registry.items())}
+
@@ -0,0 +1,253 @@
+"""
+WebSub Subscription Store
+
+Keeps the WebSub subscriber's state:
+
+- subscriptions: one record per topic (feed) with its hub, secret,
+  callback token, state and lease, keyed by subscription_id
+- pushes: feed payloads delivered by hubs, already normalized into
+  articles and waiting for the next pipeline pass to collect and ack them
+
+Backends (selected with WEBSUB_STORE_BACKEND):
+- memory: in-process dicts (default; only for a single local instance)
+- disk: JSON files under WEBSUB_STORE_DIR
+- firestore: collections websub_subscriptions / websub_pushes, so every
+  Cloud Run instance sees the same subscriptions (hubs may call any of them)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+WEBSUB_STORE_BACKEND = os.getenv("WEBSUB_STORE_BACKEND", "memory").lower()
+WEBSUB_STORE_DIR = os.getenv("WEBSUB_STORE_DIR", "/tmp/perception-websub")
+WEBSUB_COLLECTION_PREFIX = os.getenv("WEBSUB_COLLECTION_PREFIX", "websub")
+
+
+def subscription_id(topic: str) -> str:
+    """
+    Stable id (store key) for a topic URL.
+
+    Anyone can compute it from the feed URL, so the callback URL pairs it
+    with the subscription's random callback_token (see routers.websub).
+    """
+    return hashlib.sha256(topic.encode()).hexdigest()[:32]
+
+
+class WebSubStore:
+    """
+    In-memory store; base class for the persistent backends.
+
+    Subscription records are plain dicts (see routers.websub); push records
+    have push_id, subscription_id, feed_url, source_id, category,
+    received_at and articles.
+    """
+
+    def __init__(self):
+        self._subscriptions: Dict[str, Dict[str, Any]] = {}
+        self._pushes: Dict[str, Dict[str, Any]] = {}
+
+    async def get_subscription(self, sub_id: str) -> Optional[Dict[str, Any]]:
+        record = self._subscriptions.get(sub_id)
+        return dict(record) if record else None
+
+    async def save_subscription(self, record: Dict[str, Any]) -> None:
+        self._subscriptions[record["subscription_id"]] = dict(record)
+
+    async def list_subscriptions(self) -> List[Dict[str, Any]]:
+        return [dict(record) for record in self._subscriptions.values()]
+
+    async def add_push(self, push: Dict[str, Any]) -> None:
+        self._pushes[push["push_id"]] = push
+
+    async def list_pushes(self, limit: int) -> List[Dict[str, Any]]:
+        """Oldest pending pushes first."""
+        pushes = sorted(self._pushes.values(), key=lambda p: p["received_at"])
+        return pushes[:limit]
+
+    async def count_pushes(self) -> int:
+        return len(self._pushes)
+
+    async def delete_pushes(self, push_ids: List[str]) -> int:
+        deleted = 0
+        for push_id in push_ids:
+            if self._pushes.pop(push_id, None) is not None:
+                deleted += 1
+        return deleted
+
+
+class DiskWebSubStore(WebSubStore):
+    """subscriptions.json plus one JSON file per pending push."""
+
+    def __init__(self, directory: str = WEBSUB_STORE_DIR):
+        super().__init__()
+        self.directory = Path(directory)
+        self.push_dir = self.directory / "pushes"
+        self.push_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _write_json(path: Path, data: Any) -> None:
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)  # atomic, readers never see a partial file
+
+    def _read_subscriptions(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.directory / "subscriptions.json", "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    async def get_subscription(self, sub_id: str) -> Optional[Dict[str, Any]]:
+        return (await asyncio.to_thread(self._read_subscriptions)).get(sub_id)
+
+    async def save_subscription(self, record: Dict[str, Any]) -> None:
+        def write():
+            records = self._read_subscriptions()
+            records[record["subscription_id"]] = record
+            self._write_json(self.directory / "subscriptions.json", records)
+
+        # Read-modify-write of one file: serialize writers in this process
+        async with self._lock:
+            await asyncio.to_thread(write)
+
+    async def list_subscriptions(self) -> List[Dict[str, Any]]:
+        return list((await asyncio.to_thread(self._read_subscriptions)).values())
+
+    async def add_push(self, push: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self._write_json, self.push_dir / f"{push['push_id']}.json", push)
+
+    async def list_pushes(self, limit: int) -> List[Dict[str, Any]]:
+        def read():
+            pushes = []
+            for path in self.push_dir.glob("*.json"):
+                try:
+                    with open(path, "r") as f:
+                        pushes.append(json.load(f))
+                except FileNotFoundError:
+                    continue  # acked meanwhile
+            pushes.sort(key=lambda p: p["received_at"])
+            return pushes[:limit]
+
+        return await asyncio.to_thread(read)
+
+    async def count_pushes(self) -> int:
+        return await asyncio.to_thread(lambda: sum(1 for _ in self.push_dir.glob("*.json")))
+
+    async def delete_pushes(self, push_ids: List[str]) -> int:
+        def delete():
+            deleted = 0
+            for push_id in push_ids:
+                try:
+                    (self.push_dir / f"{Path(push_id).name}.json").unlink()
+                    deleted += 1
+                except FileNotFoundError:
+                    pass
+            return deleted
+
+        return await asyncio.to_thread(delete)
+
+
+class FirestoreWebSubStore(WebSubStore):
+    """Shared across Cloud Run instances via two Firestore collections."""
+
+    def __init__(self, prefix: str = WEBSUB_COLLECTION_PREFIX):
+        super().__init__()
+        self.subscriptions_collection = f"{prefix}_subscriptions"
+        self.pushes_collection = f"{prefix}_pushes"
+        self._db_client = None
+
+    def _get_db(self):
+        """Get or initialize Firestore client."""
+        if self._db_client is None:
+            from google.cloud import firestore
+            self._db_client = firestore.Client()
+        return self._db_client
+
+    async def get_subscription(self, sub_id: str) -> Optional[Dict[str, Any]]:
+        def read():
+            doc = self._get_db().collection(self.subscriptions_collection).document(sub_id).get()
+            return doc.to_dict() if doc.exists else None
+
+        return await asyncio.to_thread(read)
+
+    async def save_subscription(self, record: Dict[str, Any]) -> None:
+        await asyncio.to_thread(
+            lambda: self._get_db().collection(self.subscriptions_collection)
+            .document(record["subscription_id"]).set(record)
+        )
+
+    async def list_subscriptions(self) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(
+            lambda: [doc.to_dict() for doc in self._get_db().collection(self.subscriptions_collection).stream()]
+        )
+
+    async def add_push(self, push: Dict[str, Any]) -> None:
+        # Articles as one JSON string: no per-field indexing, and far below the 1 MiB limit
+        doc = {k: v for k, v in push.items() if k != "articles"}
+        doc["articles_json"] = json.dumps(push.get("articles", []))
+        await asyncio.to_thread(
+            lambda: self._get_db().collection(self.pushes_collection).document(push["push_id"]).set(doc)
+        )
+
+    async def list_pushes(self, limit: int) -> List[Dict[str, Any]]:
+        def read():
+            query = self._get_db().collection(self.pushes_collection).order_by("received_at").limit(limit)
+            pushes = []
+            for doc in query.stream():
+                data = doc.to_dict()
+                push = {k: v for k, v in data.items() if k != "articles_json"}
+                push["articles"] = json.loads(data.get("articles_json") or "[]")
+                pushes.append(push)
+            return pushes
+
+        return await asyncio.to_thread(read)
+
+    async def count_pushes(self) -> int:
+        def count():
+            result = self._get_db().collection(self.pushes_collection).count().get()
+            return int(result[0][0].value)
+
+        return await asyncio.to_thread(count)
+
+    async def delete_pushes(self, push_ids: List[str]) -> int:
+        def delete():
+            db = self._get_db()
+            # A write batch holds at most 500 operations
+            for start in range(0, len(push_ids), 500):
+                batch = db.batch()
+                for push_id in push_ids[start:start + 500]:
+                    batch.delete(db.collection(self.pushes_collection).document(push_id))
+                batch.commit()
+            return len(push_ids)
+
+        return await asyncio.to_thread(delete)
+
+
+_store: Optional[WebSubStore] = None
+
+
+def get_websub_store() -> WebSubStore:
+    """Return the configured store backend (created on first use)."""
+    global _store
+    if _store is None:
+        if WEBSUB_STORE_BACKEND == "disk":
+            _store = DiskWebSubStore()
+        elif WEBSUB_STORE_BACKEND == "firestore":
+            _store = FirestoreWebSubStore()
+        else:
+            _store = WebSubStore()
+        logger.info(json.dumps({
+            "severity": "INFO",
+            "message": "WebSub store created",
+            "backend": WEBSUB_STORE_BACKEND
+        }))
+    return _store
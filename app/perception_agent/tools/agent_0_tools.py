@@ -16,12 +16,13 @@ import json
 import asyncio
 
 # Import agent tools
-from .agent_1_tools import harvest_all_sources
-from .agent_2_tools import get_active_topics
-from .agent_3_tools import score_articles, filter_top_articles
+from .agent_1_tools import harvest_all_sources, ack_pushed_articles
+from .agent_2_tools import get_active_topics, get_all_active_topics, topic_set_version
+from .agent_3_tools import score_articles, score_articles_for_users, filter_top_articles
 from .agent_4_tools import build_brief_payload
 from .agent_6_tools import validate_articles, validate_brief
-from .agent_7_tools import store_articles, store_brief, update_ingestion_run
+from .agent_7_tools import store_articles, store_brief, store_user_selections, update_ingestion_run, update_source_health
+from .source_watermarks import commit_watermarks
 
 logger = logging.getLogger(__name__)
 
@@ -104,7 +105,31 @@ def build_daily_ingestion_plan(user_id: Optional[str] = None) -> Dict[str, Any]:
     }
 
 
-async def run_daily_ingestion(user_id: Optional[str] = None, trigger: str = "scheduled") -> Dict[str, Any]:
+# Selection limits (filter_top_articles) for the brief and per-user selections
+MAX_PER_TOPIC = 10
+MIN_SCORE = 5
+
+
+def merge_user_selections(selections: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Union of every user's selected articles, one entry per URL.
+
+    Keeps each article's highest-scoring user entry; sorted by
+    relevance_score descending (the brief and /articles are shared).
+    """
+    best: Dict[str, Dict[str, Any]] = {}
+    for articles in selections.values():
+        for article in articles:
+            key = article.get("url") or article.get("title", "")
+            current = best.get(key)
+            if current is None or article.get("relevance_score", 0) > current.get("relevance_score", 0):
+                best[key] = article
+    return sorted(best.values(), key=lambda a: a.get("relevance_score", 0), reverse=True)
+
+
+async def run_daily_ingestion(
+    user_id: Optional[str] = None, trigger: str = "scheduled", all_users: bool = False
+) -> Dict[str, Any]:
     """
     Execute the complete daily ingestion pipeline.
 
@@ -119,9 +144,20 @@ async def run_daily_ingestion(user_id: Optional[str] = None, trigger: str = "sch
     8. Store articles and brief (Agent 7)
     9. Update ingestion run with final status (Agent 7)
 
+    With all_users, step 2 reads every user's active topics instead and
+    step 4 scores the harvest once for all of them (score_articles_for_users);
+    each user's selection is written to /users/{user_id}/selections/{run_id}
+    and the brief is built from their union.
+
+    Source watermarks are shared by every run, so only the shared runs (the
+    system user, or all_users) use and commit them. A run for one user
+    harvests the full time window without watermarks; otherwise it would
+    advance the watermarks past entries the other users' runs never saw.
+
     Args:
         user_id: Optional user ID (defaults to system user)
         trigger: What triggered this run (scheduled, manual, etc.)
+        all_users: Score for every user with active topics (multi-user fan-out)
 
     Returns:
         Complete ingestion result with:
@@ -134,13 +170,16 @@ async def run_daily_ingestion(user_id: Optional[str] = None, trigger: str = "sch
     # Default to system user if not specified
     if user_id is None:
         user_id = "system"
+    shared_run = all_users or user_id == "system"
 
     logger.info(json.dumps({
         "severity": "INFO",
         "tool": "agent_0",
         "operation": "run_daily_ingestion",
         "trigger": trigger,
-        "user_id": user_id
+        "all_users": all_users,
+        "user_id": user_id,
+        "watermarks": shared_run
     }))
 
     # Step 1: Start ingestion run
@@ -153,7 +192,20 @@ async def run_daily_ingestion(user_id: Optional[str] = None, trigger: str = "sch
         "articles_scored": 0,
         "articles_selected": 0,
         "articles_stored": 0,
-        "brief_id": None
+        "brief_id": None,
+        "sources_failed": 0,
+        "sources_not_due": 0,
+        "sources_circuit_open": 0,
+        "harvest_wall_clock_ms": 0,
+        "harvest_source_time_ms": 0,
+        "harvest_cache_hits": 0,
+        "harvest_bytes_saved": 0,
+        "harvest_bytes_transferred": 0,
+        "sources_pushed": 0,
+        "harvest_push_articles": 0,
+        "users_scored": 0,
+        "user_selections_stored": 0,
+        "harvest_parse_ms_saved": 0
     }
 
     try:
@@ -166,7 +218,12 @@ async def run_daily_ingestion(user_id: Optional[str] = None, trigger: str = "sch
             "run_id": run_id
         }))
 
-        topics = get_active_topics(user_id)
+        topics_by_user: Dict[str, List[Dict[str, Any]]] = {}
+        if all_users:
+            topics_by_user = get_all_active_topics()
+            topics = [topic for user_topics in topics_by_user.values() for topic in user_topics]
+        else:
+            topics = get_active_topics(user_id)
 
         # If no topics, use default topics for E2E testing
         if not topics:
@@ -204,9 +261,39 @@ async def run_daily_ingestion(user_id: Optional[str] = None, trigger: str = "sch
             "run_id": run_id
         }))
 
-        harvest_result = await harvest_all_sources(time_window_hours=24, max_items_per_source=50)
+        # Per-user runs neither filter by nor advance the shared watermarks
+        harvest_result = await harvest_all_sources(
+            time_window_hours=24, max_items_per_source=50, watermarks=None if shared_run else False
+        )
         articles = harvest_result.get("articles", [])
         stats["articles_harvested"] = len(articles)
+        stats["sources_failed"] = harvest_result.get("failed_sources", 0)
+        stats["sources_not_due"] = harvest_result.get("sources_not_due", 0)
+        stats["sources_circuit_open"] = harvest_result.get("sources_circuit_open", 0)
+        stats["harvest_wall_clock_ms"] = harvest_result.get("wall_clock_ms", 0)
+        stats["harvest_source_time_ms"] = harvest_result.get("source_time_ms", 0)
+        stats["harvest_cache_hits"] = harvest_result.get("cache_hits", 0)
+        stats["harvest_bytes_saved"] = harvest_result.get("bytes_saved", 0)
+        stats["harvest_bytes_transferred"] = harvest_result.get("bytes_transferred", 0)
+        stats["harvest_parse_ms_saved"] = harvest_result.get("parse_ms_saved", 0)
+        stats["harvest_already_seen"] = harvest_result.get("already_seen", 0)
+        stats["sources_pushed"] = harvest_result.get("sources_pushed", 0)
+        stats["harvest_push_articles"] = harvest_result.get("push_articles", 0)
+        # Committed only once the run succeeds, so a failed run re-harvests the same entries
+        pending_watermarks = harvest_result.get("watermarks", {})
+        pending_pushes = harvest_result.get("websub_batches", [])
+
+        # Publish source health for the dashboard (best effort, never fails the run)
+        try:
+            update_source_health(harvest_result.get("source_health", {}))
+        except Exception as e:
+            logger.warning(json.dumps({
+                "severity": "WARNING",
+                "tool": "agent_0",
+                "operation": "run_daily_ingestion",
+                "message": f"Source health update failed: {str(e)}",
+                "run_id": run_id
+            }))
 
         if not articles:
             logger.warning(json.dumps({
@@ -217,6 +304,8 @@ async def run_daily_ingestion(user_id: Optional[str] = None, trigger: str = "sch
                 "run_id": run_id
             }))
             # Update run as success with no articles
+            commit_watermarks(pending_watermarks)
+            await ack_pushed_articles(pending_pushes)
             update_ingestion_run(run_id, "success", stats)
             return {
                 "run_id": run_id,
@@ -236,8 +325,17 @@ async def run_daily_ingestion(user_id: Optional[str] = None, trigger: str = "sch
             "article_count": len(articles)
         }))
 
-        scored_articles = score_articles(articles, topics)
-        stats["articles_scored"] = len(scored_articles)
+        selections: Dict[str, List[Dict[str, Any]]] = {}
+        if topics_by_user:
+            # One pass over the harvest for every user
+            scored_by_user = score_articles_for_users(
+                articles, topics_by_user, unmatched_limit=MAX_PER_TOPIC
+            )
+            stats["articles_scored"] = len(articles)
+            stats["users_scored"] = len(scored_by_user)
+        else:
+            scored_articles = score_articles(articles, topics, topics_version=topic_set_version(user_id, topics))
+            stats["articles_scored"] = len(scored_articles)
 
         # Step 5: Filter top articles (Agent 3)
         logger.info(json.dumps({
@@ -248,7 +346,14 @@ async def run_daily_ingestion(user_id: Optional[str] = None, trigger: str = "sch
             "run_id": run_id
         }))
 
-        top_articles = filter_top_articles(scored_articles, max_per_topic=10, min_score=5)
+        if topics_by_user:
+            selections = {
+                uid: filter_top_articles(scored, max_per_topic=MAX_PER_TOPIC, min_score=MIN_SCORE)
+                for uid, scored in scored_by_user.items()
+            }
+            top_articles = merge_user_selections(selections)
+        else:
+            top_articles = filter_top_articles(scored_articles, max_per_topic=MAX_PER_TOPIC, min_score=MIN_SCORE)
         stats["articles_selected"] = len(top_articles)
 
         # Step 6: Build brief payload (Agent 4)
@@ -342,6 +447,20 @@ async def run_daily_ingestion(user_id: Optional[str] = None, trigger: str = "sch
             error_msg = brief_storage_result.get("error", "Brief storage failed")
             errors.append(error_msg)
 
+        if selections:
+            logger.info(json.dumps({
+                "severity": "INFO",
+                "tool": "agent_0",
+                "operation": "run_daily_ingestion",
+                "step": "store_user_selections",
+                "run_id": run_id,
+                "user_count": len(selections)
+            }))
+
+            selection_result = store_user_selections(run_id, selections)
+            stats["user_selections_stored"] = selection_result.get("stored_count", 0)
+            errors.extend(selection_result.get("errors", []))
+
         # Step 9: Update ingestion run with final status (Agent 7)
         final_status = "success" if not errors else "failed"
 
@@ -354,6 +473,9 @@ async def run_daily_ingestion(user_id: Optional[str] = None, trigger: str = "sch
             "status": final_status
         }))
 
+        if final_status == "success":
+            commit_watermarks(pending_watermarks)
+            await ack_pushed_articles(pending_pushes)
         update_ingestion_run(run_id, final_status, stats)
 
         return {
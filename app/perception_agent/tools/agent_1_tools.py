@@ -6,27 +6,93 @@ These functions fetch articles from configured news sources via MCP tools.
 Phase 5: Real MCP integration with fetch_rss_feed endpoint.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 import os
-import csv
-import httpx
+import time
+import asyncio
 import logging
 import json
-from pathlib import Path
+
+from .harvest_scheduler import PollScheduler
+from .source_health import SourceHealth
+from .source_watermarks import SourceWatermarks, article_key
+from .source_registry import (
+    SOURCES_CSV_PATH,
+    get_source_registry,
+    read_csv_sources,
+    read_firestore_sources,
+    source_host,
+)
+from .mcp_transport import MCPToolError, close_transport, get_transport
 
 logger = logging.getLogger(__name__)
 
-# MCP service base URL (configurable via environment)
-# Local dev: http://localhost:8080
-# Production: https://perception-mcp-<hash>-uc.a.run.app (set via Agent Engine runtime config)
-MCP_BASE_URL = os.getenv("MCP_BASE_URL", "http://localhost:8080")
+# Largest values the MCP batch tools accept (FetchRSSFeedsRequest, FetchWebpagesRequest);
+# payloads are clamped to these
+MCP_MAX_CONCURRENCY = 64
+MCP_MAX_PER_HOST_LIMIT = 16
+MCP_MAX_FEEDS_PER_BATCH = 500
+MCP_MAX_PAGES_PER_BATCH = 200
+
+# Harvest concurrency (configurable via environment)
+# HARVEST_CONCURRENCY: max sources fetched at once across the whole run (1 = sequential)
+# HARVEST_PER_HOST_LIMIT: max sources fetched at once from the same host
+HARVEST_CONCURRENCY = int(os.getenv("HARVEST_CONCURRENCY", "16"))
+HARVEST_PER_HOST_LIMIT = int(os.getenv("HARVEST_PER_HOST_LIMIT", "2"))
+# HARVEST_USE_BATCH: fetch RSS sources through the fetch_rss_feeds batch tool
+# HARVEST_BATCH_SIZE: max feeds per fetch_rss_feeds call (at most MCP_MAX_FEEDS_PER_BATCH)
+HARVEST_USE_BATCH = os.getenv("HARVEST_USE_BATCH", "false").lower() == "true"
+HARVEST_BATCH_SIZE = max(1, min(int(os.getenv("HARVEST_BATCH_SIZE", "100")), MCP_MAX_FEEDS_PER_BATCH))
+# HARVEST_ADAPTIVE_SCHEDULE: only fetch sources whose learned polling interval has elapsed
+HARVEST_ADAPTIVE_SCHEDULE = os.getenv("HARVEST_ADAPTIVE_SCHEDULE", "false").lower() == "true"
+# HARVEST_CIRCUIT_BREAKER: skip sources whose breaker is open after repeated failures
+HARVEST_CIRCUIT_BREAKER = os.getenv("HARVEST_CIRCUIT_BREAKER", "true").lower() == "true"
+# HARVEST_WATERMARKS: only return entries newer than each source's committed watermark
+HARVEST_WATERMARKS = os.getenv("HARVEST_WATERMARKS", "true").lower() == "true"
+# HARVEST_ENRICH: fetch the article page for thin RSS items (fetch_webpages batch tool)
+# HARVEST_ENRICH_MIN_WORDS: items with fewer content words than this count as thin
+# HARVEST_ENRICH_BATCH_SIZE: max pages per fetch_webpages call (at most MCP_MAX_PAGES_PER_BATCH)
+HARVEST_ENRICH = os.getenv("HARVEST_ENRICH", "false").lower() == "true"
+HARVEST_ENRICH_MIN_WORDS = int(os.getenv("HARVEST_ENRICH_MIN_WORDS", "80"))
+HARVEST_ENRICH_BATCH_SIZE = max(1, min(int(os.getenv("HARVEST_ENRICH_BATCH_SIZE", "100")), MCP_MAX_PAGES_PER_BATCH))
+# HARVEST_WEBSUB: keep WebSub subscriptions for RSS sources whose feed has a hub, take their
+#   pushed articles from the MCP queue and stop polling them while the subscription is active
+# HARVEST_WEBSUB_MAX_BATCHES: max queued pushes collected per run (the rest wait for the next one)
+HARVEST_WEBSUB = os.getenv("HARVEST_WEBSUB", "false").lower() == "true"
+HARVEST_WEBSUB_MAX_BATCHES = int(os.getenv("HARVEST_WEBSUB_MAX_BATCHES", "500"))
+
+
+async def close_mcp_client() -> None:
+    """Close the MCP transport's pooled resources (call once at the end of a run)."""
+    await close_transport()
+
+
+def load_sources() -> List[Dict[str, Any]]:
+    """
+    Enabled sources from the source registry (Firestore /sources, the CSV
+    and config/rss_sources.yaml, merged and cached; see source_registry).
+
+    Re-reads an input only when it changed since the last call.
+
+    Returns:
+        List of source dicts (read-only) with fields:
+        - source_id
+        - name
+        - type (rss|api|web)
+        - url
+        - category
+        - enabled
+        - api_config (api sources, when configured)
+        - origin (firestore|csv|yaml)
+    """
+    return get_source_registry().enabled_sources()
 
 
 def load_sources_from_csv() -> List[Dict[str, Any]]:
     """
-    Load enabled sources from data/initial_feeds.csv.
+    Load enabled sources from data/initial_feeds.csv (uncached).
 
-    In Phase 6+, this will be replaced with Firestore queries.
+    Harvests use load_sources(), which caches this file through the registry.
 
     Returns:
         List of source dicts with fields:
@@ -36,8 +102,9 @@ def load_sources_from_csv() -> List[Dict[str, Any]]:
         - url
         - category
         - enabled
+        - api_config (api sources, when the CSV has that column)
     """
-    csv_path = Path(__file__).parent.parent.parent.parent / "data" / "initial_feeds.csv"
+    csv_path = SOURCES_CSV_PATH
 
     logger.info(json.dumps({
         "severity": "INFO",
@@ -46,20 +113,8 @@ def load_sources_from_csv() -> List[Dict[str, Any]]:
         "csv_path": str(csv_path)
     }))
 
-    sources = []
     try:
-        with open(csv_path, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row.get('enabled', '').lower() == 'true':
-                    sources.append({
-                        'source_id': row['source_id'],
-                        'name': row['name'],
-                        'type': row['type'],
-                        'url': row['url'],
-                        'category': row['category'],
-                        'enabled': True
-                    })
+        sources = [source for source in read_csv_sources(csv_path) if source['enabled']]
 
         logger.info(json.dumps({
             "severity": "INFO",
@@ -89,20 +144,172 @@ def load_sources_from_csv() -> List[Dict[str, Any]]:
 
 def load_sources_from_firestore() -> List[Dict[str, Any]]:
     """
-    TODO Phase 6: Load enabled sources from Firestore /sources collection.
+    Load enabled sources from the Firestore /sources collection (uncached).
+
+    Harvests use load_sources(), which merges this collection through the
+    registry when SOURCES_FIRESTORE is on.
+
+    Returns:
+        List of source dicts (status "disabled" and URL-less documents are left out).
+    """
+    try:
+        sources, _ = read_firestore_sources()
+        return [source for source in sources if source['enabled'] and source.get('url')]
+    except Exception as e:
+        logger.error(json.dumps({
+            "severity": "ERROR",
+            "tool": "agent_1",
+            "operation": "load_sources_from_firestore",
+            "error": str(e)
+        }))
+        return []
+
+
+async def _request_rss_feed(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Call the MCP fetch_rss_feed tool over the configured transport.
+
+    Raises on transport or tool errors so callers can tell a failed fetch
+    apart from a feed that simply had no new articles.
+
+    Returns:
+        The decoded FetchRSSFeedResponse dict
+    """
+    transport = get_transport()
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "tool": "agent_1",
+        "operation": "fetch_rss",
+        "feed_url": payload["feed_url"],
+        "mcp_endpoint": transport.endpoint("fetch_rss_feed")
+    }))
+
+    data = await transport.call("fetch_rss_feed", payload)
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "tool": "agent_1",
+        "operation": "fetch_rss",
+        "feed_url": payload["feed_url"],
+        "article_count": data.get('article_count', 0)
+    }))
+
+    return data
+
+
+async def _request_api_feed(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Call the MCP fetch_api_feed tool over the configured transport.
+
+    Raises on transport or tool errors, like _request_rss_feed.
+
+    Returns:
+        The decoded FetchAPIFeedResponse dict
+    """
+    transport = get_transport()
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "tool": "agent_1",
+        "operation": "fetch_api",
+        "feed_id": payload["feed_id"],
+        "mcp_endpoint": transport.endpoint("fetch_api_feed")
+    }))
 
-    This will replace load_sources_from_csv in production.
+    # Several pages per call, so allow more than one page's timeout
+    data = await transport.call("fetch_api_feed", payload, timeout=120.0)
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "tool": "agent_1",
+        "operation": "fetch_api",
+        "feed_id": payload["feed_id"],
+        "article_count": data.get('article_count', 0),
+        "pages_fetched": data.get('pages_fetched', 0)
+    }))
+    return data
+
+
+async def _request_rss_feeds(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Call the MCP fetch_rss_feeds batch tool over the configured transport.
+
+    Raises on transport or tool errors; per-feed failures come back inside
+    the response results.
 
     Returns:
-        List of source dicts.
+        The decoded FetchRSSFeedsResponse dict
     """
-    # TODO: implement Firestore read
-    # from google.cloud import firestore
-    # db = firestore.Client()
-    # sources_ref = db.collection('sources')
-    # query = sources_ref.where('enabled', '==', True)
-    # return [doc.to_dict() for doc in query.stream()]
-    return []
+    transport = get_transport()
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "tool": "agent_1",
+        "operation": "fetch_rss_batch",
+        "feed_count": len(payload["feeds"]),
+        "mcp_endpoint": transport.endpoint("fetch_rss_feeds")
+    }))
+
+    # The batch is as slow as its slowest feed, so allow more than one feed's timeout
+    data = await transport.call("fetch_rss_feeds", payload, timeout=120.0)
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "tool": "agent_1",
+        "operation": "fetch_rss_batch",
+        "feed_count": data.get('feed_count', 0),
+        "failed": data.get('failed', 0),
+        "article_count": data.get('article_count', 0)
+    }))
+
+    return data
+
+
+async def _request_webpages(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Call the MCP fetch_webpages batch tool over the configured transport.
+
+    Raises on transport or tool errors; per-page failures come back inside
+    the response results.
+
+    Returns:
+        The decoded FetchWebpagesResponse dict
+    """
+    transport = get_transport()
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "tool": "agent_1",
+        "operation": "fetch_webpages_batch",
+        "page_count": len(payload["pages"]),
+        "mcp_endpoint": transport.endpoint("fetch_webpages")
+    }))
+
+    return await transport.call("fetch_webpages", payload, timeout=120.0)
+
+
+def _log_fetch_error(operation: str, feed_url: str, error: Exception) -> None:
+    """Log a failed MCP fetch with the tool's status when there is one."""
+    entry = {
+        "severity": "ERROR",
+        "tool": "agent_1",
+        "operation": operation,
+        "feed_url": feed_url,
+    }
+    if isinstance(error, MCPToolError):
+        entry["http_status"] = error.status_code
+        entry["error"] = error.message
+    else:
+        entry["error"] = str(error)
+    logger.error(json.dumps(entry))
+
+
+def _error_message(error: Exception) -> str:
+    """Prefer the MCP tool's structured error message over a generic one."""
+    if isinstance(error, MCPToolError):
+        return error.message
+    return str(error) or type(error).__name__
 
 
 async def fetch_rss(feed_url: str, time_window_hours: int = 24, max_items: int = 50, request_id: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -118,8 +325,6 @@ async def fetch_rss(feed_url: str, time_window_hours: int = 24, max_items: int =
     Returns:
         List of normalized article dicts
     """
-    endpoint = f"{MCP_BASE_URL}/mcp/tools/fetch_rss_feed"
-
     payload = {
         "feed_url": feed_url,
         "time_window_hours": time_window_hours,
@@ -127,49 +332,378 @@ async def fetch_rss(feed_url: str, time_window_hours: int = 24, max_items: int =
         "request_id": request_id
     }
 
+    try:
+        data = await _request_rss_feed(payload)
+        return data.get('articles', [])
+    except Exception as e:
+        _log_fetch_error("fetch_rss", feed_url, e)
+        return []
+
+
+def _batch_limits(concurrency: Optional[int], per_host_limit: Optional[int]) -> Dict[str, int]:
+    """concurrency / per_host_limit for a batch tool payload, within the bounds the MCP service accepts."""
+    return {
+        "concurrency": max(1, min(concurrency or HARVEST_CONCURRENCY, MCP_MAX_CONCURRENCY)),
+        "per_host_limit": max(1, min(per_host_limit or HARVEST_PER_HOST_LIMIT, MCP_MAX_PER_HOST_LIMIT)),
+    }
+
+
+async def fetch_rss_batch(
+    feeds: List[Dict[str, Any]],
+    concurrency: Optional[int] = None,
+    per_host_limit: Optional[int] = None,
+    request_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch many RSS feeds with a single call to the MCP fetch_rss_feeds tool.
+
+    Args:
+        feeds: Feed specs (at most MCP_MAX_FEEDS_PER_BATCH), each with
+               feed_url and optional time_window_hours, max_items and request_id
+        concurrency: Max feeds the MCP service fetches at once (clamped to MCP_MAX_CONCURRENCY)
+        per_host_limit: Max feeds the MCP service fetches at once per host (clamped to MCP_MAX_PER_HOST_LIMIT)
+        request_id: Optional tracking ID for the batch
+
+    Returns:
+        One result dict per feed, in input order, with:
+        - feed_url
+        - status: "ok" or "error"
+        - result: FetchRSSFeedResponse dict (when ok)
+        - error: ErrorResponse dict (when error)
+        If the batch call itself fails, every feed is reported as an error.
+    """
+    payload = {
+        "feeds": feeds,
+        **_batch_limits(concurrency, per_host_limit),
+        "request_id": request_id
+    }
+
+    try:
+        data = await _request_rss_feeds(payload)
+        return data.get('results', [])
+    except Exception as e:
+        _log_fetch_error("fetch_rss_batch", f"<batch of {len(feeds)}>", e)
+        return [
+            {
+                "feed_url": feed["feed_url"],
+                "status": "error",
+                "error": {"code": "BATCH_FETCH_FAILED", "message": str(e)}
+            }
+            for feed in feeds
+        ]
+
+
+async def stream_rss_batch(
+    feeds: List[Dict[str, Any]],
+    concurrency: Optional[int] = None,
+    per_host_limit: Optional[int] = None,
+    request_id: Optional[str] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream events from the MCP fetch_rss_feeds/stream tool as they arrive.
+
+    Feeds are sent in requests of HARVEST_BATCH_SIZE, one after another, so
+    any number of feeds stays within what the tool accepts.
+
+    Args:
+        feeds: Feed specs, each with feed_url and optional time_window_hours,
+               max_items and request_id
+        concurrency: Max feeds the MCP service fetches at once (clamped to MCP_MAX_CONCURRENCY)
+        per_host_limit: Max feeds the MCP service fetches at once per host (clamped to MCP_MAX_PER_HOST_LIMIT)
+        request_id: Optional tracking ID for the batch
+
+    Yields:
+        Event dicts (one per NDJSON line over HTTP):
+        - {"type": "article", "index", "feed_url", "article"}
+        - {"type": "feed", "index", "feed_url", "article_count", ...}
+        - {"type": "error", "index", "feed_url", "error"}
+        - {"type": "done", ...} (one per request)
+        "index" is the feed's position in feeds. Transport failures raise.
+    """
+    transport = get_transport()
+    limits = _batch_limits(concurrency, per_host_limit)
+
     logger.info(json.dumps({
         "severity": "INFO",
         "tool": "agent_1",
-        "operation": "fetch_rss",
-        "feed_url": feed_url,
-        "mcp_endpoint": endpoint
+        "operation": "stream_rss_batch",
+        "feed_count": len(feeds),
+        "mcp_endpoint": transport.endpoint("fetch_rss_feeds/stream")
+    }))
+
+    for offset in range(0, len(feeds), HARVEST_BATCH_SIZE):
+        payload = {
+            "feeds": feeds[offset:offset + HARVEST_BATCH_SIZE],
+            **limits,
+            "request_id": request_id
+        }
+        # No read timeout between lines beyond one slow feed's worth
+        async for event in transport.stream("fetch_rss_feeds/stream", payload, timeout=120.0):
+            if "index" in event:
+                event["index"] += offset
+            yield event
+
+
+async def fetch_webpages_batch(
+    urls: List[str],
+    concurrency: Optional[int] = None,
+    per_host_limit: Optional[int] = None,
+    request_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch and extract many article pages with a single call to the MCP fetch_webpages tool.
+
+    Args:
+        urls: Page URLs (at most MCP_MAX_PAGES_PER_BATCH)
+        concurrency: Max pages the MCP service fetches at once (clamped to MCP_MAX_CONCURRENCY)
+        per_host_limit: Max pages the MCP service fetches at once per host (clamped to MCP_MAX_PER_HOST_LIMIT)
+        request_id: Optional tracking ID for the batch
+
+    Returns:
+        One result dict per URL, in input order, with:
+        - url
+        - status: "ok" or "error"
+        - result: FetchWebpageResponse dict (when ok)
+        - error: PageError dict (when error)
+        If the batch call itself fails, every page is reported as an error.
+    """
+    payload = {
+        "pages": [{"url": url} for url in urls],
+        **_batch_limits(concurrency, per_host_limit),
+        "request_id": request_id
+    }
+
+    try:
+        data = await _request_webpages(payload)
+        return data.get('results', [])
+    except Exception as e:
+        _log_fetch_error("fetch_webpages_batch", f"<batch of {len(urls)}>", e)
+        return [
+            {
+                "url": url,
+                "status": "error",
+                "error": {"code": "BATCH_FETCH_FAILED", "message": str(e)}
+            }
+            for url in urls
+        ]
+
+
+def _is_thin(article: Dict[str, Any], min_words: int) -> bool:
+    """True if an article has a URL but too little text to analyze."""
+    if not article.get("url"):
+        return False
+    return len((article.get("content") or "").split()) < min_words
+
+
+async def enrich_articles(
+    articles: List[Dict[str, Any]],
+    min_words: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    per_host_limit: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Fill in thin articles (short RSS summaries) from their web pages, in place.
+
+    Thin articles are fetched through the fetch_webpages batch tool in
+    chunks of HARVEST_ENRICH_BATCH_SIZE, one chunk at a time. The extracted
+    page text replaces content when it is longer; author, published_at and
+    summary are only filled when missing. Pages that fail keep the RSS data.
+
+    Args:
+        articles: Normalized articles (modified in place)
+        min_words: Word count below which an article is thin (defaults to HARVEST_ENRICH_MIN_WORDS)
+        concurrency: Max pages fetched at once (defaults to HARVEST_CONCURRENCY)
+        per_host_limit: Max pages fetched at once per host (defaults to HARVEST_PER_HOST_LIMIT)
+
+    Returns:
+        {"candidates": thin articles found, "enriched": articles updated,
+         "failed": pages that could not be fetched, "from_cache": pages served
+         from the page cache}
+    """
+    min_words = HARVEST_ENRICH_MIN_WORDS if min_words is None else min_words
+    thin = [article for article in articles if _is_thin(article, min_words)]
+    stats = {"candidates": len(thin), "enriched": 0, "failed": 0, "from_cache": 0}
+    if not thin:
+        return stats
+
+    chunks = [thin[i:i + HARVEST_ENRICH_BATCH_SIZE] for i in range(0, len(thin), HARVEST_ENRICH_BATCH_SIZE)]
+    # One chunk at a time: each call applies the full concurrency / per-host budget
+    chunk_results = []
+    for chunk in chunks:
+        chunk_results.append(
+            await fetch_webpages_batch([article["url"] for article in chunk], concurrency, per_host_limit)
+        )
+
+    for chunk, page_results in zip(chunks, chunk_results):
+        for article, page in zip(chunk, page_results):
+            if page.get("status") != "ok" or not page.get("result"):
+                stats["failed"] += 1
+                continue
+            result = page["result"]
+            metadata = result.get("metadata") or {}
+            content = result.get("content") or ""
+            if result.get("from_cache"):
+                stats["from_cache"] += 1
+            if len(content.split()) <= len((article.get("content") or "").split()):
+                continue
+            article["content"] = content
+            article["author"] = article.get("author") or metadata.get("author")
+            article["published_at"] = article.get("published_at") or metadata.get("published_at")
+            article["summary"] = article.get("summary") or metadata.get("description")
+            article["enriched"] = True
+            stats["enriched"] += 1
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "tool": "agent_1",
+        "operation": "enrich_articles",
+        "articles": len(articles),
+        **stats
+    }))
+    return stats
+
+
+async def _request_websub(tool: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Call one of the MCP websub_* tools over the configured transport.
+
+    Raises on transport or tool errors.
+
+    Returns:
+        The decoded tool response dict
+    """
+    transport = get_transport()
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "tool": "agent_1",
+        "operation": tool,
+        "mcp_endpoint": transport.endpoint(tool)
+    }))
+
+    # websub_sync may contact many hubs, so allow more than one request's timeout
+    return await transport.call(tool, payload, timeout=120.0)
+
+
+async def collect_pushed_articles(
+    sources: List[Dict[str, Any]],
+    max_batches: int = HARVEST_WEBSUB_MAX_BATCHES,
+) -> Dict[str, Any]:
+    """
+    Sync the WebSub subscriptions of the RSS sources and collect queued pushes.
+
+    websub_sync subscribes feeds that advertise a hub and renews leases
+    about to expire; the feeds it reports active are pushed and need no
+    polling. Any failure leaves every feed to be polled as usual.
+
+    Returns:
+        A dict with:
+        - active_feeds: set of feed URLs currently pushed
+        - batches: queued push batches (feed_url, source_id, articles, push_id)
+        - remaining: pushes left in the queue for the next run
+    """
+    feeds = [
+        {"feed_url": s.get('url'), "source_id": s.get('source_id'), "category": s.get('category')}
+        for s in sources if s.get('type') == 'rss'
+    ]
+    result: Dict[str, Any] = {"active_feeds": set(), "batches": [], "remaining": 0}
+    if not feeds:
+        return result
+
+    try:
+        sync = await _request_websub("websub_sync", {"feeds": feeds, "request_id": "harvest_websub_sync"})
+        result["active_feeds"] = set(sync.get('active_feeds', []))
+    except Exception as e:
+        _log_fetch_error("websub_sync", f"<{len(feeds)} feeds>", e)
+        sync = {}
+    try:
+        pending = await _request_websub("websub_pending", {"max_batches": max_batches, "request_id": "harvest_websub_pending"})
+        result["batches"] = pending.get('batches', [])
+        result["remaining"] = pending.get('remaining', 0)
+    except Exception as e:
+        _log_fetch_error("websub_pending", "<push queue>", e)
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "tool": "agent_1",
+        "operation": "collect_pushed_articles",
+        "feeds": len(feeds),
+        "active_feeds": len(result["active_feeds"]),
+        "subscribed": sync.get('subscribed', 0),
+        "renewed": sync.get('renewed', 0),
+        "no_hub": sync.get('no_hub', 0),
+        "failed": sync.get('failed', 0),
+        "push_batches": len(result["batches"]),
+        "remaining": result["remaining"]
     }))
+    return result
+
 
+async def ack_pushed_articles(push_ids: List[str]) -> int:
+    """
+    Drop consumed pushes from the MCP queue.
+
+    Call once the run that harvested them succeeded (like commit_watermarks);
+    unacked pushes are collected again by the next run. Best effort: a
+    failure is logged, and the watermarks filter the repeats next time.
+
+    Returns:
+        Number of pushes acked
+    """
+    if not push_ids:
+        return 0
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(endpoint, json=payload)
-            response.raise_for_status()
-            data = response.json()
-
-            logger.info(json.dumps({
-                "severity": "INFO",
-                "tool": "agent_1",
-                "operation": "fetch_rss",
-                "feed_url": feed_url,
-                "article_count": data.get('article_count', 0)
-            }))
-
-            return data.get('articles', [])
-
-    except httpx.HTTPStatusError as e:
-        logger.error(json.dumps({
-            "severity": "ERROR",
-            "tool": "agent_1",
-            "operation": "fetch_rss",
-            "feed_url": feed_url,
-            "http_status": e.response.status_code,
-            "error": e.response.text
-        }))
-        return []
+        data = await _request_websub("websub_ack", {"push_ids": push_ids, "request_id": "harvest_websub_ack"})
     except Exception as e:
-        logger.error(json.dumps({
-            "severity": "ERROR",
-            "tool": "agent_1",
-            "operation": "fetch_rss",
-            "feed_url": feed_url,
-            "error": str(e)
-        }))
-        return []
+        _log_fetch_error("websub_ack", "<push queue>", e)
+        return 0
+    return data.get('acked', 0)
+
+
+def _apply_pushes(
+    sources: List[Dict[str, Any]],
+    results: List[Dict[str, Any]],
+    batches: List[Dict[str, Any]],
+) -> List[str]:
+    """
+    Merge pushed articles into the source records.
+
+    Batches are matched to sources by source_id, then feed URL. A source
+    that wasn't fetched becomes "ok" with pushed=True; a polled one gets the
+    pushed articles it didn't already have. Pushes for a source whose fetch
+    failed are left queued for the next run.
+
+    Returns:
+        push_id of every batch consumed (merged, or for a source no longer enabled)
+    """
+    by_id = {source.get('source_id'): i for i, source in enumerate(sources)}
+    by_url = {source.get('url'): i for i, source in enumerate(sources)}
+    consumed = []
+    for batch in batches:
+        i = by_id.get(batch.get('source_id'), by_url.get(batch.get('feed_url')))
+        if i is None:
+            consumed.append(batch['push_id'])
+            continue
+        result = results[i]
+        if result["status"] == "error":
+            continue
+        if result["status"] == "skipped":
+            result["status"] = "ok"
+            result["pushed"] = True
+
+        source = sources[i]
+        seen = {article_key(article) for article in result["articles"]}
+        for raw in batch.get('articles', []):
+            article = normalize_article(raw, source.get('source_id'), source.get('category'))
+            key = article_key(article)
+            if key and key in seen:
+                continue
+            seen.add(key)
+            result["articles"].append(article)
+        result["raw_count"] += len(batch.get('articles', []))
+        result["push_articles"] = result.get("push_articles", 0) + len(batch.get('articles', []))
+        consumed.append(batch['push_id'])
+    return consumed
 
 
 def normalize_article(raw: Dict[str, Any], source_id: str, category: Optional[str] = None) -> Dict[str, Any]:
@@ -193,6 +727,8 @@ def normalize_article(raw: Dict[str, Any], source_id: str, category: Optional[st
         - content_snippet
         - author
         - categories (list of tags)
+        - guid (feed entry id, when the tool provides one)
+        - date_missing (True if the tool filled published_at with the fetch time)
     """
     return {
         "title": raw.get("title", "Untitled"),
@@ -204,37 +740,290 @@ def normalize_article(raw: Dict[str, Any], source_id: str, category: Optional[st
         "content": raw.get("raw_content") or raw.get("summary") or raw.get("content_snippet"),
         "content_snippet": raw.get("content_snippet"),
         "author": raw.get("author"),
-        "categories": raw.get("categories", [])
+        "categories": raw.get("categories", []),
+        "guid": raw.get("guid"),
+        "date_missing": bool(raw.get("date_missing")) or not raw.get("published_at")
+    }
+
+
+def _new_source_result(source: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the per-source harvest record (starts out as "skipped").
+
+    Fields:
+    - source_id
+    - status: "ok", "error" or "skipped"
+    - articles: normalized articles (empty unless status is "ok")
+    - raw_count: articles returned by the MCP tool
+    - latency_ms: time spent fetching (excludes time queued on limits)
+    - queued_ms: time spent waiting for a concurrency slot
+    - from_cache: True if the feed answered 304 and cached articles were served
+    - bytes_downloaded / bytes_saved: body bytes fetched / avoided by a 304
+    - bytes_transferred: body bytes on the wire (compressed size)
+    - parse_ms_saved: parse time avoided by a 304
+    - throttle_wait_ms: time the MCP service waited on per-host rate limits
+    - already_seen: articles dropped because the watermark had their GUID
+    - error: error message (only when status is "error")
+    - skip_reason: why a "skipped" source wasn't fetched ("push", "not_due", "circuit_open")
+    - pushed / push_articles: articles came from WebSub pushes (see _apply_pushes)
+    """
+    return {
+        "source_id": source.get('source_id'),
+        "status": "skipped",
+        "articles": [],
+        "raw_count": 0,
+        "latency_ms": 0,
+        "queued_ms": 0,
+        "from_cache": False,
+        "bytes_downloaded": 0,
+        "bytes_transferred": 0,
+        "bytes_saved": 0,
+        "parse_ms_saved": 0,
+        "throttle_wait_ms": 0,
+        "already_seen": 0,
     }
 
 
-async def harvest_all_sources(time_window_hours: int = 24, max_items_per_source: int = 50) -> Dict[str, Any]:
+def _apply_feed_data(result: Dict[str, Any], data: Dict[str, Any], source: Dict[str, Any]) -> None:
+    """Fill a source record from a successful FetchRSSFeedResponse / FetchAPIFeedResponse dict."""
+    raw_articles = data.get('articles', [])
+    result["status"] = "ok"
+    result["raw_count"] = len(raw_articles)
+    result["from_cache"] = data.get('from_cache', False)
+    result["bytes_downloaded"] = data.get('bytes_downloaded', 0)
+    result["bytes_transferred"] = data.get('bytes_transferred', 0)
+    result["bytes_saved"] = data.get('bytes_saved', 0)
+    result["parse_ms_saved"] = data.get('parse_ms_saved', 0)
+    result["throttle_wait_ms"] = data.get('throttle_wait_ms', 0)
+    result["articles"] = [
+        normalize_article(raw, source.get('source_id'), source.get('category'))
+        for raw in raw_articles
+    ]
+
+
+async def _harvest_source(
+    source: Dict[str, Any],
+    time_window_hours: int,
+    max_items_per_source: int,
+    global_limit: asyncio.Semaphore,
+    host_limit: asyncio.Semaphore,
+    since: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Fetch and normalize a single source under the global and per-host limits.
+
+    `since` (the source's watermark) limits the fetch to newer entries.
+
+    Returns:
+        The source record (see _new_source_result)
+    """
+    source_id = source.get('source_id')
+    source_url = source.get('url')
+    result = _new_source_result(source)
+
+    # TODO Phase 6: Handle 'web' source types
+    # elif source_type == 'web':
+    #     raw_articles = await fetch_webpage(...)
+    source_type = source.get('type')
+    if source_type not in ('rss', 'api'):
+        return result
+
+    queued_at = time.perf_counter()
+    # Take the host slot first so a source waiting on a busy host doesn't hold a global slot
+    async with host_limit, global_limit:
+        started_at = time.perf_counter()
+        result["queued_ms"] = int((started_at - queued_at) * 1000)
+
+        try:
+            if source_type == 'api':
+                # Paginated API source via MCP (config inline when the source carries one)
+                data = await _request_api_feed({
+                    "feed_id": source_id,
+                    "source_config": source.get('api_config'),
+                    "time_window_hours": time_window_hours,
+                    "max_items": max_items_per_source,
+                    "since": since,
+                    "request_id": f"harvest_{source_id}"
+                })
+            else:
+                # Fetch RSS feed via MCP
+                data = await _request_rss_feed({
+                    "feed_url": source_url,
+                    "time_window_hours": time_window_hours,
+                    "max_items": max_items_per_source,
+                    "since": since,
+                    "request_id": f"harvest_{source_id}"
+                })
+        except Exception as e:
+            _log_fetch_error("harvest_source", source_url, e)
+            result["status"] = "error"
+            result["error"] = _error_message(e)
+            return result
+        finally:
+            result["latency_ms"] = int((time.perf_counter() - started_at) * 1000)
+
+    _apply_feed_data(result, data, source)
+    return result
+
+
+async def _harvest_batch(
+    sources: List[Dict[str, Any]],
+    time_window_hours: int,
+    max_items_per_source: int,
+    concurrency: int,
+    per_host_limit: int,
+    since_by_source: Optional[Dict[str, str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch a chunk of RSS sources with one fetch_rss_feeds call.
+
+    since_by_source maps source_id to its watermark (see _harvest_source).
+
+    The MCP service applies the concurrency and per-host limits. Per-source
+    latency is the time the service spent on that feed.
+
+    Returns:
+        Source records (see _new_source_result), in input order
+    """
+    since_by_source = since_by_source or {}
+    feeds = [
+        {
+            "feed_url": source.get('url'),
+            "time_window_hours": time_window_hours,
+            "max_items": max_items_per_source,
+            "since": since_by_source.get(source.get('source_id')),
+            "request_id": f"harvest_{source.get('source_id')}"
+        }
+        for source in sources
+    ]
+    feed_results = await fetch_rss_batch(
+        feeds,
+        concurrency=concurrency,
+        per_host_limit=per_host_limit,
+        request_id=f"harvest_batch_{len(sources)}"
+    )
+
+    results = []
+    for source, feed_result in zip(sources, feed_results):
+        result = _new_source_result(source)
+        if feed_result.get("status") == "ok" and feed_result.get("result"):
+            data = feed_result["result"]
+            result["latency_ms"] = data.get('latency_ms', 0)
+            _apply_feed_data(result, data, source)
+        else:
+            error = feed_result.get("error") or {}
+            result["status"] = "error"
+            result["error"] = error.get("message", "Feed fetch failed")
+        results.append(result)
+    return results
+
+
+async def harvest_all_sources(
+    time_window_hours: int = 24,
+    max_items_per_source: int = 50,
+    concurrency: Optional[int] = None,
+    per_host_limit: Optional[int] = None,
+    use_batch: Optional[bool] = None,
+    adaptive_schedule: Optional[bool] = None,
+    circuit_breaker: Optional[bool] = None,
+    watermarks: Optional[bool] = None,
+    enrich: Optional[bool] = None,
+    websub: Optional[bool] = None,
+) -> Dict[str, Any]:
     """
     High-level harvesting process.
 
-    Loads all enabled sources and fetches articles from each one.
+    Loads all enabled sources and fetches articles from them concurrently,
+    bounded by a global concurrency limit and a per-host limit. Articles are
+    returned in source order regardless of which fetch finishes first.
+
+    RSS sources go through fetch_rss_feed and API sources through
+    fetch_api_feed (paginated; config from the source's api_config or its
+    /sources document). In batch mode, RSS sources are sent to the MCP
+    fetch_rss_feeds tool in chunks of HARVEST_BATCH_SIZE, one chunk at a
+    time, so a run costs a few round trips instead of one per source; API
+    sources are still fetched one call each, alongside the batches.
+
+    With adaptive scheduling, sources whose learned polling interval hasn't
+    elapsed yet are skipped (see harvest_scheduler.PollScheduler). With the
+    circuit breaker, sources that keep failing or timing out are skipped until
+    their cooldown passes (see source_health.SourceHealth). With watermarks,
+    each source only returns entries newer than what the last successful run
+    harvested (see source_watermarks.SourceWatermarks); the advanced
+    watermarks are returned, not saved, and the caller commits them with
+    commit_watermarks once the run has succeeded. With enrichment, articles
+    whose RSS text is too thin are filled in from their pages (see
+    enrich_articles). With WebSub, RSS feeds whose hub is pushing them are
+    not polled; their pushed articles are taken from the MCP queue instead
+    (see collect_pushed_articles), and the consumed pushes are returned for
+    the caller to ack with ack_pushed_articles once the run has succeeded.
 
     Args:
         time_window_hours: Only fetch articles from last N hours
         max_items_per_source: Max articles per source
+        concurrency: Max sources fetched at once (defaults to HARVEST_CONCURRENCY; 1 = sequential)
+        per_host_limit: Max sources fetched at once per host (defaults to HARVEST_PER_HOST_LIMIT)
+        use_batch: Use the fetch_rss_feeds batch tool (defaults to HARVEST_USE_BATCH)
+        adaptive_schedule: Only fetch sources that are due (defaults to HARVEST_ADAPTIVE_SCHEDULE)
+        circuit_breaker: Skip sources with an open breaker (defaults to HARVEST_CIRCUIT_BREAKER)
+        watermarks: Only return entries newer than each source's watermark (defaults to HARVEST_WATERMARKS)
+        enrich: Fetch the page of thin articles (defaults to HARVEST_ENRICH)
+        websub: Use WebSub pushes instead of polling where a hub allows (defaults to HARVEST_WEBSUB)
 
     Returns:
         A dict with:
         - articles: List[Dict[str, Any]] of normalized article objects
         - source_count: number of sources processed
         - total_fetched: total articles fetched before normalization
+        - failed_sources: number of sources whose fetch failed
+        - sources_not_due: sources skipped by the adaptive schedule
+        - sources_circuit_open: sources skipped because their breaker is open
+        - wall_clock_ms: elapsed time for the whole harvest
+        - source_time_ms: sum of per-source fetch times (the sequential cost)
+        - cache_hits: sources served from the conditional GET cache (304)
+        - bytes_downloaded / bytes_saved: feed body bytes fetched / avoided by 304s
+        - bytes_transferred: feed body bytes on the wire (compressed size)
+        - parse_ms_saved: feed parse time avoided by 304s
+        - source_stats: per-source status, counts and timings
+        - source_health: breaker/health records updated by this run for
+          Firestore sources, keyed by source_id (for Agent 7's
+          update_source_health)
+        - already_seen: articles dropped because a watermark had their GUID
+        - watermarks: advanced watermark records keyed by source_id (pass to
+          commit_watermarks after the run succeeds)
+        - enriched: articles filled in from their web page
+        - sources_pushed: sources not polled because their hub pushes them
+        - push_articles: articles that arrived by WebSub push
+        - websub_batches: push_id of the consumed pushes (pass to
+          ack_pushed_articles after the run succeeds)
     """
+    concurrency = max(1, concurrency or HARVEST_CONCURRENCY)
+    per_host_limit = max(1, per_host_limit or HARVEST_PER_HOST_LIMIT)
+    use_batch = HARVEST_USE_BATCH if use_batch is None else use_batch
+    adaptive_schedule = HARVEST_ADAPTIVE_SCHEDULE if adaptive_schedule is None else adaptive_schedule
+    circuit_breaker = HARVEST_CIRCUIT_BREAKER if circuit_breaker is None else circuit_breaker
+    watermarks = HARVEST_WATERMARKS if watermarks is None else watermarks
+    enrich = HARVEST_ENRICH if enrich is None else enrich
+    websub = HARVEST_WEBSUB if websub is None else websub
+
     logger.info(json.dumps({
         "severity": "INFO",
         "tool": "agent_1",
         "operation": "harvest_all_sources",
         "time_window_hours": time_window_hours,
-        "max_items_per_source": max_items_per_source
+        "max_items_per_source": max_items_per_source,
+        "concurrency": concurrency,
+        "per_host_limit": per_host_limit,
+        "use_batch": use_batch,
+        "adaptive_schedule": adaptive_schedule,
+        "circuit_breaker": circuit_breaker,
+        "watermarks": watermarks,
+        "enrich": enrich,
+        "websub": websub
     }))
 
-    # Load sources from CSV (Phase 5)
-    # TODO Phase 6: Replace with load_sources_from_firestore()
-    sources = load_sources_from_csv()
+    # Load sources from the registry (cached; re-read only when an input changed)
+    sources = load_sources()
 
     if not sources:
         logger.warning(json.dumps({
@@ -246,40 +1035,197 @@ async def harvest_all_sources(time_window_hours: int = 24, max_items_per_source:
         return {
             "articles": [],
             "source_count": 0,
-            "total_fetched": 0
+            "total_fetched": 0,
+            "failed_sources": 0,
+            "sources_not_due": 0,
+            "sources_circuit_open": 0,
+            "wall_clock_ms": 0,
+            "source_time_ms": 0,
+            "cache_hits": 0,
+            "bytes_downloaded": 0,
+            "bytes_transferred": 0,
+            "bytes_saved": 0,
+            "parse_ms_saved": 0,
+            "source_stats": [],
+            "source_health": {},
+            "already_seen": 0,
+            "watermarks": {},
+            "enriched": 0,
+            "sources_pushed": 0,
+            "push_articles": 0,
+            "websub_batches": []
         }
 
-    # Fetch from each source
+    start = time.perf_counter()
+    results: List[Dict[str, Any]] = [_new_source_result(source) for source in sources]
+    fetch_positions = list(range(len(sources)))
+
+    push_batches: List[Dict[str, Any]] = []
+    if websub:
+        push = await collect_pushed_articles(sources)
+        push_batches = push["batches"]
+        polled = []
+        for i in fetch_positions:
+            if sources[i].get('type') == 'rss' and sources[i].get('url') in push["active_feeds"]:
+                results[i]["skip_reason"] = "push"
+            else:
+                polled.append(i)
+        fetch_positions = polled
+
+    scheduler = PollScheduler() if adaptive_schedule else None
+    if scheduler:
+        now = time.time()
+        due = []
+        for i in fetch_positions:
+            source = sources[i]
+            if scheduler.is_due(source, now):
+                due.append(i)
+            else:
+                results[i]["skip_reason"] = "not_due"
+                results[i]["next_due_at"] = scheduler.next_due_at(source)
+        fetch_positions = due
+
+    health = SourceHealth() if circuit_breaker else None
+    if health:
+        allowed = []
+        for i in fetch_positions:
+            source_id = sources[i].get('source_id')
+            if health.allow_request(source_id):
+                allowed.append(i)
+            else:
+                results[i]["skip_reason"] = "circuit_open"
+                results[i]["circuit_state"] = health.breaker_state(source_id)
+        fetch_positions = allowed
+
+    marks = SourceWatermarks() if watermarks else None
+    since_by_source: Dict[str, str] = {}
+    if marks:
+        for i in fetch_positions:
+            source_id = sources[i].get('source_id')
+            since = marks.since(source_id)
+            if since:
+                since_by_source[source_id] = since
+
+    # In batch mode RSS sources go through fetch_rss_feeds; everything else is fetched per source
+    batch_positions = [i for i in fetch_positions if sources[i].get('type') == 'rss'] if use_batch else []
+    batched = set(batch_positions)
+    single_positions = [i for i in fetch_positions if i not in batched]
+
+    # One fetch_rss_feeds call per chunk of RSS sources
+    chunks = [
+        batch_positions[i:i + HARVEST_BATCH_SIZE]
+        for i in range(0, len(batch_positions), HARVEST_BATCH_SIZE)
+    ]
+
+    async def run_batches() -> List[List[Dict[str, Any]]]:
+        # One chunk at a time: each fetch_rss_feeds call applies the full
+        # concurrency / per-host budget, so concurrent chunks would multiply it
+        chunk_results = []
+        for chunk in chunks:
+            chunk_results.append(await _harvest_batch(
+                [sources[i] for i in chunk],
+                time_window_hours,
+                max_items_per_source,
+                concurrency,
+                per_host_limit,
+                since_by_source,
+            ))
+        return chunk_results
+
+    # Fetch the remaining sources concurrently (gather keeps source order)
+    global_limit = asyncio.Semaphore(concurrency)
+    host_limits: Dict[str, asyncio.Semaphore] = {}
+    single_tasks = []
+    for i in single_positions:
+        source = sources[i]
+        host = source_host(source.get('url'))
+        if host not in host_limits:
+            host_limits[host] = asyncio.Semaphore(per_host_limit)
+        single_tasks.append(_harvest_source(
+            source,
+            time_window_hours,
+            max_items_per_source,
+            global_limit,
+            host_limits[host],
+            since_by_source.get(source.get('source_id')),
+        ))
+
+    chunk_results, single_results = await asyncio.gather(
+        run_batches(), asyncio.gather(*single_tasks)
+    )
+    for chunk, chunk_result in zip(chunks, chunk_results):
+        for i, result in zip(chunk, chunk_result):
+            results[i] = result
+    for i, result in zip(single_positions, single_results):
+        results[i] = result
+
+    wall_clock_ms = int((time.perf_counter() - start) * 1000)
+
+    websub_batches = _apply_pushes(sources, results, push_batches) if push_batches else []
+
+    pending_watermarks: Dict[str, Dict[str, Any]] = {}
+    if marks:
+        for source, result in zip(sources, results):
+            if result["status"] != "ok":
+                continue
+            source_id = source.get('source_id')
+            new_articles = marks.filter_new(source_id, result["articles"])
+            result["already_seen"] = len(result["articles"]) - len(new_articles)
+            result["articles"] = new_articles
+            marks.advance(source_id, new_articles)
+        pending_watermarks = marks.pending()
+
+    if scheduler:
+        for source, result in zip(sources, results):
+            # Pushed sources weren't fetched: nothing to learn for their polling interval
+            if result["status"] == "ok" and not result.get("pushed"):
+                scheduler.record_fetch(source, result["articles"], not_modified=result["from_cache"])
+        scheduler.save()
+
+    source_health: Dict[str, Dict[str, Any]] = {}
+    if health:
+        for source, result in zip(sources, results):
+            source_id = source.get('source_id')
+            if result.get("pushed"):
+                continue
+            if result["status"] == "ok":
+                health.record_success(source_id, result["latency_ms"], result["raw_count"])
+            elif result["status"] == "error":
+                health.record_failure(source_id, result.get("error", "Fetch failed"), result["latency_ms"])
+            else:
+                continue
+            result["circuit_state"] = health.breaker_state(source_id)
+        # Only Firestore sources have a /sources document to mirror health onto
+        firestore_ids = {source.get('source_id') for source in sources if source.get('origin') == 'firestore'}
+        source_health = {
+            source_id: record for source_id, record in health.changed_records().items()
+            if source_id in firestore_ids
+        }
+        health.save()
+
     all_articles = []
-    total_fetched = 0
+    source_stats = []
+    for result in results:
+        all_articles.extend(result.pop("articles"))
+        source_stats.append(result)
 
-    for source in sources:
-        source_type = source.get('type')
-        source_id = source.get('source_id')
-        source_url = source.get('url')
-        category = source.get('category')
-
-        if source_type == 'rss':
-            # Fetch RSS feed via MCP
-            raw_articles = await fetch_rss(
-                feed_url=source_url,
-                time_window_hours=time_window_hours,
-                max_items=max_items_per_source,
-                request_id=f"harvest_{source_id}"
-            )
-
-            # Normalize each article
-            for raw in raw_articles:
-                normalized = normalize_article(raw, source_id, category)
-                all_articles.append(normalized)
-
-            total_fetched += len(raw_articles)
-
-        # TODO Phase 6: Handle 'api' and 'web' source types
-        # elif source_type == 'api':
-        #     raw_articles = await fetch_api_feed(...)
-        # elif source_type == 'web':
-        #     raw_articles = await fetch_webpage(...)
+    enriched = 0
+    if enrich:
+        enriched = (await enrich_articles(all_articles, concurrency=concurrency, per_host_limit=per_host_limit))["enriched"]
+
+    total_fetched = sum(r["raw_count"] for r in source_stats)
+    failed_sources = sum(1 for r in source_stats if r["status"] == "error")
+    sources_not_due = sum(1 for r in source_stats if r.get("skip_reason") == "not_due")
+    sources_circuit_open = sum(1 for r in source_stats if r.get("skip_reason") == "circuit_open")
+    source_time_ms = sum(r["latency_ms"] for r in source_stats)
+    cache_hits = sum(1 for r in source_stats if r["from_cache"])
+    bytes_downloaded = sum(r["bytes_downloaded"] for r in source_stats)
+    bytes_transferred = sum(r["bytes_transferred"] for r in source_stats)
+    bytes_saved = sum(r["bytes_saved"] for r in source_stats)
+    parse_ms_saved = sum(r["parse_ms_saved"] for r in source_stats)
+    already_seen = sum(r["already_seen"] for r in source_stats)
+    sources_pushed = sum(1 for r in source_stats if r.get("skip_reason") == "push")
+    push_articles = sum(r.get("push_articles", 0) for r in source_stats)
 
     logger.info(json.dumps({
         "severity": "INFO",
@@ -287,11 +1233,226 @@ async def harvest_all_sources(time_window_hours: int = 24, max_items_per_source:
         "operation": "harvest_all_sources",
         "source_count": len(sources),
         "total_fetched": total_fetched,
-        "articles_after_normalization": len(all_articles)
+        "articles_after_normalization": len(all_articles),
+        "failed_sources": failed_sources,
+        "sources_not_due": sources_not_due,
+        "sources_circuit_open": sources_circuit_open,
+        "wall_clock_ms": wall_clock_ms,
+        "source_time_ms": source_time_ms,
+        "cache_hits": cache_hits,
+        "bytes_downloaded": bytes_downloaded,
+        "bytes_transferred": bytes_transferred,
+        "bytes_saved": bytes_saved,
+        "parse_ms_saved": parse_ms_saved,
+        "already_seen": already_seen,
+        "watermarks_advanced": len(pending_watermarks),
+        "enriched": enriched,
+        "sources_pushed": sources_pushed,
+        "push_articles": push_articles,
+        "websub_batches": len(websub_batches)
     }))
 
     return {
         "articles": all_articles,
         "source_count": len(sources),
-        "total_fetched": total_fetched
+        "total_fetched": total_fetched,
+        "failed_sources": failed_sources,
+        "sources_not_due": sources_not_due,
+        "sources_circuit_open": sources_circuit_open,
+        "wall_clock_ms": wall_clock_ms,
+        "source_time_ms": source_time_ms,
+        "cache_hits": cache_hits,
+        "bytes_downloaded": bytes_downloaded,
+        "bytes_transferred": bytes_transferred,
+        "bytes_saved": bytes_saved,
+        "parse_ms_saved": parse_ms_saved,
+        "source_stats": source_stats,
+        "source_health": source_health,
+        "already_seen": already_seen,
+        "watermarks": pending_watermarks,
+        "enriched": enriched,
+        "sources_pushed": sources_pushed,
+        "push_articles": push_articles,
+        "websub_batches": websub_batches
     }
+
+
+async def iter_harvested_articles(
+    time_window_hours: int = 24,
+    max_items_per_source: int = 50,
+    concurrency: Optional[int] = None,
+    per_host_limit: Optional[int] = None,
+    stats: Optional[Dict[str, Any]] = None,
+    watermarks: Optional[bool] = None,
+    circuit_breaker: Optional[bool] = None,
+    adaptive_schedule: Optional[bool] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Streaming counterpart of harvest_all_sources.
+
+    Yields normalized articles as soon as each feed is parsed by the MCP
+    service (via fetch_rss_feeds/stream), so scoring can start before the
+    slowest feed returns and the full harvest never has to sit in memory.
+    Articles arrive in completion order, not source order. Only RSS sources
+    are streamed; API sources are harvested by harvest_all_sources. The
+    adaptive schedule and the circuit breaker apply as in
+    harvest_all_sources: sources that aren't due or whose breaker is open
+    are skipped, and every fetch outcome is recorded.
+
+    Args:
+        time_window_hours: Only fetch articles from last N hours
+        max_items_per_source: Max articles per source
+        concurrency: Max sources fetched at once (defaults to HARVEST_CONCURRENCY)
+        per_host_limit: Max sources fetched at once per host (defaults to HARVEST_PER_HOST_LIMIT)
+        stats: Optional dict filled in once the stream ends with the same
+               summary fields as harvest_all_sources (except articles),
+               including the pending watermarks to commit
+        watermarks: Only yield entries newer than each source's watermark (defaults to HARVEST_WATERMARKS)
+        circuit_breaker: Skip sources with an open breaker (defaults to HARVEST_CIRCUIT_BREAKER)
+        adaptive_schedule: Only fetch sources that are due (defaults to HARVEST_ADAPTIVE_SCHEDULE)
+
+    Yields:
+        Normalized article dicts
+    """
+    watermarks = HARVEST_WATERMARKS if watermarks is None else watermarks
+    circuit_breaker = HARVEST_CIRCUIT_BREAKER if circuit_breaker is None else circuit_breaker
+    adaptive_schedule = HARVEST_ADAPTIVE_SCHEDULE if adaptive_schedule is None else adaptive_schedule
+    all_rss = [s for s in load_sources() if s.get('type') == 'rss']
+    start = time.perf_counter()
+
+    scheduler = PollScheduler() if adaptive_schedule else None
+    health = SourceHealth() if circuit_breaker else None
+    skipped: List[Dict[str, Any]] = []
+    sources = []
+    now = time.time()
+    for source in all_rss:
+        source_id = source.get('source_id')
+        if scheduler and not scheduler.is_due(source, now):
+            record = _new_source_result(source)
+            record["skip_reason"] = "not_due"
+            record["next_due_at"] = scheduler.next_due_at(source)
+            skipped.append(record)
+        elif health and not health.allow_request(source_id):
+            record = _new_source_result(source)
+            record["skip_reason"] = "circuit_open"
+            record["circuit_state"] = health.breaker_state(source_id)
+            skipped.append(record)
+        else:
+            sources.append(source)
+    records = [_new_source_result(source) for source in sources]
+
+    marks = SourceWatermarks() if watermarks else None
+    # Identity fields of the articles yielded per source, to advance watermarks
+    # and learn polling intervals at the end
+    seen: List[List[Dict[str, Any]]] = [[] for _ in sources]
+
+    feeds = [
+        {
+            "feed_url": source.get('url'),
+            "time_window_hours": time_window_hours,
+            "max_items": max_items_per_source,
+            "since": marks.since(source.get('source_id')) if marks else None,
+            "request_id": f"harvest_{source.get('source_id')}"
+        }
+        for source in sources
+    ]
+
+    if feeds:
+        try:
+            async for event in stream_rss_batch(
+                feeds,
+                concurrency=concurrency,
+                per_host_limit=per_host_limit,
+                request_id=f"harvest_stream_{len(feeds)}"
+            ):
+                event_type = event.get("type")
+                index = event.get("index")
+                if event_type == "article":
+                    source = sources[index]
+                    raw = event["article"]
+                    records[index]["raw_count"] += 1
+                    if marks and not marks.is_new(source.get('source_id'), raw):
+                        records[index]["already_seen"] += 1
+                        continue
+                    seen[index].append({k: raw.get(k) for k in ("guid", "url", "published_at", "date_missing")})
+                    yield normalize_article(raw, source.get('source_id'), source.get('category'))
+                elif event_type == "feed":
+                    record = records[index]
+                    record["status"] = "ok"
+                    record["latency_ms"] = event.get('latency_ms', 0)
+                    record["from_cache"] = event.get('from_cache', False)
+                    record["bytes_downloaded"] = event.get('bytes_downloaded', 0)
+                    record["bytes_transferred"] = event.get('bytes_transferred', 0)
+                    record["bytes_saved"] = event.get('bytes_saved', 0)
+                    record["parse_ms_saved"] = event.get('parse_ms_saved', 0)
+                    record["throttle_wait_ms"] = event.get('throttle_wait_ms', 0)
+                elif event_type == "error":
+                    records[index]["status"] = "error"
+                    records[index]["error"] = (event.get("error") or {}).get("message", "Feed fetch failed")
+        except Exception as e:
+            _log_fetch_error("iter_harvested_articles", f"<stream of {len(feeds)}>", e)
+            for record in records:
+                if record["status"] == "skipped":
+                    record["status"] = "error"
+                    record["error"] = str(e)
+        else:
+            # A stream that closed cleanly but early never reported these feeds
+            for record in records:
+                if record["status"] == "skipped":
+                    record["status"] = "error"
+                    record["error"] = "stream ended early"
+
+    pending_watermarks: Dict[str, Dict[str, Any]] = {}
+    if marks:
+        for source, record, articles in zip(sources, records, seen):
+            if record["status"] == "ok":
+                marks.advance(source.get('source_id'), articles)
+        pending_watermarks = marks.pending()
+
+    if scheduler:
+        for source, record, articles in zip(sources, records, seen):
+            if record["status"] == "ok":
+                scheduler.record_fetch(source, articles, not_modified=record["from_cache"])
+        scheduler.save()
+
+    source_health: Dict[str, Dict[str, Any]] = {}
+    if health:
+        for source, record in zip(sources, records):
+            source_id = source.get('source_id')
+            if record["status"] == "ok":
+                health.record_success(source_id, record["latency_ms"], record["raw_count"])
+            elif record["status"] == "error":
+                health.record_failure(source_id, record.get("error", "Fetch failed"), record["latency_ms"])
+            else:
+                continue
+            record["circuit_state"] = health.breaker_state(source_id)
+        # Only Firestore sources have a /sources document to mirror health onto
+        firestore_ids = {source.get('source_id') for source in sources if source.get('origin') == 'firestore'}
+        source_health = {
+            source_id: record for source_id, record in health.changed_records().items()
+            if source_id in firestore_ids
+        }
+        health.save()
+
+    if stats is not None:
+        records += skipped
+        for record in records:
+            record.pop("articles", None)
+        stats.update({
+            "source_count": len(all_rss),
+            "total_fetched": sum(r["raw_count"] for r in records),
+            "failed_sources": sum(1 for r in records if r["status"] == "error"),
+            "wall_clock_ms": int((time.perf_counter() - start) * 1000),
+            "source_time_ms": sum(r["latency_ms"] for r in records),
+            "cache_hits": sum(1 for r in records if r["from_cache"]),
+            "bytes_downloaded": sum(r["bytes_downloaded"] for r in records),
+            "bytes_transferred": sum(r["bytes_transferred"] for r in records),
+            "bytes_saved": sum(r["bytes_saved"] for r in records),
+            "parse_ms_saved": sum(r["parse_ms_saved"] for r in records),
+            "already_seen": sum(r["already_seen"] for r in records),
+            "sources_not_due": sum(1 for r in skipped if r["skip_reason"] == "not_due"),
+            "sources_circuit_open": sum(1 for r in skipped if r["skip_reason"] == "circuit_open"),
+            "source_stats": records,
+            "source_health": source_health,
+            "watermarks": pending_watermarks
+        })
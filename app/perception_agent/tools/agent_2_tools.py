@@ -9,6 +9,20 @@ Implementation details (Firestore CRUD) will be added in later phases.
 
 from typing import Any, Dict, List, Optional
 
+from .keyword_matcher import invalidate_compiled_topics
+
+# Lazy-initialized Firestore client
+_db_client = None
+
+
+def _get_db():
+    """Get or initialize Firestore client."""
+    global _db_client
+    if _db_client is None:
+        from google.cloud import firestore
+        _db_client = firestore.Client()
+    return _db_client
+
 
 def get_active_topics(user_id: str) -> List[Dict[str, Any]]:
     """
@@ -30,6 +44,52 @@ def get_active_topics(user_id: str) -> List[Dict[str, Any]]:
     return []
 
 
+def get_all_active_topics() -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Retrieve the active topics of every user, for multi-user ingestion.
+
+    One collection group query over /users/{user_id}/topics where
+    active == true.
+
+    Returns:
+        user_id -> list of topic dicts (same fields as get_active_topics);
+        users without active topics are absent
+    """
+    topics_by_user: Dict[str, List[Dict[str, Any]]] = {}
+    query = _get_db().collection_group("topics").where("active", "==", True)
+    for doc in query.stream():
+        user_ref = doc.reference.parent.parent
+        if user_ref is None or user_ref.parent.id != "users":
+            continue  # a "topics" collection somewhere else
+        topics_by_user.setdefault(user_ref.id, []).append({"topic_id": doc.id, **(doc.to_dict() or {})})
+    return topics_by_user
+
+
+def topic_set_version(user_id: Optional[str], topics: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Version of a user's active topic set, for Agent 3's compiled matcher cache.
+
+    Built from the topic count and the newest updatedAt, so it changes on
+    every create / update and on deletes (which also invalidate it via
+    delete_topic).
+
+    Returns:
+        "<user_id>:<count>:<newest updatedAt>", or None if any topic has no
+        updatedAt (the cache then keys by the topics' content instead)
+    """
+    if not user_id or not topics:
+        return None
+    newest = None
+    for topic in topics:
+        updated = topic.get("updatedAt") or topic.get("updated_at")
+        if updated is None:
+            return None
+        updated = updated.isoformat() if hasattr(updated, "isoformat") else str(updated)
+        if newest is None or updated > newest:
+            newest = updated
+    return f"{user_id}:{len(topics)}:{newest}"
+
+
 def create_topic(user_id: str, topic_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Stub: Create a new topic for a user.
@@ -42,6 +102,7 @@ def create_topic(user_id: str, topic_data: Dict[str, Any]) -> Dict[str, Any]:
         Created topic dict with generated topic_id.
     """
     # TODO: implement Firestore write to /users/{user_id}/topics/{topic_id}
+    invalidate_compiled_topics(user_id)
     return {
         "topic_id": "generated_id",
         **topic_data,
@@ -63,6 +124,7 @@ def update_topic(
         Updated topic dict.
     """
     # TODO: implement Firestore update
+    invalidate_compiled_topics(user_id)
     return {
         "topic_id": topic_id,
         **updates,
@@ -81,6 +143,7 @@ def delete_topic(user_id: str, topic_id: str) -> bool:
         True if deleted successfully.
     """
     # TODO: implement Firestore delete
+    invalidate_compiled_topics(user_id)
     return True
 
 
@@ -7,20 +7,35 @@ and filter by relevance thresholds.
 Phase E2E: Implements production-ready scoring with keyword matching + basic heuristics.
 """
 
-from typing import Any, Dict, List
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+import os
+import heapq
 import logging
 import json
 
+from .keyword_matcher import TopicMatcher, compile_topics, compile_user_topics, topic_matcher_stats
+from .batch_scoring import aggregate_scores, match_hits, numpy_available
+
 logger = logging.getLogger(__name__)
 
+# SCORE_BATCH: score the whole harvest as NumPy columns (falls back to the
+# per-article loop when NumPy isn't installed)
+SCORE_BATCH = os.getenv("SCORE_BATCH", "false").lower() == "true"
+
 
-def score_articles(articles: List[Dict[str, Any]], topics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def score_articles(
+    articles: List[Dict[str, Any]],
+    topics: List[Dict[str, Any]],
+    topics_version: Optional[str] = None,
+) -> List[Dict[str, Any]]:
     """
     Score all articles against topics using keyword matching and heuristics.
 
     Args:
         articles: List of article dicts from Agent 1
         topics: List of topic dicts from Agent 2
+        topics_version: Optional topic set version (agent_2_tools.topic_set_version)
+            for the compiled matcher cache
 
     Returns:
         List of scored article dicts with:
@@ -39,27 +54,171 @@ def score_articles(articles: List[Dict[str, Any]], topics: List[Dict[str, Any]])
         "topic_count": len(topics)
     }))
 
-    for article in articles:
-        score_result = _score_single_article(article, topics)
-
-        # Merge score results into article
-        scored_article = {**article, **score_result}
-        scored_articles.append(scored_article)
+    # One automaton for every topic keyword, reused for all articles (and runs)
+    matcher = compile_topics(topics, version=topics_version)
+    batch = SCORE_BATCH and numpy_available()
+
+    if batch:
+        columns = score_article_columns(articles, topics, topics_version)
+        for article, score, tags, section, topic_ids in zip(
+            articles,
+            columns["relevance_score"].tolist(),
+            columns["ai_tags"],
+            columns["section"],
+            columns["matched_topics"],
+        ):
+            scored_articles.append({
+                **article,
+                "relevance_score": score,
+                "ai_tags": tags,
+                "section": section,
+                "matched_topics": topic_ids,
+            })
+    else:
+        for article in articles:
+            score_result = _score_single_article(article, matcher)
+
+            # Merge score results into article
+            scored_article = {**article, **score_result}
+            scored_articles.append(scored_article)
 
     logger.info(json.dumps({
         "severity": "INFO",
         "tool": "agent_3",
         "operation": "score_articles",
         "scored_count": len(scored_articles),
+        "mode": "batch" if batch else "per_article",
+        "keyword_count": matcher.keyword_count,
+        "topic_cache": topic_matcher_stats(),
         "avg_score": sum(a.get("relevance_score", 0) for a in scored_articles) / len(scored_articles) if scored_articles else 0
     }))
 
     return scored_articles
 
 
-def _score_single_article(article: Dict[str, Any], topics: List[Dict[str, Any]]) -> Dict[str, Any]:
+def score_article_columns(
+    articles: List[Dict[str, Any]],
+    topics: List[Dict[str, Any]],
+    topics_version: Optional[str] = None,
+) -> Dict[str, Any]:
     """
-    Score a single article against all topics.
+    Score a batch of articles with NumPy, returning columns instead of dicts.
+
+    Same scores as score_articles; requires NumPy (see batch_scoring).
+
+    Args:
+        articles: List of article dicts from Agent 1
+        topics: List of topic dicts from Agent 2
+        topics_version: Optional topic set version for the compiled matcher cache
+
+    Returns:
+        Dict of columns aligned with articles:
+        - relevance_score: int ndarray (1-10)
+        - matched_topics: list of topic_id lists
+        - ai_tags: list of tag lists
+        - matched_keywords: list of keyword lists
+        - section: list of section names
+    """
+    matcher = compile_topics(topics, version=topics_version)
+    texts = [_article_text(article) for article in articles]
+    hits = match_hits(matcher, [(title, content) for title, content, _ in texts])
+    columns = aggregate_scores(matcher, len(articles), hits)
+    columns["section"] = [
+        _infer_section(category, title, content, keywords)
+        for (title, content, category), keywords in zip(texts, columns["matched_keywords"])
+    ]
+    return columns
+
+
+def score_articles_for_users(
+    articles: List[Dict[str, Any]],
+    topics_by_user: Dict[str, List[Dict[str, Any]]],
+    unmatched_limit: int = 10,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Score articles against every user's topics in one pass.
+
+    Each article is scanned once against all users' keywords (an inverted
+    keyword -> (user, topic) index, see keyword_matcher.compile_user_topics)
+    and its section is inferred once. Per user, the result is what
+    score_articles(articles, that user's topics) returns, except that
+    articles matching none of the user's topics (default score 5) are only
+    kept up to unmatched_limit per section, in harvest order: enough for
+    filter_top_articles (which ranks those per section) to fill its
+    per-section limit, without materializing every article for every user.
+
+    Args:
+        articles: List of article dicts from Agent 1
+        topics_by_user: user_id -> topic dicts (agent_2_tools.get_all_active_topics)
+        unmatched_limit: Unmatched articles kept per user and section
+            (filter_top_articles' max_per_topic)
+
+    Returns:
+        user_id -> scored article dicts, in harvest order
+    """
+    matcher = compile_user_topics(topics_by_user)
+    scored_by_user: Dict[str, List[Dict[str, Any]]] = {user_id: [] for user_id in matcher.user_ids}
+    unmatched_counts: Dict[Tuple[str, str], int] = {}
+    # section -> users still taking unmatched articles in it
+    open_users: Dict[str, set] = {}
+    hit_count = 0
+
+    for article in articles:
+        title, content_lower, category = _article_text(article)
+        # The section doesn't depend on the matched keywords, so it's shared by all users
+        section = _infer_section(category, title, content_lower, [])
+
+        matched_users = set()
+        for user_id, topic_matches, matched_keywords in matcher.match(title, content_lower):
+            matched_users.add(user_id)
+            hit_count += 1
+            scored_by_user[user_id].append({**article, **_score_result(topic_matches, matched_keywords, section)})
+
+        section_users = open_users.get(section)
+        if section_users is None:
+            section_users = open_users[section] = set(matcher.user_ids) if unmatched_limit > 0 else set()
+        for user_id in section_users - matched_users:
+            scored_by_user[user_id].append({**article, **_score_result([], [], section)})
+            count = unmatched_counts[user_id, section] = unmatched_counts.get((user_id, section), 0) + 1
+            if count >= unmatched_limit:
+                section_users.discard(user_id)
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "tool": "agent_3",
+        "operation": "score_articles_for_users",
+        "article_count": len(articles),
+        "user_count": len(matcher.user_ids),
+        "keyword_count": matcher.keyword_count,
+        "user_article_matches": hit_count,
+        "topic_cache": topic_matcher_stats()
+    }))
+
+    return scored_by_user
+
+
+async def score_article_stream(
+    articles: AsyncIterable[Dict[str, Any]], topics: List[Dict[str, Any]]
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Score articles as they arrive from an async source (e.g. Agent 1's
+    iter_harvested_articles), without waiting for the whole harvest.
+
+    Args:
+        articles: Async iterable of article dicts
+        topics: List of topic dicts from Agent 2
+
+    Yields:
+        Scored article dicts (same fields as score_articles)
+    """
+    matcher = compile_topics(topics)
+    async for article in articles:
+        yield {**article, **_score_single_article(article, matcher)}
+
+
+def _score_single_article(article: Dict[str, Any], matcher: TopicMatcher) -> Dict[str, Any]:
+    """
+    Score a single article against all topics (compiled into matcher).
 
     Returns dict with:
     - relevance_score: 1-10
@@ -67,42 +226,30 @@ def _score_single_article(article: Dict[str, Any], topics: List[Dict[str, Any]])
     - section: inferred section name
     - matched_topics: list of topic IDs
     """
-    title = article.get("title", "").lower()
-    content = article.get("content", "") or article.get("content_snippet", "") or article.get("summary", "")
-    content_lower = content.lower() if content else ""
-    category = article.get("category", "").lower()
+    title, content_lower, category = _article_text(article)
+
+    # Match against topics: title match worth 3, content match worth 1
+    topic_matches, matched_keywords = matcher.match(title, content_lower)
+
+    # Infer section based on category or content
+    section = _infer_section(category, title, content_lower, matched_keywords)
+
+    return _score_result(topic_matches, matched_keywords, section)
 
+
+def _score_result(topic_matches: List[Tuple[str, int]], matched_keywords: List[str], section: str) -> Dict[str, Any]:
+    """Score fields from an article's (topic_id, keyword points) matches."""
     matched_topics = []
-    matched_keywords = []
     topic_scores = {}
-
-    # Match against topics
-    for topic in topics:
-        topic_id = topic.get("topic_id", "")
-        keywords = topic.get("keywords", [])
-
-        matches = 0
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            if keyword_lower in title:
-                matches += 3  # Title match worth more
-                matched_keywords.append(keyword)
-            elif keyword_lower in content_lower:
-                matches += 1
-                matched_keywords.append(keyword)
-
-        if matches > 0:
-            # Score 1-10 based on matches
-            topic_score = min(10, matches + 3)  # At least 4 if any match
-            topic_scores[topic_id] = topic_score
-            matched_topics.append(topic_id)
+    for topic_id, matches in topic_matches:
+        # Score 1-10 based on matches
+        topic_score = min(10, matches + 3)  # At least 4 if any match
+        topic_scores[topic_id] = topic_score
+        matched_topics.append(topic_id)
 
     # Overall relevance score
     relevance_score = max(topic_scores.values()) if topic_scores else 5  # Default 5 if no topic match
 
-    # Infer section based on category or content
-    section = _infer_section(category, title, content_lower, matched_keywords)
-
     # Generate AI tags from matched keywords
     ai_tags = list(set(matched_keywords[:10]))  # Unique, max 10
 
@@ -114,6 +261,15 @@ def _score_single_article(article: Dict[str, Any], topics: List[Dict[str, Any]])
     }
 
 
+def _article_text(article: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Lowercased (title, content, category) an article is scored on."""
+    title = article.get("title", "").lower()
+    content = article.get("content", "") or article.get("content_snippet", "") or article.get("summary", "")
+    content_lower = content.lower() if content else ""
+    category = article.get("category", "").lower()
+    return title, content_lower, category
+
+
 def _infer_section(category: str, title: str, content: str, keywords: List[str]) -> str:
     """
     Infer section name based on category and content.
@@ -151,33 +307,83 @@ def _infer_section(category: str, title: str, content: str, keywords: List[str])
     return "General"
 
 
-def filter_top_articles(scored_articles: List[Dict[str, Any]], max_per_topic: int = 10, min_score: int = 5) -> List[Dict[str, Any]]:
+class TopArticleSelector:
+    """
+    Streaming top-k selection for filter_top_articles.
+
+    Keeps a bounded min-heap per topic (articles matching several topics
+    compete in each) and, for articles matching no topic, per section; the
+    heap root is the entry to evict: lowest score, latest arrival on ties.
+    add() is O(log k), so a harvest of n articles costs O(n log k) and never
+    needs to be held in memory. Feed it from a sync loop or an async stream
+    (e.g. score_article_stream), then call results().
+    """
+
+    def __init__(self, max_per_topic: int = 10, min_score: int = 5):
+        self.max_per_topic = max_per_topic
+        self.min_score = min_score
+        self.input_count = 0
+        self._heaps: Dict[Tuple[str, str], List[Tuple[int, int, Dict[str, Any]]]] = {}
+
+    def add(self, article: Dict[str, Any]) -> None:
+        seq = self.input_count
+        self.input_count += 1
+        score = article.get("relevance_score", 0)
+        if score < self.min_score or self.max_per_topic <= 0:
+            return
+
+        groups = [("topic", topic_id) for topic_id in article.get("matched_topics") or []]
+        if not groups:
+            groups = [("section", article.get("section", "General"))]
+        entry = (score, -seq, article)
+        for group in groups:
+            heap = self._heaps.setdefault(group, [])
+            if len(heap) < self.max_per_topic:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+
+    @property
+    def group_count(self) -> int:
+        return len(self._heaps)
+
+    def results(self) -> List[Dict[str, Any]]:
+        """Kept articles (each once), by relevance_score descending, then arrival order."""
+        kept: Dict[int, Tuple[int, int, Dict[str, Any]]] = {}
+        for heap in self._heaps.values():
+            for entry in heap:
+                kept[-entry[1]] = entry
+        return [article for _, _, article in sorted(kept.values(), key=lambda e: (-e[0], -e[1]))]
+
+
+def filter_top_articles(
+    scored_articles: Iterable[Dict[str, Any]], max_per_topic: int = 10, min_score: int = 5
+) -> List[Dict[str, Any]]:
     """
     Filter scored articles to keep only top articles.
 
     Args:
-        scored_articles: List of scored articles
-        max_per_topic: Max articles to keep overall
+        scored_articles: Scored articles (any iterable, e.g. a generator)
+        max_per_topic: Max articles to keep per topic (articles matching no
+            topic: per section)
         min_score: Minimum relevance score to keep
 
     Returns:
         Filtered list of top articles sorted by relevance_score descending
     """
-    # Filter by minimum score
-    filtered = [a for a in scored_articles if a.get("relevance_score", 0) >= min_score]
-
-    # Sort by relevance score descending
-    filtered.sort(key=lambda x: x.get("relevance_score", 0), reverse=True)
-
-    # Take top N
-    top_articles = filtered[:max_per_topic * 5]  # max_per_topic * 5 for multiple topics
+    selector = TopArticleSelector(max_per_topic=max_per_topic, min_score=min_score)
+    for article in scored_articles:
+        selector.add(article)
+    top_articles = selector.results()
 
     logger.info(json.dumps({
         "severity": "INFO",
         "tool": "agent_3",
         "operation": "filter_top_articles",
-        "input_count": len(scored_articles),
+        "input_count": selector.input_count,
         "output_count": len(top_articles),
+        "group_count": selector.group_count,
+        "max_per_topic": max_per_topic,
         "min_score": min_score
     }))
 
@@ -13,6 +13,7 @@ from datetime import datetime, timezone
 import logging
 import json
 import hashlib
+from google.api_core.exceptions import NotFound
 from google.cloud import firestore
 
 logger = logging.getLogger(__name__)
@@ -252,6 +253,161 @@ def update_ingestion_run(run_id: str, status: str, stats: Dict[str, Any] | None
         }
 
 
+def update_source_health(health_records: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Mirror harvester circuit-breaker/health records onto /sources documents.
+
+    Feeds the dashboard's SourceHealthCard. Only health fields are updated;
+    source configuration (and updatedAt) is left untouched. Only existing
+    documents are updated: sources that live only in the CSV / YAML have no
+    /sources document, and one holding nothing but health fields would
+    shadow the real source in the registry, so missing documents are skipped.
+
+    Args:
+        health_records: Records keyed by source_id, as returned in
+                        harvest_all_sources()["source_health"] (Firestore
+                        sources only).
+
+    Returns:
+        Storage result with:
+        - updated_count (int): Number of source documents updated
+        - skipped_count (int): Records whose /sources document doesn't exist
+        - errors (list): Any failed writes
+    """
+    if not health_records:
+        return {"updated_count": 0, "skipped_count": 0, "errors": []}
+
+    db = _get_db()
+    errors = []
+    updated_count = 0
+    skipped_count = 0
+
+    def _ts(epoch_seconds):
+        return datetime.fromtimestamp(epoch_seconds, tz=timezone.utc) if epoch_seconds else None
+
+    # One update() per document (not a batch): a missing document fails only its own write
+    for source_id, record in health_records.items():
+        last_error = record.get("last_error")
+        doc = {
+            "status": "failed" if record.get("state") == "open" else "active",
+            "circuitState": record.get("state", "closed"),
+            "consecutiveFailures": record.get("consecutive_failures", 0),
+            "avgLatencyMs": record.get("avg_latency_ms"),
+            "lastChecked": _ts(record.get("last_checked")),
+            "lastSuccess": _ts(record.get("last_success")),
+            "lastError": {
+                "message": last_error.get("message"),
+                "timestamp": _ts(last_error.get("timestamp"))
+            } if last_error else None,
+            "articlesLast24h": record.get("last_article_count", 0),
+        }
+        try:
+            db.collection("sources").document(source_id).update(doc)
+            updated_count += 1
+        except NotFound:
+            skipped_count += 1
+        except Exception as e:
+            error_msg = f"Source health write failed for {source_id}: {str(e)}"
+            errors.append(error_msg)
+            logger.error(json.dumps({
+                "severity": "ERROR",
+                "tool": "agent_7",
+                "operation": "update_source_health",
+                "error": error_msg
+            }))
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "tool": "agent_7",
+        "operation": "update_source_health",
+        "updated_count": updated_count,
+        "skipped_count": skipped_count,
+        "error_count": len(errors)
+    }))
+
+    return {
+        "updated_count": updated_count,
+        "skipped_count": skipped_count,
+        "errors": errors
+    }
+
+
+def store_user_selections(run_id: str, selections: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Write each user's selected articles to /users/{user_id}/selections/{run_id}.
+
+    Selections reference the articles stored in /articles (by article_id)
+    and carry the user-specific score fields; article bodies aren't copied.
+
+    Args:
+        run_id: Ingestion run ID.
+        selections: user_id -> that user's selected (scored) articles.
+
+    Returns:
+        Storage result with:
+        - stored_count (int): Number of user selection documents written
+        - errors (list): Any failed writes
+    """
+    if not selections:
+        return {"stored_count": 0, "errors": []}
+
+    db = _get_db()
+    errors = []
+    stored_count = 0
+    created_at = datetime.now(timezone.utc).isoformat()
+    items = list(selections.items())
+
+    # Firestore batches limited to 500 operations
+    for i in range(0, len(items), 500):
+        batch = db.batch()
+        try:
+            for user_id, articles in items[i:i + 500]:
+                doc = {
+                    "run_id": run_id,
+                    "created_at": created_at,
+                    "article_count": len(articles),
+                    "articles": [
+                        {
+                            "article_id": _generate_article_id(article.get("url", "")),
+                            "url": article.get("url"),
+                            "title": article.get("title"),
+                            "relevance_score": article.get("relevance_score"),
+                            "matched_topics": article.get("matched_topics", []),
+                            "ai_tags": article.get("ai_tags", []),
+                            "section": article.get("section"),
+                        }
+                        for article in articles
+                    ],
+                }
+                doc_ref = db.collection("users").document(user_id).collection("selections").document(run_id)
+                batch.set(doc_ref, doc)
+            batch.commit()
+            stored_count += len(items[i:i + 500])
+        except Exception as e:
+            error_msg = f"User selection write failed: {str(e)}"
+            errors.append(error_msg)
+            logger.error(json.dumps({
+                "severity": "ERROR",
+                "tool": "agent_7",
+                "operation": "store_user_selections",
+                "error": error_msg
+            }))
+
+    logger.info(json.dumps({
+        "severity": "INFO",
+        "tool": "agent_7",
+        "operation": "store_user_selections",
+        "run_id": run_id,
+        "stored_count": stored_count,
+        "error_count": len(errors)
+    }))
+
+    return {
+        "stored_count": stored_count,
+        "errors": errors
+    }
+
+
 def deduplicate_by_url(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Remove duplicate articles by URL before storage.
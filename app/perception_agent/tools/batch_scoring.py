@@ -0,0 +1,153 @@
+"""
+Vectorised relevance scoring for Agent 3 (Relevance & Ranking).
+
+Batch counterpart of _score_single_article: the keyword automaton still
+scans each article (TopicMatcher.find), but everything after it runs as
+NumPy array operations over the whole batch:
+
+- every (article, keyword) hit becomes a row of sparse triplets
+  (article, topic, points) with points 3 for a title hit, 1 for content only
+- points are summed per (article, topic) pair, clamped with min(10, points + 3)
+  and reduced with a max over each article's topics (5 if none matched)
+- matched topics and keywords come out of the same sort, in topic / keyword
+  order
+
+Only matched pairs are materialized, so memory grows with the hits, not
+with articles x topics. NumPy is imported on first use; agent_3_tools falls
+back to the per-article loop when it isn't installed.
+"""
+
+from array import array
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .keyword_matcher import TopicMatcher
+
+# No topic matched: same default as the per-article loop
+DEFAULT_SCORE = 5
+MAX_SCORE = 10
+
+
+def numpy_available() -> bool:
+    """True if NumPy can be imported."""
+    try:
+        import numpy  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+Hits = Tuple[array, array, array]
+
+
+def match_hits(matcher: TopicMatcher, texts: Sequence[Tuple[str, str]]) -> Hits:
+    """
+    Run the keyword automaton over every (title, content) pair.
+
+    Returns:
+        Parallel int64 arrays (article index, pattern id, points) with one
+        row per keyword pattern found in an article
+    """
+    hit_articles = array("q")
+    hit_patterns = array("q")
+    hit_points = array("q")
+    for index, (title, content) in enumerate(texts):
+        in_title, in_content = matcher.find(title, content)
+        for pattern_id in in_title | in_content:
+            hit_articles.append(index)
+            hit_patterns.append(pattern_id)
+            hit_points.append(3 if pattern_id in in_title else 1)
+    return hit_articles, hit_patterns, hit_points
+
+
+def _entry_table(matcher: TopicMatcher):
+    """Pattern -> entries as CSR arrays: offsets, topic index, sort rank, keyword id."""
+    import numpy as np
+
+    offsets = [0]
+    topics: List[int] = []
+    ranks: List[int] = []
+    keywords: List[str] = []
+    width = 1 + max((k for entries in matcher.entries for _, k, _ in entries), default=0)
+    for entries in matcher.entries:
+        for topic_index, keyword_index, keyword in entries:
+            topics.append(topic_index)
+            ranks.append(topic_index * width + keyword_index)
+            keywords.append(keyword)
+        offsets.append(len(topics))
+    return (
+        np.asarray(offsets, dtype=np.int64),
+        np.asarray(topics, dtype=np.int64),
+        np.asarray(ranks, dtype=np.int64),
+        keywords,
+    )
+
+
+def aggregate_scores(
+    matcher: TopicMatcher, article_count: int, hits: Hits
+) -> Dict[str, Any]:
+    """
+    Turn match_hits output into score columns.
+
+    Returns:
+        Dict of columns, one value per article:
+        - relevance_score: int ndarray (1-10)
+        - matched_topics: list of topic_id lists, in topic order
+        - matched_keywords: list of keyword lists, in topic / keyword order
+        - ai_tags: list of tag lists (unique, from the first 10 keywords)
+    """
+    import numpy as np
+
+    hit_articles, hit_patterns, hit_points = (np.frombuffer(column, dtype=np.int64) for column in hits)
+    offsets, entry_topics, entry_ranks, keywords = _entry_table(matcher)
+
+    # Expand each pattern hit into its (topic, keyword) entries
+    starts = offsets[hit_patterns]
+    counts = offsets[hit_patterns + 1] - starts
+    rows = np.repeat(np.arange(len(hit_patterns)), counts)
+    first_row = np.cumsum(counts) - counts
+    entries = starts[rows] + (np.arange(len(rows)) - first_row[rows])
+    entry_articles = hit_articles[rows]
+    entry_points = hit_points[rows]
+
+    # One sort puts entries in article, topic, keyword order (rank = topic * width + keyword)
+    entry_ranks = entry_ranks[entries]
+    rank_span = int(entry_ranks.max()) + 1 if len(entry_ranks) else 1
+    order = np.argsort(entry_articles * rank_span + entry_ranks)
+    entry_articles = entry_articles[order]
+    entry_topics = entry_topics[entries][order]
+    matched_keyword_list = np.asarray(keywords, dtype=object)[entries[order]].tolist()
+
+    # Sparse article x topic points: sum per pair, clamp, max per article
+    scores = np.full(article_count, DEFAULT_SCORE, dtype=np.int64)
+    pair_articles = pair_topics = np.zeros(0, dtype=np.int64)
+    if len(order):
+        pair_starts = np.flatnonzero(np.r_[
+            True, (entry_articles[1:] != entry_articles[:-1]) | (entry_topics[1:] != entry_topics[:-1])
+        ])
+        pair_scores = np.minimum(MAX_SCORE, np.add.reduceat(entry_points[order], pair_starts) + 3)
+        pair_articles = entry_articles[pair_starts]
+        pair_topics = entry_topics[pair_starts]
+
+        group_starts = np.flatnonzero(np.r_[True, pair_articles[1:] != pair_articles[:-1]])
+        scores[pair_articles[group_starts]] = np.maximum.reduceat(pair_scores, group_starts)
+
+    # Per-article slices of the matched topics / keywords
+    topic_ids = np.asarray(matcher.topic_ids, dtype=object)
+    matched_topic_ids = topic_ids[pair_topics].tolist()
+    topic_bounds = np.searchsorted(pair_articles, np.arange(article_count + 1)).tolist()
+    keyword_bounds = np.searchsorted(entry_articles, np.arange(article_count + 1)).tolist()
+
+    matched_topics = [
+        matched_topic_ids[start:end] for start, end in zip(topic_bounds, topic_bounds[1:])
+    ]
+    matched_keywords = [
+        matched_keyword_list[start:end] for start, end in zip(keyword_bounds, keyword_bounds[1:])
+    ]
+    ai_tags = [list(set(article_keywords[:10])) for article_keywords in matched_keywords]
+
+    return {
+        "relevance_score": scores,
+        "matched_topics": matched_topics,
+        "matched_keywords": matched_keywords,
+        "ai_tags": ai_tags,
+    }
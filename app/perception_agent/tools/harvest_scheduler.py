@@ -0,0 +1,153 @@
+"""
+Adaptive per-source polling schedule for Agent 1 (Source Harvester).
+
+Learns how often each source publishes from the published_at values it
+returns, and backs off when a fetch brings nothing new (or the feed answers
+304 Not Modified). harvest_all_sources and iter_harvested_articles then only
+fetch sources that are due.
+
+Per-source bounds come from the source's min_poll_minutes / max_poll_minutes
+fields, falling back to SCHEDULE_MIN_INTERVAL_MINUTES / SCHEDULE_MAX_INTERVAL_MINUTES.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
+import os
+import json
+import logging
+import statistics
+
+from .state_store import load_state, save_state
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_MIN_INTERVAL_MINUTES = float(os.getenv("SCHEDULE_MIN_INTERVAL_MINUTES", "15"))
+SCHEDULE_MAX_INTERVAL_MINUTES = float(os.getenv("SCHEDULE_MAX_INTERVAL_MINUTES", "1440"))
+SCHEDULE_DEFAULT_INTERVAL_MINUTES = float(os.getenv("SCHEDULE_DEFAULT_INTERVAL_MINUTES", "60"))
+SCHEDULE_BACKOFF_FACTOR = float(os.getenv("SCHEDULE_BACKOFF_FACTOR", "1.5"))
+
+# Published timestamps kept per source for the interval estimate
+HISTORY_SIZE = 20
+
+# A source counts as due slightly early so runs on a fixed cadence (e.g. hourly
+# Cloud Scheduler) don't miss it by a few seconds of jitter
+DUE_TOLERANCE = 0.05
+
+STATE_NAMESPACE = "schedule"
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[float]:
+    """ISO 8601 string -> epoch seconds (None if missing or unparseable)."""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.timestamp()
+    except ValueError:
+        return None
+
+
+class PollScheduler:
+    """
+    Tracks per-source polling state.
+
+    State per source_id:
+    - last_fetched_at: epoch seconds of the last successful fetch
+    - interval_minutes: current polling interval
+    - published_history: most recent published_at values (epoch seconds, ascending)
+    - estimated_publish_minutes: median gap between published items
+    - last_not_modified: whether the last fetch was a 304
+    """
+
+    def __init__(self, state: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.state = load_state(STATE_NAMESPACE) if state is None else state
+        self._dirty: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def interval_bounds(source: Dict[str, Any]) -> Tuple[float, float]:
+        """(floor, ceiling) polling interval in minutes for a source."""
+        floor = float(source.get('min_poll_minutes') or SCHEDULE_MIN_INTERVAL_MINUTES)
+        ceiling = float(source.get('max_poll_minutes') or SCHEDULE_MAX_INTERVAL_MINUTES)
+        return floor, max(floor, ceiling)
+
+    def next_due_at(self, source: Dict[str, Any]) -> Optional[float]:
+        """Epoch seconds when the source is next due (None = never fetched)."""
+        record = self.state.get(source.get('source_id'))
+        if not record or not record.get('last_fetched_at'):
+            return None
+        floor, ceiling = self.interval_bounds(source)
+        interval = min(max(record.get('interval_minutes', SCHEDULE_DEFAULT_INTERVAL_MINUTES), floor), ceiling)
+        return record['last_fetched_at'] + interval * 60 * (1 - DUE_TOLERANCE)
+
+    def is_due(self, source: Dict[str, Any], now: Optional[float] = None) -> bool:
+        due_at = self.next_due_at(source)
+        now = datetime.now(tz=timezone.utc).timestamp() if now is None else now
+        return due_at is None or now >= due_at
+
+    def record_fetch(
+        self,
+        source: Dict[str, Any],
+        articles: List[Dict[str, Any]],
+        not_modified: bool = False,
+        now: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Update a source's schedule after a successful fetch.
+
+        New items pull the interval toward the learned publish interval;
+        a 304 or a fetch with nothing newer than before backs it off.
+        Articles flagged date_missing (published_at is just the fetch time)
+        are left out of the history.
+
+        Returns:
+            The updated state record
+        """
+        source_id = source.get('source_id')
+        now = datetime.now(tz=timezone.utc).timestamp() if now is None else now
+        record = dict(self.state.get(source_id) or {})
+        floor, ceiling = self.interval_bounds(source)
+
+        history: List[float] = list(record.get('published_history', []))
+        newest_known = history[-1] if history else None
+        published = [
+            ts for ts in (_parse_timestamp(a.get('published_at')) for a in articles if not a.get('date_missing'))
+            if ts
+        ]
+        has_new = any(newest_known is None or ts > newest_known for ts in published)
+
+        history = sorted(set(history) | set(published))[-HISTORY_SIZE:]
+        gaps = [b - a for a, b in zip(history, history[1:]) if b > a]
+        estimate = statistics.median(gaps) / 60 if gaps else None
+
+        interval = record.get('interval_minutes', SCHEDULE_DEFAULT_INTERVAL_MINUTES)
+        if has_new and not not_modified:
+            interval = estimate if estimate is not None else min(interval, SCHEDULE_DEFAULT_INTERVAL_MINUTES)
+        else:
+            interval = interval * SCHEDULE_BACKOFF_FACTOR
+        interval = min(max(interval, floor), ceiling)
+
+        record.update({
+            'last_fetched_at': now,
+            'interval_minutes': interval,
+            'published_history': history,
+            'estimated_publish_minutes': estimate,
+            'last_not_modified': not_modified,
+        })
+        self.state[source_id] = record
+        self._dirty[source_id] = record
+        return record
+
+    def save(self) -> bool:
+        """Persist records changed since the last save."""
+        ok = save_state(STATE_NAMESPACE, self._dirty)
+        if ok:
+            logger.info(json.dumps({
+                "severity": "INFO",
+                "tool": "agent_1",
+                "operation": "save_poll_schedule",
+                "updated_sources": len(self._dirty)
+            }))
+            self._dirty = {}
+        return ok
@@ -0,0 +1,349 @@
+"""
+Multi-keyword matching for Agent 3 (Relevance & Ranking).
+
+KeywordMatcher compiles a set of keywords into an Aho-Corasick automaton
+(flattened into a DFA: one dict lookup per character), so a text is scanned
+once for every keyword instead of once per keyword. Small keyword sets keep
+the plain substring checks, which are cheaper there.
+
+TopicMatcher wraps one for a topic list and reproduces the scoring rules of
+the per-keyword loop it replaces: case-insensitive substring matches, a
+keyword found in the title is worth 3 points, otherwise one found in the
+content is worth 1, and matched keywords are reported in topic / keyword
+order.
+
+compile_topics is the entry point: it normalizes the topics (keywords
+lowercased, empty and duplicate keywords within a topic dropped) and keeps
+the compiled matcher in an LRU keyed by a hash of the normalized topic set,
+so repeated runs for a user, and users sharing the same (e.g. default)
+topics, compile once. Callers that know a version of the topic set (Firestore
+updatedAt) can pass it to skip even the hashing; Agent 2 invalidates those
+versions whenever it writes a user's topics.
+
+compile_user_topics does the same for many users at once: UserTopicMatcher
+is an inverted index from keyword to (user, topic), so multi-user ingestion
+scans each article once whatever the number of users.
+"""
+
+from collections import OrderedDict, deque
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import os
+import json
+import hashlib
+
+# Below this many distinct keywords one `in` check per keyword (C-speed
+# substring search) beats a Python-level scan of the text
+AUTOMATON_MIN_KEYWORDS = 100
+
+TOPIC_MATCHER_CACHE_SIZE = int(os.getenv("TOPIC_MATCHER_CACHE_SIZE", "64"))
+
+# (topic_id, [(lowercase pattern, keyword as written)]) per topic
+NormalizedTopics = List[Tuple[str, List[Tuple[str, str]]]]
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over lowercase patterns."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = list(patterns)
+        self._root: Optional[Dict[str, Any]] = None
+        if len(self.patterns) >= AUTOMATON_MIN_KEYWORDS:
+            self._root = self._compile(self.patterns)
+
+    @staticmethod
+    def _compile(patterns: List[str]) -> Dict[str, Any]:
+        # Trie of the patterns; output[state] = ids of patterns ending there
+        goto: List[Dict[str, int]] = [{}]
+        output: List[List[int]] = [[]]
+        for pattern_id, pattern in enumerate(patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    output.append([])
+                state = nxt
+            output[state].append(pattern_id)  # "" ends at the root: in every string
+
+        # Failure links (breadth first), folded into full transition tables
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [{} for _ in goto]
+        delta[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            output[state].extend(output[fail[state]])
+            for ch, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(ch, 0) if state else 0
+                queue.append(child)
+
+        # Each state becomes a dict of char -> next state dict, with its
+        # pattern ids under "" (iterating a string never yields "")
+        nodes: List[Dict[str, Any]] = [{} for _ in goto]
+        for state, transitions in enumerate(delta):
+            node = nodes[state]
+            for ch, target in transitions.items():
+                node[ch] = nodes[target]
+            if output[state]:
+                node[""] = tuple(output[state])
+        return nodes[0]
+
+    def find(self, text: str) -> Set[int]:
+        """Ids of the patterns occurring in text (already lowercased)."""
+        if self._root is None:
+            return {pattern_id for pattern_id, pattern in enumerate(self.patterns) if pattern in text}
+
+        root = self._root
+        found: Set[int] = set(root.get("", ()))
+        outputs = []
+        node = root
+        for ch in text:
+            node = node.get(ch, root)
+            if "" in node:
+                outputs.append(node[""])
+        return found.union(*outputs)
+
+
+class TopicMatcher:
+    """All keywords of a topic list, compiled once and matched in one pass per field."""
+
+    def __init__(self, topics: NormalizedTopics):
+        self.topic_ids: List[str] = [topic_id for topic_id, _ in topics]
+
+        pattern_ids: Dict[str, int] = {}
+        # pattern id -> (topic index, keyword index, keyword as written)
+        self.entries: List[List[Tuple[int, int, str]]] = []
+        for topic_index, (_, keywords) in enumerate(topics):
+            for keyword_index, (pattern, keyword) in enumerate(keywords):
+                pattern_id = pattern_ids.get(pattern)
+                if pattern_id is None:
+                    pattern_id = pattern_ids[pattern] = len(self.entries)
+                    self.entries.append([])
+                self.entries[pattern_id].append((topic_index, keyword_index, keyword))
+
+        self.keyword_count = sum(len(entries) for entries in self.entries)
+        self._matcher = KeywordMatcher(pattern_ids)
+
+    def find(self, title: str, content: str) -> Tuple[Set[int], Set[int]]:
+        """Pattern ids (indexes into entries) found in the lowercased title and content."""
+        return self._matcher.find(title), (self._matcher.find(content) if content else set())
+
+    def hits(self, title: str, content: str) -> List[Tuple[int, int, int, str]]:
+        """(topic index, keyword index, points, keyword) per matched keyword, in topic / keyword order."""
+        in_title, in_content = self.find(title, content)
+
+        hits = []
+        for pattern_id in in_title | in_content:
+            points = 3 if pattern_id in in_title else 1
+            for topic_index, keyword_index, keyword in self.entries[pattern_id]:
+                hits.append((topic_index, keyword_index, points, keyword))
+        hits.sort()
+        return hits
+
+    def match(self, title: str, content: str) -> Tuple[List[Tuple[str, int]], List[str]]:
+        """
+        Match lowercased title and content against every topic.
+
+        Returns:
+            ((topic_id, summed keyword points) for each topic with a match,
+             matched keywords), both in topic / keyword order
+        """
+        topic_points: Dict[int, int] = {}
+        matched_keywords = []
+        for topic_index, _, points, keyword in self.hits(title, content):
+            topic_points[topic_index] = topic_points.get(topic_index, 0) + points
+            matched_keywords.append(keyword)
+
+        return (
+            [(self.topic_ids[topic_index], points) for topic_index, points in topic_points.items()],
+            matched_keywords,
+        )
+
+
+class UserTopicMatcher:
+    """
+    Every user's topics in one automaton: an inverted index from keyword to
+    the (user, topic) pairs that list it.
+
+    Each user's topics are contiguous in the combined TopicMatcher, so one
+    scan of an article yields every user's topic points and keywords at once.
+    """
+
+    def __init__(self, topics_by_user: List[Tuple[str, NormalizedTopics]]):
+        self.user_ids: List[str] = []
+        # combined topic index -> user index
+        self.topic_users: List[int] = []
+        combined: NormalizedTopics = []
+        for user_index, (user_id, topics) in enumerate(topics_by_user):
+            self.user_ids.append(user_id)
+            self.topic_users.extend([user_index] * len(topics))
+            combined.extend(topics)
+        self.topics = TopicMatcher(combined)
+        self.keyword_count = self.topics.keyword_count
+
+    def match(self, title: str, content: str) -> List[Tuple[str, List[Tuple[str, int]], List[str]]]:
+        """
+        Match lowercased title and content against every user's topics.
+
+        Returns:
+            (user_id, [(topic_id, points)], matched keywords) for each user
+            with at least one matching topic, in the same order as
+            TopicMatcher.match would give for that user alone
+        """
+        results = []
+        current_user = -1
+        topic_points: Dict[int, int] = {}
+        matched_keywords: List[str] = []
+        for topic_index, _, points, keyword in self.topics.hits(title, content):
+            user_index = self.topic_users[topic_index]
+            if user_index != current_user:
+                if topic_points:
+                    results.append(self._user_result(current_user, topic_points, matched_keywords))
+                current_user = user_index
+                topic_points = {}
+                matched_keywords = []
+            topic_points[topic_index] = topic_points.get(topic_index, 0) + points
+            matched_keywords.append(keyword)
+        if topic_points:
+            results.append(self._user_result(current_user, topic_points, matched_keywords))
+        return results
+
+    def _user_result(self, user_index: int, topic_points: Dict[int, int], matched_keywords: List[str]):
+        topic_ids = self.topics.topic_ids
+        return (
+            self.user_ids[user_index],
+            [(topic_ids[topic_index], points) for topic_index, points in topic_points.items()],
+            matched_keywords,
+        )
+
+
+def normalize_topics(topics: List[Dict[str, Any]]) -> NormalizedTopics:
+    """Lowercase each topic's keywords, dropping empty ones and repeats within the topic."""
+    normalized = []
+    for topic in topics:
+        keywords = []
+        seen: Set[str] = set()
+        for keyword in topic.get("keywords") or []:
+            if not isinstance(keyword, str):
+                continue
+            pattern = keyword.lower()
+            if not pattern.strip() or pattern in seen:
+                continue
+            seen.add(pattern)
+            keywords.append((pattern, keyword))
+        normalized.append((str(topic.get("topic_id", "")), keywords))
+    return normalized
+
+
+def topic_set_key(topics: NormalizedTopics) -> str:
+    """Hash of a normalized topic set (topic order matters: it orders the results)."""
+    payload = json.dumps([[topic_id, [p for p, _ in keywords]] for topic_id, keywords in topics])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+_compiled: "OrderedDict[str, Any]" = OrderedDict()
+# Caller-supplied topic set version -> topic_set_key
+_versions: Dict[str, str] = {}
+_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+
+def compile_topics(topics: List[Dict[str, Any]], version: Optional[str] = None) -> TopicMatcher:
+    """
+    Compiled matcher for a topic list, from the cache when the set was seen before.
+
+    Args:
+        topics: Topic dicts (topic_id, keywords)
+        version: Optional "<user_id>:<version>" of the topic set (see
+            agent_2_tools.topic_set_version); lets a hit skip normalizing
+            and hashing the topics
+
+    Returns:
+        TopicMatcher (shared: treat as read-only)
+    """
+    if version is not None:
+        key = _versions.get(version)
+        matcher = _compiled.get(key) if key else None
+        if matcher is not None:
+            _compiled.move_to_end(key)
+            _stats["hits"] += 1
+            return matcher
+
+    normalized = normalize_topics(topics)
+    key = topic_set_key(normalized)
+    if version is not None:
+        _versions[version] = key
+
+    matcher = _compiled.get(key)
+    if matcher is not None:
+        _compiled.move_to_end(key)
+        _stats["hits"] += 1
+        return matcher
+
+    _stats["misses"] += 1
+    matcher = TopicMatcher(normalized)
+    _cache_put(key, matcher)
+    return matcher
+
+
+def compile_user_topics(topics_by_user: Dict[str, List[Dict[str, Any]]]) -> UserTopicMatcher:
+    """
+    Compiled matcher over several users' topic lists, from the cache when seen before.
+
+    Args:
+        topics_by_user: user_id -> that user's active topic dicts
+
+    Returns:
+        UserTopicMatcher (shared: treat as read-only)
+    """
+    normalized = [(user_id, normalize_topics(topics_by_user[user_id])) for user_id in sorted(topics_by_user)]
+    payload = json.dumps([
+        [user_id, [[topic_id, [p for p, _ in keywords]] for topic_id, keywords in topics]]
+        for user_id, topics in normalized
+    ])
+    key = "users:" + hashlib.sha256(payload.encode()).hexdigest()
+
+    matcher = _compiled.get(key)
+    if matcher is not None:
+        _compiled.move_to_end(key)
+        _stats["hits"] += 1
+        return matcher
+
+    _stats["misses"] += 1
+    matcher = UserTopicMatcher(normalized)
+    _cache_put(key, matcher)
+    return matcher
+
+
+def _cache_put(key: str, matcher: Any) -> None:
+    _compiled[key] = matcher
+    while len(_compiled) > TOPIC_MATCHER_CACHE_SIZE:
+        evicted, _ = _compiled.popitem(last=False)
+        for stale in [v for v, k in _versions.items() if k == evicted]:
+            del _versions[stale]
+
+
+def invalidate_compiled_topics(user_id: Optional[str] = None) -> None:
+    """
+    Forget the topic set versions recorded for user_id (all users if None).
+
+    Compiled matchers are keyed by content, so they are never stale; the
+    next compile_topics call for the user rehashes its topics and reuses
+    (or builds) the matcher for what they are now. Passing None also drops
+    every compiled matcher.
+    """
+    _stats["invalidations"] += 1
+    if user_id is None:
+        _versions.clear()
+        _compiled.clear()
+        return
+    prefix = f"{user_id}:"
+    for version in [v for v in _versions if v.startswith(prefix)]:
+        del _versions[version]
+
+
+def topic_matcher_stats() -> Dict[str, int]:
+    """Compiled topic cache counters."""
+    return {**_stats, "size": len(_compiled), "versions": len(_versions)}
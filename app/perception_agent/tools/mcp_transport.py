@@ -0,0 +1,263 @@
+"""
+MCP tool transports for the agents.
+
+How an agent reaches an MCP tool (selected with MCP_TRANSPORT):
+- http: POST JSON to MCP_BASE_URL (default; the MCP service runs on Cloud Run)
+- inprocess: import the MCP routers and call the tool functions directly,
+  passing request/response models as Python objects. No HTTP and no JSON
+  round trip; for local and batch runs where agents and tools share a
+  deployment.
+
+Both transports return plain dicts shaped like the tool's JSON response and
+raise MCPToolError when the tool itself fails (HTTP 4xx/5xx or the
+HTTPException a router raises in-process).
+"""
+
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+from pathlib import Path
+import os
+import sys
+import json
+import asyncio
+import importlib
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# MCP_TRANSPORT: "http" or "inprocess"
+MCP_TRANSPORT = os.getenv("MCP_TRANSPORT", "http").lower()
+
+# MCP service base URL (configurable via environment)
+# Local dev: http://localhost:8080
+# Production: https://perception-mcp-<hash>-uc.a.run.app (set via Agent Engine runtime config)
+MCP_BASE_URL = os.getenv("MCP_BASE_URL", "http://localhost:8080")
+
+# MCP client pool tuning (configurable via environment)
+MCP_HTTP_MAX_CONNECTIONS = int(os.getenv("MCP_HTTP_MAX_CONNECTIONS", "50"))
+MCP_HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("MCP_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+MCP_HTTP_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("MCP_HTTP_KEEPALIVE_EXPIRY_SECONDS", "30"))
+MCP_HTTP2 = os.getenv("MCP_HTTP2", "true").lower() == "true"
+
+# app/mcp_service, put on sys.path for the in-process transport
+MCP_SERVICE_DIR = Path(__file__).parent.parent.parent / "mcp_service"
+
+
+class MCPToolError(Exception):
+    """An MCP tool answered with an error (HTTP status + the tool's error detail)."""
+
+    def __init__(self, status_code: int, detail: Any):
+        self.status_code = status_code
+        self.detail = detail
+        super().__init__(self.message)
+
+    @property
+    def message(self) -> str:
+        """The tool's structured error message, if it sent one."""
+        if isinstance(self.detail, dict):
+            error = self.detail.get("error")
+            if isinstance(error, dict) and error.get("message"):
+                return error["message"]
+        if isinstance(self.detail, str) and self.detail:
+            return self.detail
+        return f"MCP tool returned HTTP {self.status_code}"
+
+
+def _http2_enabled() -> bool:
+    """HTTP/2 needs the optional h2 package (installed via httpx[http2])."""
+    if not MCP_HTTP2:
+        return False
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class HTTPTransport:
+    """Calls MCP tools over HTTP with a pooled, keep-alive client."""
+
+    name = "http"
+
+    def __init__(self, base_url: str = MCP_BASE_URL):
+        self.base_url = base_url.rstrip("/")
+        # Bound to the event loop that created it
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def endpoint(self, tool: str) -> str:
+        return f"{self.base_url}/mcp/tools/{tool}"
+
+    def client(self) -> httpx.AsyncClient:
+        """
+        Get or initialize the pooled MCP client.
+
+        Connections are kept alive across tool calls. A new client is created if
+        the previous one belongs to a different (e.g. already finished) event loop,
+        since httpx connections can't be shared between loops.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=60.0,
+                limits=httpx.Limits(
+                    max_connections=MCP_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=MCP_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=MCP_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+                ),
+                http2=_http2_enabled(),
+            )
+            self._client_loop = loop
+        return self._client
+
+    @staticmethod
+    async def _raise_for_tool_error(response: httpx.Response) -> None:
+        if not response.is_error:
+            return
+        await response.aread()
+        try:
+            detail = response.json().get("detail")
+        except ValueError:
+            detail = response.text
+        raise MCPToolError(response.status_code, detail)
+
+    async def call(self, tool: str, payload: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """POST payload to a tool and return the decoded response."""
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+        response = await self.client().post(self.endpoint(tool), json=payload, **kwargs)
+        await self._raise_for_tool_error(response)
+        return response.json()
+
+    async def stream(
+        self, tool: str, payload: Dict[str, Any], timeout: Optional[float] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """POST payload to an NDJSON tool and yield one dict per line."""
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+        async with self.client().stream("POST", self.endpoint(tool), json=payload, **kwargs) as response:
+            await self._raise_for_tool_error(response)
+            async for line in response.aiter_lines():
+                if line:
+                    yield json.loads(line)
+
+    async def close(self) -> None:
+        """Close the pooled client (call once at the end of a run)."""
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
+
+class InProcessTransport:
+    """
+    Calls the MCP router functions directly in this process.
+
+    The payload is validated into the tool's request model and the tool's
+    response-shaped dict is returned as-is; the routers' own outbound HTTP
+    client, feed cache, parse executor and host limiter are used unchanged.
+    """
+
+    name = "inprocess"
+
+    # tool -> (router module, function returning the response dict, request model)
+    TOOLS: Dict[str, Tuple[str, str, str]] = {
+        "fetch_rss_feed": ("rss", "fetch_rss_feed_data", "FetchRSSFeedRequest"),
+        "fetch_rss_feeds": ("rss", "fetch_rss_feeds_data", "FetchRSSFeedsRequest"),
+        "fetch_api_feed": ("api", "fetch_api_feed_data", "FetchAPIFeedRequest"),
+        "fetch_webpage": ("webpage", "fetch_webpage_data", "FetchWebpageRequest"),
+        "fetch_webpages": ("webpage", "fetch_webpages_data", "FetchWebpagesRequest"),
+        "websub_sync": ("websub", "websub_sync_data", "WebSubSyncRequest"),
+        "websub_pending": ("websub", "websub_pending_data", "WebSubPendingRequest"),
+        "websub_ack": ("websub", "websub_ack_data", "WebSubAckRequest"),
+    }
+    # streaming tool -> (router module, event generator, request model)
+    STREAMS: Dict[str, Tuple[str, str, str]] = {
+        "fetch_rss_feeds/stream": ("rss", "iter_feed_events", "FetchRSSFeedsRequest"),
+    }
+
+    def endpoint(self, tool: str) -> str:
+        return f"inprocess:{tool}"
+
+    @staticmethod
+    def _router(module: str):
+        if str(MCP_SERVICE_DIR) not in sys.path:
+            sys.path.insert(0, str(MCP_SERVICE_DIR))
+        return importlib.import_module(f"routers.{module}")
+
+    def _resolve(self, registry: Dict[str, Tuple[str, str, str]], tool: str, payload: Dict[str, Any]):
+        if tool not in registry:
+            raise MCPToolError(404, f"Tool {tool} is not available in-process")
+        module_name, function_name, model_name = registry[tool]
+        module = self._router(module_name)
+
+        from pydantic import ValidationError
+        try:
+            request = getattr(module, model_name).model_validate(payload)
+        except ValidationError as e:
+            raise MCPToolError(422, str(e)) from e
+        return getattr(module, function_name), request
+
+    @staticmethod
+    def _tool_error(e: Exception) -> Optional[MCPToolError]:
+        from fastapi import HTTPException
+        if isinstance(e, HTTPException):
+            return MCPToolError(e.status_code, e.detail)
+        return None
+
+    async def call(self, tool: str, payload: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Run a tool function and return its response dict."""
+        func, request = self._resolve(self.TOOLS, tool, payload)
+        try:
+            response = await asyncio.wait_for(func(request), timeout)
+        except Exception as e:
+            error = self._tool_error(e)
+            if error is None:
+                raise
+            raise error from e
+        return response
+
+    async def stream(
+        self, tool: str, payload: Dict[str, Any], timeout: Optional[float] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield a streaming tool's events as dicts (timeout is not applied in-process)."""
+        func, request = self._resolve(self.STREAMS, tool, payload)
+        events = func(request)
+        try:
+            async for event in events:
+                yield event
+        finally:
+            await events.aclose()
+
+    async def close(self) -> None:
+        """Release the MCP service's pooled outbound client and parse executor."""
+        if "services.http_clients" in sys.modules:
+            await sys.modules["services.http_clients"].shutdown()
+        if "services.parse_executor" in sys.modules:
+            await sys.modules["services.parse_executor"].shutdown()
+
+
+_transport = None
+
+
+def get_transport():
+    """Return the configured transport (created on first use)."""
+    global _transport
+    if _transport is None:
+        if MCP_TRANSPORT == "inprocess":
+            _transport = InProcessTransport()
+        else:
+            _transport = HTTPTransport()
+        logger.info(json.dumps({
+            "severity": "INFO",
+            "tool": "agent_1",
+            "operation": "mcp_transport",
+            "transport": _transport.name,
+            "mcp_base_url": MCP_BASE_URL if _transport.name == "http" else None
+        }))
+    return _transport
+
+
+async def close_transport() -> None:
+    """Close the transport's pooled resources (call once at the end of a run)."""
+    if _transport is not None:
+        await _transport.close()
@@ -0,0 +1,174 @@
+"""
+Per-source circuit breaker and health tracking for Agent 1 (Source Harvester).
+
+A source that keeps failing (or keeps answering slower than
+BREAKER_SLOW_CALL_MS) trips its breaker open, and harvest_all_sources skips
+it instead of paying the full fetch timeout on every run. Once the cooldown
+has passed the breaker goes half-open and lets one trial fetch through:
+success closes it, failure re-opens it with a doubled cooldown.
+
+State is persisted via state_store (namespace "health") so it survives
+across runs, and Agent 7 mirrors it onto /sources for the dashboard's
+SourceHealthCard.
+"""
+
+from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+import os
+import json
+import logging
+
+from .state_store import load_state, save_state
+
+logger = logging.getLogger(__name__)
+
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "3"))
+BREAKER_SLOW_CALL_MS = int(os.getenv("BREAKER_SLOW_CALL_MS", "20000"))
+BREAKER_OPEN_SECONDS = float(os.getenv("BREAKER_OPEN_SECONDS", "1800"))
+BREAKER_MAX_OPEN_SECONDS = float(os.getenv("BREAKER_MAX_OPEN_SECONDS", "86400"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+STATE_NAMESPACE = "health"
+
+# Weight of the newest sample in the latency moving average
+LATENCY_EWMA_ALPHA = 0.3
+
+
+def _now() -> float:
+    return datetime.now(tz=timezone.utc).timestamp()
+
+
+class SourceHealth:
+    """
+    Tracks breaker state per source_id.
+
+    State per source:
+    - state: closed | open | half_open
+    - consecutive_failures: failures (including slow calls) since the last healthy fetch
+    - open_until: epoch seconds when an open breaker may go half-open
+    - open_seconds: current cooldown (doubles on each failed half-open trial)
+    - last_checked / last_success: epoch seconds
+    - last_error: {"message", "timestamp"}
+    - avg_latency_ms: moving average of fetch latency
+    - last_article_count: articles returned by the last successful fetch
+    - total_failures: lifetime failure count
+    """
+
+    def __init__(self, state: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.state = load_state(STATE_NAMESPACE) if state is None else state
+        self._dirty: Dict[str, Dict[str, Any]] = {}
+
+    def _record(self, source_id: str) -> Dict[str, Any]:
+        return dict(self.state.get(source_id) or {
+            "state": CLOSED,
+            "consecutive_failures": 0,
+            "open_seconds": BREAKER_OPEN_SECONDS,
+            "total_failures": 0,
+        })
+
+    def _store(self, source_id: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        self.state[source_id] = record
+        self._dirty[source_id] = record
+        return record
+
+    def breaker_state(self, source_id: str) -> str:
+        return (self.state.get(source_id) or {}).get("state", CLOSED)
+
+    def allow_request(self, source_id: str, now: Optional[float] = None) -> bool:
+        """
+        True if the source may be fetched now.
+
+        An open breaker whose cooldown has passed moves to half-open and
+        allows a single trial fetch.
+        """
+        record = self.state.get(source_id)
+        if not record or record.get("state") == CLOSED:
+            return True
+        if record.get("state") == HALF_OPEN:
+            return True
+        now = _now() if now is None else now
+        if now >= record.get("open_until", 0):
+            record = self._record(source_id)
+            record["state"] = HALF_OPEN
+            self._store(source_id, record)
+            return True
+        return False
+
+    def record_success(
+        self, source_id: str, latency_ms: int, article_count: int, now: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Record a completed fetch; a slow one still counts against the breaker."""
+        now = _now() if now is None else now
+        if latency_ms > BREAKER_SLOW_CALL_MS:
+            record = self.record_failure(source_id, f"Slow response ({latency_ms} ms)", latency_ms, now)
+            record["last_success"] = now
+            record["last_article_count"] = article_count
+            return self._store(source_id, record)
+
+        record = self._record(source_id)
+        record.update({
+            "state": CLOSED,
+            "consecutive_failures": 0,
+            "open_seconds": BREAKER_OPEN_SECONDS,
+            "last_checked": now,
+            "last_success": now,
+            "last_article_count": article_count,
+            "avg_latency_ms": self._average(record, latency_ms),
+        })
+        record.pop("open_until", None)
+        return self._store(source_id, record)
+
+    def record_failure(
+        self, source_id: str, error: str, latency_ms: int = 0, now: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Record a failed (or slow) fetch, opening the breaker if warranted."""
+        now = _now() if now is None else now
+        record = self._record(source_id)
+        record["consecutive_failures"] = record.get("consecutive_failures", 0) + 1
+        record["total_failures"] = record.get("total_failures", 0) + 1
+        record["last_checked"] = now
+        record["last_error"] = {"message": error, "timestamp": now}
+        if latency_ms:
+            record["avg_latency_ms"] = self._average(record, latency_ms)
+
+        if record.get("state") == HALF_OPEN:
+            # Trial failed: back off harder before the next one
+            record["open_seconds"] = min(record.get("open_seconds", BREAKER_OPEN_SECONDS) * 2, BREAKER_MAX_OPEN_SECONDS)
+            self._open(source_id, record, now)
+        elif record["consecutive_failures"] >= BREAKER_FAILURE_THRESHOLD:
+            self._open(source_id, record, now)
+        return self._store(source_id, record)
+
+    def _open(self, source_id: str, record: Dict[str, Any], now: float) -> None:
+        record["state"] = OPEN
+        record["open_until"] = now + record.get("open_seconds", BREAKER_OPEN_SECONDS)
+        logger.warning(json.dumps({
+            "severity": "WARNING",
+            "tool": "agent_1",
+            "operation": "circuit_breaker",
+            "source_id": source_id,
+            "state": OPEN,
+            "consecutive_failures": record["consecutive_failures"],
+            "open_seconds": record.get("open_seconds")
+        }))
+
+    @staticmethod
+    def _average(record: Dict[str, Any], latency_ms: int) -> int:
+        previous = record.get("avg_latency_ms")
+        if previous is None:
+            return latency_ms
+        return int(LATENCY_EWMA_ALPHA * latency_ms + (1 - LATENCY_EWMA_ALPHA) * previous)
+
+    def changed_records(self) -> Dict[str, Dict[str, Any]]:
+        """Records updated since the last save (what Agent 7 should publish)."""
+        return {source_id: dict(record) for source_id, record in self._dirty.items()}
+
+    def save(self) -> bool:
+        """Persist records changed since the last save."""
+        ok = save_state(STATE_NAMESPACE, self._dirty)
+        if ok:
+            self._dirty = {}
+        return ok
@@ -0,0 +1,403 @@
+"""
+Source registry for Agent 1 (Source Harvester).
+
+One merged, in-memory view of every configured source:
+- Firestore /sources collection (when SOURCES_FIRESTORE is on; wins on conflicts)
+- data/initial_feeds.csv
+- perception_agent/config/rss_sources.yaml
+
+Sources are merged by source_id; a lower-priority entry whose URL is already
+registered is dropped, so a feed listed in both files is harvested once.
+A Firestore document without a url only overrides the fields it sets on the
+file entry with the same source_id (and is skipped if there is none).
+
+The parsed result is kept until an input changes: files are re-read only
+when their mtime (or size) changes, and Firestore only when the newest
+updatedAt in the collection moves (checked at most every
+SOURCES_FIRESTORE_CHECK_SECONDS). Deleted Firestore documents are picked up
+on the next full reload; disable a source with status "disabled" instead.
+
+Sources are plain dicts (source_id, name, type, url, category, enabled,
+api_config?, origin); callers must treat them as read-only.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from pathlib import Path
+from urllib.parse import urlparse
+import os
+import re
+import csv
+import json
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+_REPO_ROOT = Path(__file__).parent.parent.parent.parent
+
+# SOURCES_CSV_PATH / SOURCES_YAML_PATH: set to "" to leave a file out of the registry
+SOURCES_CSV_PATH = os.getenv("SOURCES_CSV_PATH", str(_REPO_ROOT / "data" / "initial_feeds.csv"))
+SOURCES_YAML_PATH = os.getenv(
+    "SOURCES_YAML_PATH",
+    str(Path(__file__).parent.parent / "config" / "rss_sources.yaml")
+)
+# SOURCES_FIRESTORE: merge the Firestore /sources collection (production)
+SOURCES_FIRESTORE = os.getenv("SOURCES_FIRESTORE", "false").lower() == "true"
+SOURCES_COLLECTION = os.getenv("SOURCES_COLLECTION", "sources")
+SOURCES_FIRESTORE_CHECK_SECONDS = float(os.getenv("SOURCES_FIRESTORE_CHECK_SECONDS", "60"))
+
+_SLUG = re.compile(r"[^a-z0-9]+")
+
+# Lazy-initialized Firestore client
+_db_client = None
+
+
+def _get_db():
+    """Get or initialize Firestore client."""
+    global _db_client
+    if _db_client is None:
+        from google.cloud import firestore
+        _db_client = firestore.Client()
+    return _db_client
+
+
+def source_host(url: Optional[str]) -> str:
+    """Lowercase host of a source URL."""
+    return urlparse(url or "").netloc.lower()
+
+
+def _url_key(url: Optional[str]) -> str:
+    """URL compared for duplicates: no scheme, no trailing slash, lowercase host."""
+    parsed = urlparse(url or "")
+    return f"{parsed.netloc.lower()}{parsed.path.rstrip('/')}?{parsed.query}"
+
+
+def _slug(name: str) -> str:
+    return _SLUG.sub("_", name.lower()).strip("_")
+
+
+def read_csv_sources(path: str) -> List[Dict[str, Any]]:
+    """
+    Parse the sources CSV (source_id, name, type, url, category, enabled[, api_config]).
+
+    Returns:
+        Every row as a source dict, enabled or not
+    """
+    sources = []
+    with open(path, 'r') as f:
+        for row in csv.DictReader(f):
+            source = {
+                'source_id': row['source_id'],
+                'name': row['name'],
+                'type': row['type'],
+                'url': row['url'],
+                'category': row['category'],
+                'enabled': row.get('enabled', '').lower() == 'true',
+                'origin': 'csv'
+            }
+            # Optional JSON column: fetch_api_feed source config for 'api' sources
+            if row.get('api_config'):
+                source['api_config'] = json.loads(row['api_config'])
+            sources.append(source)
+    return sources
+
+
+def read_yaml_sources(path: str) -> List[Dict[str, Any]]:
+    """
+    Parse config/rss_sources.yaml (sources: [{name, url, category, active}]).
+
+    Entries have no source_id, so one is derived from the name.
+
+    Returns:
+        Every entry as an RSS source dict, active or not
+    """
+    import yaml  # pyyaml; only needed when the YAML list is in use
+
+    with open(path, 'r') as f:
+        data = yaml.safe_load(f) or {}
+
+    sources = []
+    for entry in data.get('sources') or []:
+        if not entry.get('url'):
+            continue
+        name = entry.get('name') or entry['url']
+        sources.append({
+            'source_id': entry.get('source_id') or _slug(name),
+            'name': name,
+            'type': entry.get('type', 'rss'),
+            'url': entry['url'],
+            'category': entry.get('category'),
+            'enabled': bool(entry.get('active', True)),
+            'origin': 'yaml'
+        })
+    return sources
+
+
+def _firestore_source(doc_id: str, doc: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map a /sources document onto the registry's source dict.
+
+    A document without a url (e.g. one only carrying status for a file
+    source) is partial: it holds just the fields the document sets, and
+    _rebuild fills the rest from the file entry with the same source_id.
+    """
+    enabled = doc.get('status', 'active') != 'disabled'
+    if 'enabled' in doc:
+        enabled = enabled and bool(doc['enabled'])
+    source = {
+        'source_id': doc.get('id') or doc_id,
+        'enabled': enabled,
+        'origin': 'firestore'
+    }
+    if doc.get('url'):
+        source.update({
+            'name': doc.get('name', doc_id),
+            'type': doc.get('type', 'rss'),
+            'url': doc['url'],
+            'category': doc.get('category'),
+        })
+    else:
+        source.update({field: doc[field] for field in ('name', 'type', 'category') if doc.get(field)})
+    if doc.get('apiConfig'):
+        source['api_config'] = doc['apiConfig']
+    return source
+
+
+def _merge_partial(source: Dict[str, Any], partial: Dict[str, Any]) -> Dict[str, Any]:
+    """Overlay a URL-less Firestore source onto the file entry with its id."""
+    merged = {**source, **partial}
+    # Either side can disable the source
+    merged['enabled'] = source['enabled'] and partial['enabled']
+    return merged
+
+
+def _timestamp_key(value: Any) -> Optional[str]:
+    """Comparable form of a Firestore updatedAt value."""
+    if value is None:
+        return None
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+
+def read_firestore_sources(collection: str = SOURCES_COLLECTION) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Read every document in the sources collection.
+
+    Returns:
+        (source dicts, newest updatedAt seen)
+    """
+    sources = []
+    newest = None
+    for doc in _get_db().collection(collection).stream():
+        data = doc.to_dict() or {}
+        sources.append(_firestore_source(doc.id, data))
+        updated = _timestamp_key(data.get('updatedAt'))
+        if updated and (newest is None or updated > newest):
+            newest = updated
+    return sources, newest
+
+
+def firestore_sources_version(collection: str = SOURCES_COLLECTION) -> Optional[str]:
+    """Newest updatedAt in the sources collection (one document read)."""
+    from google.cloud import firestore
+
+    query = (
+        _get_db().collection(collection)
+        .order_by('updatedAt', direction=firestore.Query.DESCENDING)
+        .limit(1)
+    )
+    for doc in query.stream():
+        return _timestamp_key((doc.to_dict() or {}).get('updatedAt'))
+    return None
+
+
+def _file_version(path: str) -> Optional[Tuple[float, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime, stat.st_size)
+
+
+class SourceRegistry:
+    """
+    Cached, merged source list with lookups by source_id and host.
+
+    Every accessor calls refresh(), which costs a stat() per file (plus a
+    one-document Firestore query every SOURCES_FIRESTORE_CHECK_SECONDS)
+    unless something changed.
+    """
+
+    def __init__(
+        self,
+        csv_path: Optional[str] = SOURCES_CSV_PATH,
+        yaml_path: Optional[str] = SOURCES_YAML_PATH,
+        use_firestore: bool = SOURCES_FIRESTORE,
+    ):
+        self.csv_path = csv_path or None
+        self.yaml_path = yaml_path or None
+        self.use_firestore = use_firestore
+        self.reloads = 0
+
+        self._versions: Dict[str, Any] = {}
+        self._origin_sources: Dict[str, List[Dict[str, Any]]] = {}
+        self._firestore_checked_at = 0.0
+
+        self._sources: List[Dict[str, Any]] = []
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_host: Dict[str, List[Dict[str, Any]]] = {}
+
+    def _reload_file(self, origin: str, path: str, reader) -> bool:
+        """Re-read one file if its mtime/size changed. Returns True if it was re-read."""
+        version = _file_version(path)
+        if origin in self._versions and self._versions[origin] == version:
+            return False
+        self._versions[origin] = version
+        if version is None:
+            logger.error(json.dumps({
+                "severity": "ERROR",
+                "tool": "agent_1",
+                "operation": "source_registry",
+                "error": f"Sources file not found: {path}"
+            }))
+            self._origin_sources[origin] = []
+            return True
+        try:
+            self._origin_sources[origin] = reader(path)
+        except Exception as e:
+            # Keep serving the last good parse of this file
+            logger.error(json.dumps({
+                "severity": "ERROR",
+                "tool": "agent_1",
+                "operation": "source_registry",
+                "path": path,
+                "error": str(e)
+            }))
+        return True
+
+    def _reload_firestore(self, force: bool) -> bool:
+        """Re-read Firestore if its newest updatedAt moved. Returns True if it was re-read."""
+        now = time.monotonic()
+        if not force and "firestore" in self._versions and now - self._firestore_checked_at < SOURCES_FIRESTORE_CHECK_SECONDS:
+            return False
+        self._firestore_checked_at = now
+        try:
+            if "firestore" in self._versions and not force:
+                if firestore_sources_version() == self._versions["firestore"]:
+                    return False
+            sources, newest = read_firestore_sources()
+        except Exception as e:
+            logger.error(json.dumps({
+                "severity": "ERROR",
+                "tool": "agent_1",
+                "operation": "source_registry",
+                "collection": SOURCES_COLLECTION,
+                "error": str(e)
+            }))
+            self._versions.setdefault("firestore", None)
+            return False
+        self._versions["firestore"] = newest
+        self._origin_sources["firestore"] = sources
+        return True
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Reload whichever inputs changed and rebuild the indexes.
+
+        Args:
+            force: Re-read every input regardless of versions
+
+        Returns:
+            True if the registry was rebuilt
+        """
+        if force:
+            self._versions.clear()
+        changed = False
+        if self.use_firestore:
+            changed |= self._reload_firestore(force)
+        if self.csv_path:
+            changed |= self._reload_file("csv", self.csv_path, read_csv_sources)
+        if self.yaml_path:
+            changed |= self._reload_file("yaml", self.yaml_path, read_yaml_sources)
+        if changed:
+            self._rebuild()
+        return changed
+
+    def _rebuild(self) -> None:
+        merged: List[Dict[str, Any]] = []
+        by_id: Dict[str, Dict[str, Any]] = {}
+        urls = set()
+        partials: Dict[str, Dict[str, Any]] = {}
+        # Highest priority first: Firestore, then CSV, then YAML
+        for origin in ("firestore", "csv", "yaml"):
+            for source in self._origin_sources.get(origin, []):
+                if not source.get('url'):
+                    if origin == "firestore":
+                        partials.setdefault(source['source_id'], source)
+                    continue
+                url_key = _url_key(source['url'])
+                if source['source_id'] in by_id or url_key in urls:
+                    continue
+                if source['source_id'] in partials:
+                    source = _merge_partial(source, partials.pop(source['source_id']))
+                by_id[source['source_id']] = source
+                urls.add(url_key)
+                merged.append(source)
+
+        by_host: Dict[str, List[Dict[str, Any]]] = {}
+        for source in merged:
+            by_host.setdefault(source_host(source.get('url')), []).append(source)
+
+        self._sources, self._by_id, self._by_host = merged, by_id, by_host
+        self.reloads += 1
+
+        logger.info(json.dumps({
+            "severity": "INFO",
+            "tool": "agent_1",
+            "operation": "source_registry",
+            "sources": len(merged),
+            "enabled": sum(1 for s in merged if s['enabled']),
+            "by_origin": {o: len(self._origin_sources.get(o, [])) for o in ("firestore", "csv", "yaml")},
+            "skipped_without_url": len(partials),
+            "reloads": self.reloads
+        }))
+
+    def all_sources(self) -> List[Dict[str, Any]]:
+        """Every registered source, enabled or not (priority order)."""
+        self.refresh()
+        return list(self._sources)
+
+    def enabled_sources(self, types: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Enabled sources, optionally only the given types."""
+        self.refresh()
+        wanted = set(types) if types else None
+        return [s for s in self._sources if s['enabled'] and (wanted is None or s['type'] in wanted)]
+
+    def get(self, source_id: str) -> Optional[Dict[str, Any]]:
+        """Source by id (None if unknown)."""
+        self.refresh()
+        return self._by_id.get(source_id)
+
+    def by_host(self, host: str) -> List[Dict[str, Any]]:
+        """Sources whose URL is on host (lowercase netloc)."""
+        self.refresh()
+        return list(self._by_host.get(host.lower(), []))
+
+    def hosts(self) -> Dict[str, int]:
+        """Number of enabled sources per host."""
+        self.refresh()
+        return {
+            host: count
+            for host, sources in self._by_host.items()
+            if (count := sum(1 for s in sources if s['enabled']))
+        }
+
+
+_registry: Optional[SourceRegistry] = None
+
+
+def get_source_registry() -> SourceRegistry:
+    """Return the process-wide registry (created on first use)."""
+    global _registry
+    if _registry is None:
+        _registry = SourceRegistry()
+    return _registry
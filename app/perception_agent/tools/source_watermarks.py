@@ -0,0 +1,160 @@
+"""
+Per-source high-water marks for incremental harvesting (Agent 1).
+
+For each source we remember the newest published_at seen and the GUIDs of
+the entries near it. harvest_all_sources asks the MCP tool only for entries
+published since the watermark (minus WATERMARK_OVERLAP_MINUTES, to catch
+entries that show up in a feed later than their publish time) and drops the
+GUIDs it has already seen, so an hourly run costs what's new rather than the
+whole time window.
+
+Watermarks are only advanced in memory during a harvest; the orchestrator
+commits them (commit_watermarks) once the run has succeeded, so a failed run
+re-harvests the same entries next time. Watermarks are keyed by source only,
+so they belong to the shared runs (system user / all users); per-user runs
+harvest without them.
+
+State is persisted via state_store (namespace "watermarks").
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+from datetime import datetime, timezone
+import os
+import json
+import logging
+
+from .state_store import load_state, save_state
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_OVERLAP_MINUTES = float(os.getenv("WATERMARK_OVERLAP_MINUTES", "60"))
+# GUIDs remembered per source (newest first); bounds the record size
+WATERMARK_MAX_GUIDS = int(os.getenv("WATERMARK_MAX_GUIDS", "500"))
+
+STATE_NAMESPACE = "watermarks"
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[float]:
+    """ISO 8601 string -> epoch seconds (None if missing or unparseable)."""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.timestamp()
+    except ValueError:
+        return None
+
+
+def article_key(article: Dict[str, Any]) -> Optional[str]:
+    """Identity of an article within its source: the feed GUID, else the URL."""
+    return article.get('guid') or article.get('url') or None
+
+
+class SourceWatermarks:
+    """
+    Tracks the harvest watermark per source_id.
+
+    State per source:
+    - published_ts / published_at: newest publish time seen
+    - guids: {guid: published_ts (undated: when first seen)} for entries inside
+      the overlap window
+    - updated_at: epoch seconds of the run that advanced it
+    """
+
+    def __init__(self, state: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.state = load_state(STATE_NAMESPACE) if state is None else state
+        self._pending: Dict[str, Dict[str, Any]] = {}
+
+    def since(self, source_id: str) -> Optional[str]:
+        """ISO timestamp to pass as the MCP tool's `since` (None = no watermark yet)."""
+        record = self.state.get(source_id)
+        if not record or record.get('published_ts') is None:
+            return None
+        since_ts = record['published_ts'] - WATERMARK_OVERLAP_MINUTES * 60
+        return datetime.fromtimestamp(since_ts, tz=timezone.utc).isoformat()
+
+    def is_new(self, source_id: str, article: Dict[str, Any]) -> bool:
+        """False if the article's GUID was already harvested for this source."""
+        key = article_key(article)
+        record = self.state.get(source_id)
+        return not (key and record and key in record.get('guids', {}))
+
+    def filter_new(self, source_id: str, articles: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop articles already seen for this source (order is kept)."""
+        return [article for article in articles if self.is_new(source_id, article)]
+
+    def advance(
+        self, source_id: str, articles: Iterable[Dict[str, Any]], now: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Move a source's watermark past the given articles (pending until committed).
+
+        Only dated articles move published_ts (future dates are clamped to
+        now, so a bad date can't push the watermark ahead). Articles flagged
+        date_missing or without a parseable published_at are only added to
+        the GUID set, stamped with now.
+
+        Returns:
+            The pending record, or None if nothing changed
+        """
+        now = datetime.now(tz=timezone.utc).timestamp() if now is None else now
+        record = self._pending.get(source_id) or self.state.get(source_id) or {}
+        guids: Dict[str, float] = dict(record.get('guids', {}))
+        newest = record.get('published_ts')
+
+        changed = False
+        for article in articles:
+            key = article_key(article)
+            published_ts = None if article.get('date_missing') else _parse_timestamp(article.get('published_at'))
+            if published_ts is not None:
+                published_ts = min(published_ts, now)
+                if newest is None or published_ts > newest:
+                    newest = published_ts
+                    changed = True
+            if key and key not in guids:
+                guids[key] = now if published_ts is None else published_ts
+                changed = True
+
+        if not changed:
+            return None
+
+        # Only GUIDs the next `since` query can still return need remembering
+        horizon = float('-inf') if newest is None else newest - WATERMARK_OVERLAP_MINUTES * 60
+        kept = sorted(
+            ((guid, ts) for guid, ts in guids.items() if ts >= horizon),
+            key=lambda item: item[1],
+            reverse=True
+        )[:WATERMARK_MAX_GUIDS]
+
+        pending = {
+            'published_ts': newest,
+            'published_at': None if newest is None else datetime.fromtimestamp(newest, tz=timezone.utc).isoformat(),
+            'guids': dict(kept),
+            'updated_at': now,
+        }
+        self._pending[source_id] = pending
+        return pending
+
+    def pending(self) -> Dict[str, Dict[str, Any]]:
+        """Watermark records advanced by this harvest, not yet committed."""
+        return {source_id: dict(record) for source_id, record in self._pending.items()}
+
+
+def commit_watermarks(records: Dict[str, Dict[str, Any]]) -> bool:
+    """
+    Persist watermarks returned by a harvest (call after the run succeeded).
+
+    Returns:
+        True if saved (or nothing to save)
+    """
+    ok = save_state(STATE_NAMESPACE, records)
+    if ok and records:
+        logger.info(json.dumps({
+            "severity": "INFO",
+            "tool": "agent_1",
+            "operation": "commit_watermarks",
+            "updated_sources": len(records)
+        }))
+    return ok
@@ -0,0 +1,159 @@
+"""
+Harvest state persistence for Agent 1 (Source Harvester).
+
+Small per-source records (polling schedule, source health, watermarks) that
+must survive across ingestion runs. Each namespace is a flat mapping of
+key (usually source_id) -> JSON-serializable dict.
+
+Backends (selected with HARVEST_STATE_BACKEND):
+- file: one JSON file per namespace under HARVEST_STATE_DIR (default, local dev)
+- firestore: one collection per namespace, named harvest_<namespace>
+- memory: process-local only (nothing persisted)
+"""
+
+from typing import Any, Dict, Optional
+import os
+import json
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+HARVEST_STATE_BACKEND = os.getenv("HARVEST_STATE_BACKEND", "file").lower()
+HARVEST_STATE_DIR = os.getenv(
+    "HARVEST_STATE_DIR",
+    str(Path(__file__).parent.parent.parent.parent / ".harvest_state")
+)
+
+# Lazy-initialized Firestore client
+_db_client = None
+
+
+def _get_db():
+    """Get or initialize Firestore client."""
+    global _db_client
+    if _db_client is None:
+        from google.cloud import firestore
+        _db_client = firestore.Client()
+    return _db_client
+
+
+class StateStore:
+    """In-memory store; base class for the persistent backends."""
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self._records: Dict[str, Dict[str, Any]] = {}
+
+    def load_all(self) -> Dict[str, Dict[str, Any]]:
+        """Return every record in the namespace."""
+        return {key: dict(record) for key, record in self._records.items()}
+
+    def save_many(self, records: Dict[str, Dict[str, Any]]) -> None:
+        """Upsert records (other keys are left untouched)."""
+        for key, record in records.items():
+            self._records[key] = dict(record)
+
+
+class FileStateStore(StateStore):
+    """JSON file per namespace, replaced atomically on every save."""
+
+    def __init__(self, namespace: str, directory: str = HARVEST_STATE_DIR):
+        super().__init__(namespace)
+        self.path = Path(directory) / f"{namespace}.json"
+
+    def load_all(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def save_many(self, records: Dict[str, Dict[str, Any]]) -> None:
+        current = self.load_all()
+        current.update(records)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+class FirestoreStateStore(StateStore):
+    """One document per key in the harvest_<namespace> collection."""
+
+    def __init__(self, namespace: str):
+        super().__init__(namespace)
+        self.collection = f"harvest_{namespace}"
+
+    def load_all(self) -> Dict[str, Dict[str, Any]]:
+        docs = _get_db().collection(self.collection).stream()
+        return {doc.id: doc.to_dict() for doc in docs}
+
+    def save_many(self, records: Dict[str, Dict[str, Any]]) -> None:
+        db = _get_db()
+        items = list(records.items())
+        # Firestore batches limited to 500 operations
+        for i in range(0, len(items), 500):
+            batch = db.batch()
+            for key, record in items[i:i + 500]:
+                batch.set(db.collection(self.collection).document(key), record)
+            batch.commit()
+
+
+_stores: Dict[str, StateStore] = {}
+
+
+def get_state_store(namespace: str, backend: Optional[str] = None) -> StateStore:
+    """
+    Return the store for a namespace (one instance per namespace).
+
+    Args:
+        namespace: e.g. "schedule", "health", "watermarks"
+        backend: Override HARVEST_STATE_BACKEND ("file", "firestore", "memory")
+    """
+    backend = (backend or HARVEST_STATE_BACKEND).lower()
+    cache_key = f"{backend}:{namespace}"
+    if cache_key not in _stores:
+        if backend == "firestore":
+            _stores[cache_key] = FirestoreStateStore(namespace)
+        elif backend == "memory":
+            _stores[cache_key] = StateStore(namespace)
+        else:
+            _stores[cache_key] = FileStateStore(namespace)
+    return _stores[cache_key]
+
+
+def load_state(namespace: str) -> Dict[str, Dict[str, Any]]:
+    """Load a namespace; backend errors are logged and treated as empty state."""
+    try:
+        return get_state_store(namespace).load_all()
+    except Exception as e:
+        logger.error(json.dumps({
+            "severity": "ERROR",
+            "tool": "agent_1",
+            "operation": "load_state",
+            "namespace": namespace,
+            "backend": HARVEST_STATE_BACKEND,
+            "error": str(e)
+        }))
+        return {}
+
+
+def save_state(namespace: str, records: Dict[str, Dict[str, Any]]) -> bool:
+    """Persist records; backend errors are logged. Returns True on success."""
+    if not records:
+        return True
+    try:
+        get_state_store(namespace).save_many(records)
+        return True
+    except Exception as e:
+        logger.error(json.dumps({
+            "severity": "ERROR",
+            "tool": "agent_1",
+            "operation": "save_state",
+            "namespace": namespace,
+            "backend": HARVEST_STATE_BACKEND,
+            "error": str(e)
+        }))
+        return False
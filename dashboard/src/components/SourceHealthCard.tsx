@@ -8,15 +8,19 @@ interface Source {
   type: string
   url: string
   category: string
-  status: 'active' | 'disabled'
+  status: 'active' | 'failed' | 'disabled'
+  circuitState?: 'closed' | 'open' | 'half_open'
+  consecutiveFailures?: number
   lastChecked?: { seconds: number }
   lastSuccess?: { seconds: number }
+  lastError?: { message: string; timestamp?: { seconds: number } }
   articlesLast24h?: number
 }
 
 interface SourceStats {
   total: number
   active: number
+  failing: number
   disabled: number
   byCategory: Record<string, number>
   byType: Record<string, number>
@@ -45,6 +49,7 @@ export default function SourceHealthCard() {
         const stats: SourceStats = {
           total: sourcesList.length,
           active: sourcesList.filter((s) => s.status === 'active').length,
+          failing: sourcesList.filter((s) => s.status === 'failed' || s.circuitState === 'open').length,
           disabled: sourcesList.filter((s) => s.status === 'disabled').length,
           byCategory: {},
           byType: {}
@@ -97,7 +102,7 @@ export default function SourceHealthCard() {
 
       {/* Stats Overview */}
       {stats && (
-        <div className="grid grid-cols-3 gap-4 mb-6">
+        <div className="grid grid-cols-4 gap-4 mb-6">
           <div className="text-center p-3 bg-zinc-50 rounded-lg">
             <div className="text-2xl font-bold text-primary">{stats.total}</div>
             <div className="text-xs text-zinc-500 mt-1">Total Sources</div>
@@ -106,6 +111,10 @@ export default function SourceHealthCard() {
             <div className="text-2xl font-bold text-green-600">{stats.active}</div>
             <div className="text-xs text-zinc-500 mt-1">Active</div>
           </div>
+          <div className="text-center p-3 bg-red-50 rounded-lg">
+            <div className="text-2xl font-bold text-red-600">{stats.failing}</div>
+            <div className="text-xs text-zinc-500 mt-1">Failing</div>
+          </div>
           <div className="text-center p-3 bg-zinc-50 rounded-lg">
             <div className="text-2xl font-bold text-zinc-400">{stats.disabled}</div>
             <div className="text-xs text-zinc-500 mt-1">Disabled</div>
@@ -159,9 +168,15 @@ export default function SourceHealthCard() {
                 )}
                 <div
                   className={`h-2 w-2 rounded-full ${
-                    source.status === 'active' ? 'bg-green-500' : 'bg-zinc-300'
+                    source.status === 'failed' || source.circuitState === 'open'
+                      ? 'bg-red-500'
+                      : source.circuitState === 'half_open'
+                        ? 'bg-amber-400'
+                        : source.status === 'active'
+                          ? 'bg-green-500'
+                          : 'bg-zinc-300'
                   }`}
-                  title={source.status}
+                  title={source.lastError?.message ? `${source.status}: ${source.lastError.message}` : source.status}
                 />
               </div>
             </div>
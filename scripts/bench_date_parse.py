@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark: feed date parsing (dates/second).
+
+Parses a corpus of feed/API date strings, in the formats real feeds publish
+(BBC, Reuters, NYT, WordPress, Atom, GitHub, NewsAPI, ...), with:
+
+- dateutil:   dateutil.parser.parse (the old fallback path)
+- feedparser: feedparser's built-in handler chain (what published_parsed cost)
+- fast:       services.dates without memoisation (regex / fromisoformat)
+- memoised:   services.dates.parse_date with its LRU, starting cold
+
+Every poll of a feed sees the same dates again, so the corpus repeats each
+distinct string --polls times, as a harvest over that many runs would.
+
+Usage:
+    python scripts/bench_date_parse.py [--dates 2000] [--polls 10]
+"""
+
+import argparse
+import random
+import sys
+import time
+import warnings
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "app" / "mcp_service"))
+
+import feedparser  # noqa: E402
+from dateutil import parser as date_parser  # noqa: E402
+
+from services.dates import date_parse_stats, parse_date, parse_date_fast  # noqa: E402
+
+# strftime formats as seen in production feeds
+FEED_FORMATS = [
+    "%a, %d %b %Y %H:%M:%S GMT",         # BBC, Guardian
+    "%a, %d %b %Y %H:%M:%S +0000",       # WordPress, Reuters, TechCrunch
+    "%a, %d %b %Y %H:%M:%S -0500",       # NYT
+    "%a, %d %b %Y %H:%M:%S EST",         # older US CMSs
+    "%a, %-d %b %Y %H:%M:%S %z",         # unpadded day
+    "%d %b %Y %H:%M:%S +0100",           # no day name
+    "%a, %d %b %y %H:%M %Z",             # two-digit year, no seconds
+    "%Y-%m-%dT%H:%M:%SZ",                # Atom, GitHub, NewsAPI
+    "%Y-%m-%dT%H:%M:%S.%fZ",             # JSON APIs with microseconds
+    "%Y-%m-%dT%H:%M:%S+00:00",           # RFC 3339 (Medium, Substack)
+    "%Y-%m-%dT%H:%M:%S-04:00",           # The Verge
+    "%Y-%m-%d %H:%M:%S",                 # naive, some CMS exports
+    "%Y-%m-%d",                          # arXiv / date-only
+]
+
+
+def build_corpus(count: int, polls: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    now = datetime.now(tz=timezone.utc)
+    distinct = []
+    for i in range(count):
+        moment = now - timedelta(minutes=rng.randint(0, 60 * 24 * 30), seconds=rng.randint(0, 59))
+        distinct.append(moment.strftime(FEED_FORMATS[i % len(FEED_FORMATS)]))
+    corpus = distinct * polls
+    rng.shuffle(corpus)
+    return corpus
+
+
+def run_dateutil(corpus) -> int:
+    parsed = 0
+    for value in corpus:
+        try:
+            date_parser.parse(value)
+            parsed += 1
+        except (ValueError, OverflowError):
+            pass
+    return parsed
+
+
+def run_feedparser(corpus) -> int:
+    # services.parse_executor isn't imported, so this is feedparser's own chain
+    return sum(1 for value in corpus if feedparser.datetimes._parse_date(value))
+
+
+def run_fast(corpus) -> int:
+    uncached = parse_date_fast.__wrapped__
+    return sum(1 for value in corpus if uncached(value) is not None)
+
+
+def run_memoised(corpus) -> int:
+    parse_date_fast.cache_clear()
+    return sum(1 for value in corpus if parse_date(value) is not None)
+
+
+def bench(name: str, func, corpus) -> float:
+    started = time.perf_counter()
+    parsed = func(corpus)
+    elapsed = time.perf_counter() - started
+    rate = len(corpus) / elapsed
+    print(f"{name:<11} {parsed:>8}/{len(corpus)} parsed  {elapsed:7.3f}s  {rate:>12,.0f} dates/s")
+    return rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark feed date parsing")
+    parser.add_argument("--dates", type=int, default=2000, help="Distinct date strings")
+    parser.add_argument("--polls", type=int, default=10, help="Times each string is seen")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.dates, args.polls)
+    print(f"{args.dates} distinct dates x {args.polls} polls, {len(FEED_FORMATS)} formats")
+
+    # dateutil warns on every named zone it can't resolve (EST, ...)
+    warnings.simplefilter("ignore")
+    baseline = bench("dateutil", run_dateutil, corpus)
+    bench("feedparser", run_feedparser, corpus)
+    fast = bench("fast", run_fast, corpus)
+    memoised = bench("memoised", run_memoised, corpus)
+    print(f"speedup    fast {fast / baseline:.1f}x, memoised {memoised / baseline:.1f}x vs dateutil")
+    print(f"cache      {date_parse_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark: topic keyword matching in Agent 3's score_articles (articles/second).
+
+Scores a synthetic harvest against a synthetic topic set with:
+
+- loop:      the previous per-topic, per-keyword substring loop
+             (`keyword in title` / `keyword in content` for every keyword)
+- automaton: keyword_matcher.TopicMatcher, one Aho-Corasick pass over the
+             title and one over the content for all keywords (compiled
+             uncached, as on a topic set's first run)
+
+and checks both produce the same topic points and matched keywords.
+Section inference and the rest of score_articles are excluded.
+
+Usage:
+    python scripts/bench_keyword_match.py [--articles 10000] [--keywords 500] [--topics 20]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "app"))
+
+from perception_agent.tools.keyword_matcher import TopicMatcher, compile_topics, normalize_topics  # noqa: E402
+
+SYLLABLES = [
+    "ai", "an", "ar", "ber", "cha", "clo", "da", "dex", "el", "en", "fi", "gra",
+    "in", "ka", "lo", "ma", "net", "no", "or", "pa", "quo", "ra", "sec", "sto",
+    "ta", "tri", "un", "ver", "wa", "xo", "yo", "zen",
+]
+
+
+def make_word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def build_topics(keyword_count: int, topic_count: int, rng: random.Random) -> list:
+    keywords = set()
+    while len(keywords) < keyword_count:
+        # Mostly single words, some two-word phrases ("quantum computing")
+        words = [make_word(rng) for _ in range(1 if rng.random() < 0.8 else 2)]
+        keywords.add(" ".join(words).title() if rng.random() < 0.3 else " ".join(words))
+    keywords = sorted(keywords)
+    rng.shuffle(keywords)
+    per_topic = max(1, keyword_count // topic_count)
+    return [
+        {"topic_id": f"topic-{i}", "keywords": keywords[i * per_topic:(i + 1) * per_topic]}
+        for i in range(topic_count)
+    ]
+
+
+def build_articles(count: int, topics: list, rng: random.Random) -> list:
+    keywords = [k for topic in topics for k in topic["keywords"]]
+    articles = []
+    for _ in range(count):
+        title = [make_word(rng) for _ in range(rng.randint(6, 14))]
+        content = [make_word(rng) for _ in range(rng.randint(40, 120))]
+        # A few real keyword mentions per article
+        for _ in range(rng.randint(0, 2)):
+            title.insert(rng.randrange(len(title) + 1), rng.choice(keywords))
+        for _ in range(rng.randint(0, 5)):
+            content.insert(rng.randrange(len(content) + 1), rng.choice(keywords))
+        articles.append({"title": " ".join(title).capitalize(), "content": " ".join(content) + "."})
+    return articles
+
+
+def match_loop(article: dict, topics: list):
+    """The old _score_single_article matching loop."""
+    title = article["title"].lower()
+    content = article["content"].lower()
+    topic_matches = []
+    matched_keywords = []
+    for topic in topics:
+        matches = 0
+        for keyword in topic["keywords"]:
+            keyword_lower = keyword.lower()
+            if keyword_lower in title:
+                matches += 3
+                matched_keywords.append(keyword)
+            elif keyword_lower in content:
+                matches += 1
+                matched_keywords.append(keyword)
+        if matches > 0:
+            topic_matches.append((topic["topic_id"], matches))
+    return topic_matches, matched_keywords
+
+
+def run_loop(articles: list, topics: list) -> list:
+    return [match_loop(article, topics) for article in articles]
+
+
+def run_automaton(articles: list, topics: list) -> list:
+    matcher = TopicMatcher(normalize_topics(topics))
+    return [matcher.match(a["title"].lower(), a["content"].lower()) for a in articles]
+
+
+def bench(name: str, func, articles: list, topics: list):
+    started = time.perf_counter()
+    results = func(articles, topics)
+    elapsed = time.perf_counter() - started
+    rate = len(articles) / elapsed
+    print(f"{name:<10} {elapsed:7.3f}s  {rate:>10,.0f} articles/s")
+    return results, rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark topic keyword matching")
+    parser.add_argument("--articles", type=int, default=10000, help="Articles to score")
+    parser.add_argument("--keywords", type=int, default=500, help="Keywords across all topics")
+    parser.add_argument("--topics", type=int, default=20, help="Topics the keywords are split into")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    topics = build_topics(args.keywords, args.topics, rng)
+    articles = build_articles(args.articles, topics, rng)
+    chars = sum(len(a["title"]) + len(a["content"]) for a in articles) / len(articles)
+    print(f"{args.articles} articles (~{chars:.0f} chars) x {args.keywords} keywords in {args.topics} topics")
+
+    started = time.perf_counter()
+    compile_topics(topics)
+    print(f"compile    {(time.perf_counter() - started) * 1000:7.1f}ms")
+    started = time.perf_counter()
+    compile_topics(topics)
+    print(f"cached     {(time.perf_counter() - started) * 1000:7.1f}ms (topic set hash lookup)")
+
+    expected, baseline = bench("loop", run_loop, articles, topics)
+    actual, rate = bench("automaton", run_automaton, articles, topics)
+    mismatches = sum(1 for a, b in zip(expected, actual) if a != b)
+    hits = sum(len(keywords) for _, keywords in actual)
+    print(f"speedup    {rate / baseline:.1f}x, {hits} keyword hits, {mismatches} mismatches")
+
+
+if __name__ == "__main__":
+    main()
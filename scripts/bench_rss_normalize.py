@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark: RSS entry normalization + response encoding (entries/second).
+
+Compares the previous fetch_rss_feed hot path against the current one on
+the same parsed feed:
+
+- pydantic: Article model per entry -> FetchRSSFeedResponse -> FastAPI-style
+  response_model re-validation and JSON dump -> json.dumps
+- record:   ArticleRecord per entry -> response dict -> services.encoding.dumps
+
+Both then decode the body and run Agent 1's normalize_article, as the
+harvester does. Feed download and feedparser time are excluded.
+
+Usage:
+    python scripts/bench_rss_normalize.py [--entries 500] [--rounds 20]
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "app" / "mcp_service"))
+sys.path.insert(0, str(ROOT / "app"))
+
+import feedparser  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from routers.rss import (  # noqa: E402
+    Article,
+    FetchRSSFeedResponse,
+    extract_categories,
+    feed_response,
+    normalize_entry,
+    normalize_published_date,
+)
+from services.encoding import dumps  # noqa: E402
+from perception_agent.tools.agent_1_tools import normalize_article  # noqa: E402
+
+
+def build_feed(entries: int) -> bytes:
+    """Synthetic RSS 2.0 feed with realistic-sized items."""
+    now = datetime.now(tz=timezone.utc)
+    items = []
+    for i in range(entries):
+        published = (now - timedelta(minutes=7 * i)).strftime("%a, %d %b %Y %H:%M:%S +0000")
+        items.append(
+            f"<item><title>Story {i}: markets, models and the week ahead</title>"
+            f"<link>https://example.com/news/{i}</link>"
+            f"<pubDate>{published}</pubDate>"
+            f"<author>desk{i % 7}@example.com (Desk {i % 7})</author>"
+            f"<category>tech</category><category>ai</category>"
+            f"<description>{'Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' * 12}</description>"
+            f"</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        "<title>Bench</title><link>https://example.com</link><description>Bench</description>"
+        + "".join(items)
+        + "</channel></rss>"
+    ).encode("utf-8")
+
+
+def legacy_normalize_entry(entry) -> Article:
+    """The pre-ArticleRecord normalize_entry (one Pydantic model per entry)."""
+    content_snippet = None
+    if hasattr(entry, 'summary'):
+        content_snippet = entry.summary[:500] if len(entry.summary) > 500 else entry.summary
+    elif hasattr(entry, 'description'):
+        content_snippet = entry.description[:500] if len(entry.description) > 500 else entry.description
+
+    return Article(
+        title=entry.get('title', 'Untitled'),
+        url=entry.get('link', ''),
+        published_at=normalize_published_date(entry),
+        summary=entry.get('summary'),
+        author=entry.get('author'),
+        content_snippet=content_snippet,
+        raw_content=entry.get('content', [{}])[0].get('value') if entry.get('content') else None,
+        categories=extract_categories(entry)
+    )
+
+
+RESPONSE_ADAPTER = TypeAdapter(FetchRSSFeedResponse)
+
+
+def run_pydantic(entries) -> int:
+    articles = [legacy_normalize_entry(entry) for entry in entries]
+    result = FetchRSSFeedResponse(
+        feed_id="", feed_url="https://example.com/feed", fetched_at=datetime.now(tz=timezone.utc).isoformat(),
+        article_count=len(articles), articles=articles,
+    )
+    # What FastAPI does with response_model: dump, re-validate, dump to JSON-able, json.dumps
+    validated = RESPONSE_ADAPTER.validate_python(result.model_dump())
+    body = json.dumps(RESPONSE_ADAPTER.dump_python(validated, mode="json")).encode("utf-8")
+    data = json.loads(body)
+    return len([normalize_article(raw, "bench", "tech") for raw in data["articles"]])
+
+
+def run_record(entries) -> int:
+    articles = [normalize_entry(entry) for entry in entries]
+    body = dumps(feed_response("https://example.com/feed", datetime.now(tz=timezone.utc).isoformat(), articles))
+    data = json.loads(body)
+    return len([normalize_article(raw, "bench", "tech") for raw in data["articles"]])
+
+
+def bench(name: str, func, entries, rounds: int) -> float:
+    func(entries)  # warm-up
+    started = time.perf_counter()
+    total = 0
+    for _ in range(rounds):
+        total += func(entries)
+    elapsed = time.perf_counter() - started
+    rate = total / elapsed
+    print(f"{name:<10} {total:>8} entries  {elapsed:7.3f}s  {rate:>10,.0f} entries/s")
+    return rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark RSS normalization paths")
+    parser.add_argument("--entries", type=int, default=500, help="Entries per feed")
+    parser.add_argument("--rounds", type=int, default=20, help="Feeds processed per path")
+    args = parser.parse_args()
+
+    entries = feedparser.parse(build_feed(args.entries)).entries
+    print(f"{len(entries)} entries x {args.rounds} rounds")
+
+    baseline = bench("pydantic", run_pydantic, entries, args.rounds)
+    current = bench("record", run_record, entries, args.rounds)
+    print(f"speedup    {current / baseline:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Agent 3 scoring, per-article dicts vs NumPy columns (articles/second).
+
+Scores a synthetic harvest (see bench_keyword_match.py) with:
+
+- per_article: score_articles' loop (_score_single_article per article)
+- columns:     score_article_columns, split into its stages:
+               match (keyword automaton per article), aggregate (NumPy:
+               sparse article x topic points, clamp, max) and section
+
+and checks both give the same scores, topics and tags. The compiled topic
+matcher is warmed first, so neither side pays for compiling it.
+
+Usage:
+    python scripts/bench_score_batch.py [--articles 20000] [--keywords 500] [--topics 20]
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "app"))
+
+import numpy  # noqa: E402,F401  (imported up front so its import time isn't measured)
+from bench_keyword_match import build_articles, build_topics  # noqa: E402
+from perception_agent.tools import agent_3_tools  # noqa: E402
+from perception_agent.tools.batch_scoring import aggregate_scores, match_hits  # noqa: E402
+from perception_agent.tools.keyword_matcher import compile_topics  # noqa: E402
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark batch relevance scoring")
+    parser.add_argument("--articles", type=int, default=20000, help="Articles to score")
+    parser.add_argument("--keywords", type=int, default=500, help="Keywords across all topics")
+    parser.add_argument("--topics", type=int, default=20, help="Topics the keywords are split into")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rng = random.Random(7)
+    topics = build_topics(args.keywords, args.topics, rng)
+    articles = build_articles(args.articles, topics, rng)
+    print(f"{args.articles} articles x {args.keywords} keywords in {args.topics} topics")
+    matcher = compile_topics(topics)
+
+    agent_3_tools.SCORE_BATCH = False
+    expected, elapsed = timed(agent_3_tools.score_articles, articles, topics)
+    print(f"per_article {elapsed:7.3f}s  {len(articles) / elapsed:>10,.0f} articles/s")
+
+    texts, text_time = timed(lambda: [agent_3_tools._article_text(a) for a in articles])
+    hits, match_time = timed(match_hits, matcher, [(title, content) for title, content, _ in texts])
+    columns, aggregate_time = timed(aggregate_scores, matcher, len(articles), hits)
+    _, section_time = timed(lambda: [
+        agent_3_tools._infer_section(category, title, content, keywords)
+        for (title, content, category), keywords in zip(texts, columns["matched_keywords"])
+    ])
+    total = text_time + match_time + aggregate_time + section_time
+    print(f"columns     {total:7.3f}s  {len(articles) / total:>10,.0f} articles/s")
+    print(f"  match     {match_time:7.3f}s  ({len(hits[0])} pattern hits)")
+    print(f"  aggregate {aggregate_time * 1000:7.1f}ms")
+    print(f"  section   {section_time:7.3f}s")
+
+    agent_3_tools.SCORE_BATCH = True
+    actual = agent_3_tools.score_articles(articles, topics)
+    mismatches = sum(1 for a, b in zip(expected, actual) if a != b)
+    print(f"mismatches  {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
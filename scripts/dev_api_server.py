@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for a paginated news API, for exercising fetch_api_feed.
+
+Serves NewsAPI-shaped JSON ({"status", "totalResults", "articles": [...]})
+with items newest-first, one every --spacing-minutes:
+
+- GET /page?page=N&pageSize=M      page-number pagination (reports totalResults)
+- GET /offset?offset=N&pageSize=M  offset pagination
+- GET /cursor?cursor=C&pageSize=M  cursor pagination (next_cursor in the body)
+
+Every request needs the API key (apiKey query parameter or X-Api-Key
+header) and is delayed by --latency-ms, so page concurrency is visible.
+
+Usage:
+    python scripts/dev_api_server.py [--port 8766] [--items 500]
+
+Example source_config for fetch_api_feed (export API_KEY_DEV=dev-key):
+    {"url": "http://127.0.0.1:8766/page", "api_key_env": "API_KEY_DEV",
+     "pagination": {"type": "page", "page_size": 50, "total_path": "totalResults"}}
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+API_KEY = "dev-key"
+
+
+def build_items(count: int, spacing_minutes: float) -> list:
+    now = datetime.now(tz=timezone.utc)
+    return [
+        {
+            "id": f"dev-{i}",
+            "title": f"Dev story {i}",
+            "url": f"https://example.com/dev/{i}",
+            "publishedAt": (now - timedelta(minutes=spacing_minutes * i)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "description": f"Summary of dev story {i}.",
+            "author": f"Desk {i % 5}",
+            "content": f"Full text of dev story {i}. " * 20,
+            "source": {"id": "dev", "name": "Dev Wire"},
+        }
+        for i in range(count)
+    ]
+
+
+def make_handler(items: list, latency_ms: int):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = {k: v[0] for k, v in parse_qs(url.query).items()}
+            if latency_ms:
+                time.sleep(latency_ms / 1000)
+
+            if query.get("apiKey") != API_KEY and self.headers.get("X-Api-Key") != API_KEY:
+                return self.reply(401, {"status": "error", "code": "apiKeyInvalid"})
+
+            size = int(query.get("pageSize", "20"))
+            if url.path == "/page":
+                start = (int(query.get("page", "1")) - 1) * size
+            elif url.path == "/offset":
+                start = int(query.get("offset", "0"))
+            elif url.path == "/cursor":
+                start = int(query.get("cursor", "0"))
+            else:
+                return self.reply(404, {"status": "error", "code": "notFound"})
+
+            body = {"status": "ok", "totalResults": len(items), "articles": items[start:start + size]}
+            if url.path == "/cursor" and start + size < len(items):
+                body["next_cursor"] = str(start + size)
+            self.reply(200, body)
+
+        def reply(self, status: int, body: dict):
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stand-in paginated news API")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--items", type=int, default=500, help="Items the API holds")
+    parser.add_argument("--spacing-minutes", type=float, default=15, help="Minutes between item publish times")
+    parser.add_argument("--latency-ms", type=int, default=100, help="Delay added to every response")
+    args = parser.parse_args()
+
+    items = build_items(args.items, args.spacing_minutes)
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(items, args.latency_ms))
+    print(f"Stand-in API on http://127.0.0.1:{args.port} ({args.items} items, key {API_KEY!r})")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ Populates Firestore /sources collection from data/initial_feeds.csv
 """
 
 import csv
+import json
 import sys
 from pathlib import Path
 from firebase_admin import firestore, initialize_app
@@ -54,6 +55,9 @@ def load_feeds_from_csv(csv_path: str):
                 'createdAt': firestore.SERVER_TIMESTAMP,
                 'updatedAt': firestore.SERVER_TIMESTAMP
             }
+            # API sources: fetch_api_feed config (optional JSON column)
+            if row.get('api_config'):
+                source_doc['apiConfig'] = json.loads(row['api_config'])
 
             source_ref.set(source_doc)
             print(f"✅ Added: {row['name']} ({row['type']} - {row['url']})")
@@ -5,7 +5,7 @@ Perception With Intent - Dev Ingestion Runner
 Runs a single ingestion cycle locally for testing the E2E pipeline.
 
 Usage:
-    python scripts/run_ingestion_once.py [--user-id USER_ID] [--trigger TRIGGER]
+    python scripts/run_ingestion_once.py [--user-id USER_ID] [--trigger TRIGGER] [--all-users]
 
 Requirements:
     - MCP service running on http://localhost:8080 (or set MCP_BASE_URL)
@@ -27,6 +27,7 @@ from datetime import datetime, timezone
 sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
 
 from perception_agent.tools.agent_0_tools import run_daily_ingestion
+from perception_agent.tools.agent_1_tools import close_mcp_client
 
 # Configure structured logging
 logging.basicConfig(
@@ -44,13 +45,18 @@ async def main():
     parser.add_argument(
         "--user-id",
         default="system",
-        help="User ID to run ingestion for (default: system)"
+        help="User ID to run ingestion for (default: system); runs for other users skip source watermarks"
     )
     parser.add_argument(
         "--trigger",
         default="manual_dev",
         help="Trigger type for this run (default: manual_dev)"
     )
+    parser.add_argument(
+        "--all-users",
+        action="store_true",
+        help="Score for every user with active topics and write per-user selections"
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -67,15 +73,20 @@ async def main():
         "message": "Starting dev ingestion run",
         "user_id": args.user_id,
         "trigger": args.trigger,
+        "all_users": args.all_users,
         "timestamp": datetime.now(tz=timezone.utc).isoformat()
     }))
 
     try:
         # Run the ingestion pipeline
-        result = await run_daily_ingestion(
-            user_id=args.user_id,
-            trigger=args.trigger
-        )
+        try:
+            result = await run_daily_ingestion(
+                user_id=args.user_id,
+                trigger=args.trigger,
+                all_users=args.all_users
+            )
+        finally:
+            await close_mcp_client()
 
         # Print summary
         print("\n" + "=" * 60)
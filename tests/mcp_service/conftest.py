@@ -0,0 +1,14 @@
+"""
+Make the MCP service importable the way its container runs it (routers.*,
+services.*), with tool responses checked against their response_model.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+MCP_SERVICE_DIR = Path(__file__).resolve().parents[2] / "app" / "mcp_service"
+if str(MCP_SERVICE_DIR) not in sys.path:
+    sys.path.insert(0, str(MCP_SERVICE_DIR))
+
+os.environ.setdefault("VALIDATE_RESPONSES", "true")
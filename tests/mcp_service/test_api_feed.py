@@ -0,0 +1,260 @@
+"""
+fetch_api_feed against a stand-in API (httpx.MockTransport).
+
+The stand-in serves items newest-first, one every POST_GAP_MINUTES, and
+paginates by page number, offset or cursor.
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from routers import api
+from services.host_limiter import HostLimiter
+
+API_URL = "https://api.example.test/v1/articles"
+POST_GAP_MINUTES = 30
+
+
+def make_items(count, now, stale_first=0):
+    """count items newest-first; the first stale_first are old pinned posts."""
+    items = [
+        {
+            "id": f"pinned-{i}",
+            "title": f"Pinned {i}",
+            "url": f"https://example.test/pinned/{i}",
+            "publishedAt": (now - timedelta(days=30 + i)).isoformat(),
+        }
+        for i in range(stale_first)
+    ]
+    items += [
+        {
+            "id": f"item-{i}",
+            "title": f"Item {i}",
+            "url": f"https://example.test/items/{i}",
+            "publishedAt": (now - timedelta(minutes=POST_GAP_MINUTES * (i + 1))).isoformat(),
+            "description": f"Summary {i}",
+        }
+        for i in range(count)
+    ]
+    return items
+
+
+class StandInAPI:
+    """Serves items as page / offset / cursor pages; fail_on makes a request raise."""
+
+    def __init__(self, items, fail_on=None):
+        self.items = items
+        self.fail_on = fail_on
+        self.requests = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        params = request.url.params
+        if self.fail_on and self.fail_on(params):
+            raise httpx.ConnectError("connection refused", request=request)
+        size = int(params.get("pageSize", "100"))
+        if "offset" in params:
+            start = int(params["offset"])
+        elif "cursor" in params:
+            start = int(params["cursor"])
+        else:
+            start = (int(params.get("page", "1")) - 1) * size
+        page = self.items[start:start + size]
+        body = {"articles": page, "totalResults": len(self.items)}
+        if start + size < len(self.items):
+            body["next_cursor"] = str(start + size)
+        # A stream (not content=) so fetch_bounded can read it raw, as from a socket
+        data = json.dumps(body).encode()
+        return httpx.Response(
+            200,
+            headers={"content-type": "application/json", "content-length": str(len(data))},
+            stream=httpx.ByteStream(data),
+        )
+
+
+@pytest.fixture
+def stand_in(monkeypatch):
+    """Route PageFetcher through a StandInAPI, without host throttling."""
+    def install(items, fail_on=None):
+        server = StandInAPI(items, fail_on)
+        transport = httpx.MockTransport(server.handler)
+        monkeypatch.setattr(api, "get_client", lambda: httpx.AsyncClient(transport=transport))
+        limiter = HostLimiter(rate=1000, burst=1000, max_concurrency=16)
+        monkeypatch.setattr(api, "get_host_limiter", lambda: limiter)
+        return server
+    return install
+
+
+def fetch(pagination, time_window_hours=24, max_items=500, **config):
+    request = api.FetchAPIFeedRequest(
+        feed_id="stand-in",
+        source_config={"url": API_URL, "pagination": pagination, **config},
+        time_window_hours=time_window_hours,
+        max_items=max_items,
+    )
+    return asyncio.run(api.fetch_api_feed_data(request))
+
+
+def test_route_response_matches_its_schema(stand_in):
+    now = datetime.now(tz=timezone.utc)
+    stand_in(make_items(3, now))
+    request = api.FetchAPIFeedRequest(feed_id="stand-in", source_config={"url": API_URL})
+
+    response = asyncio.run(api.fetch_api_feed(request))
+
+    body = api.FetchAPIFeedResponse.model_validate_json(response.body)
+    assert body.article_count == 3
+
+
+def titles(result):
+    return [article["title"] for article in result["articles"]]
+
+
+@pytest.mark.parametrize("pagination_type", ["page", "offset", "cursor"])
+def test_paginates_through_every_page(stand_in, pagination_type):
+    now = datetime.now(tz=timezone.utc)
+    server = stand_in(make_items(25, now))
+
+    # One page at a time: waves of concurrent pages would overshoot the short last page
+    result = fetch({"type": pagination_type, "page_size": 10, "concurrency": 1})
+
+    assert titles(result) == [f"Item {i}" for i in range(25)]
+    assert result["pages_fetched"] == 3
+    assert result["pages_failed"] == 0
+    assert len(server.requests) == 3
+    article = result["articles"][0]
+    assert article["guid"] == "item-0"
+    assert article["summary"] == "Summary 0"
+    assert article["date_missing"] is False
+
+
+def test_total_path_limits_page_requests(stand_in):
+    now = datetime.now(tz=timezone.utc)
+    server = stand_in(make_items(20, now))
+
+    result = fetch({"type": "page", "page_size": 10, "total_path": "totalResults"})
+
+    assert result["article_count"] == 20
+    # A full last page doesn't trigger a request for an empty page
+    assert len(server.requests) == 2
+
+
+@pytest.mark.parametrize("pagination_type", ["page", "cursor"])
+def test_stops_at_the_time_window(stand_in, pagination_type):
+    now = datetime.now(tz=timezone.utc)
+    # 48 items in the 24 hour window, 152 older ones after them
+    server = stand_in(make_items(200, now))
+
+    result = fetch({"type": pagination_type, "page_size": 10, "max_pages": 20, "concurrency": 1})
+
+    assert result["article_count"] == 47
+    assert result["stopped_early"] is True
+    assert len(server.requests) == 5
+    assert result["items_examined"] < 200
+
+
+def test_stale_pinned_items_do_not_end_the_scan(stand_in):
+    now = datetime.now(tz=timezone.utc)
+    stand_in(make_items(5, now, stale_first=3))
+
+    result = fetch({"type": "none"})
+
+    assert titles(result) == [f"Item {i}" for i in range(5)]
+
+
+def test_max_items(stand_in):
+    now = datetime.now(tz=timezone.utc)
+    server = stand_in(make_items(40, now))
+
+    result = fetch({"type": "offset", "page_size": 5, "concurrency": 4}, max_items=7)
+
+    assert titles(result) == [f"Item {i}" for i in range(7)]
+    assert result["stopped_early"] is True
+    # Only as many pages as max_items can use
+    assert len(server.requests) == 2
+
+
+def test_later_cursor_page_failure_keeps_earlier_pages(stand_in):
+    now = datetime.now(tz=timezone.utc)
+    stand_in(make_items(25, now), fail_on=lambda params: params.get("cursor") == "10")
+
+    result = fetch({"type": "cursor", "page_size": 10})
+
+    assert titles(result) == [f"Item {i}" for i in range(10)]
+    assert result["pages_fetched"] == 1
+    assert result["pages_failed"] == 1
+
+
+def test_later_numbered_page_failure_keeps_earlier_pages(stand_in):
+    now = datetime.now(tz=timezone.utc)
+    stand_in(make_items(25, now), fail_on=lambda params: params.get("page") == "3")
+
+    result = fetch({"type": "page", "page_size": 10, "concurrency": 1})
+
+    assert titles(result) == [f"Item {i}" for i in range(20)]
+    assert result["pages_failed"] == 1
+
+
+def test_first_page_failure_is_a_502(stand_in):
+    now = datetime.now(tz=timezone.utc)
+    stand_in(make_items(25, now), fail_on=lambda params: True)
+
+    with pytest.raises(HTTPException) as excinfo:
+        fetch({"type": "cursor", "page_size": 10})
+
+    assert excinfo.value.status_code == 502
+    assert excinfo.value.detail["error"]["code"] == "API_FETCH_FAILED"
+    assert excinfo.value.detail["error"]["feed_id"] == "stand-in"
+
+
+def test_api_key_env_must_use_the_prefix(stand_in, monkeypatch):
+    monkeypatch.setenv("SECRET_TOKEN", "do-not-leak")
+    server = stand_in(make_items(3, datetime.now(tz=timezone.utc)))
+
+    with pytest.raises(HTTPException) as excinfo:
+        fetch({"type": "none"}, api_key_env="SECRET_TOKEN", api_key_header="X-Api-Key")
+
+    assert excinfo.value.status_code == 422
+    assert excinfo.value.detail["error"]["code"] == "API_CONFIG_INVALID"
+    assert server.requests == []
+
+
+def test_api_key_is_only_sent_to_next_page_urls_on_the_same_host(monkeypatch):
+    monkeypatch.setenv("API_KEY_STAND_IN", "k3y")
+    now = datetime.now(tz=timezone.utc)
+    items = make_items(3, now)
+    next_urls = {
+        "api.example.test": "https://api.example.test/v1/articles?after=1",
+        "other.example.test": "https://other.example.test/v1/articles?after=2",
+    }
+    seen = []
+
+    def handler(request):
+        seen.append((request.url.host, request.headers.get("x-api-key")))
+        after = request.url.params.get("after")
+        if after is None:
+            body = {"articles": items[:1], "next_cursor": next_urls["api.example.test"]}
+        elif after == "1":
+            body = {"articles": items[1:2], "next_cursor": next_urls["other.example.test"]}
+        else:
+            body = {"articles": items[2:]}
+        data = json.dumps(body).encode()
+        return httpx.Response(200, headers={"content-type": "application/json"}, stream=httpx.ByteStream(data))
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(api, "get_client", lambda: httpx.AsyncClient(transport=transport))
+    monkeypatch.setattr(api, "get_host_limiter", lambda: HostLimiter(rate=1000, burst=1000, max_concurrency=16))
+
+    result = fetch({"type": "cursor"}, api_key_env="API_KEY_STAND_IN", api_key_header="X-Api-Key")
+
+    assert result["article_count"] == 3
+    assert seen == [
+        ("api.example.test", "k3y"),
+        ("api.example.test", "k3y"),
+        ("other.example.test", None),
+    ]
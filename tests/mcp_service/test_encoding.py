@@ -0,0 +1,38 @@
+"""FastJSONResponse encoding and its optional response_model check."""
+
+import json
+
+import pytest
+from fastapi.exceptions import ResponseValidationError
+from pydantic import BaseModel
+
+from services import encoding
+from services.encoding import FastJSONResponse
+
+
+class Item(BaseModel):
+    title: str
+    count: int
+
+
+def test_renders_compact_utf8_json():
+    response = FastJSONResponse({"title": "Café", "count": 2})
+
+    assert json.loads(response.body) == {"title": "Café", "count": 2}
+    assert b" " not in response.body
+
+
+def test_checks_the_model_when_enabled(monkeypatch):
+    monkeypatch.setattr(encoding, "VALIDATE_RESPONSES", True)
+
+    FastJSONResponse({"title": "ok", "count": 1}, model=Item)
+    with pytest.raises(ResponseValidationError):
+        FastJSONResponse({"title": "missing count"}, model=Item)
+
+
+def test_skips_the_model_when_disabled(monkeypatch):
+    monkeypatch.setattr(encoding, "VALIDATE_RESPONSES", False)
+
+    response = FastJSONResponse({"title": "missing count"}, model=Item)
+
+    assert json.loads(response.body) == {"title": "missing count"}
@@ -0,0 +1,57 @@
+"""Main-content extraction: boilerplate stripping must not take the article with it."""
+
+import pytest
+
+from services.html_extract import extract_page
+
+SENTENCE = "The committee published its findings on regional transit funding today. "
+PARAGRAPH = f"<p>{SENTENCE * 4}</p>"
+ARTICLE_WORDS = len(SENTENCE.split()) * 4
+
+
+def extract(body_html):
+    html = f"<html><head><title>Post</title></head><body>{body_html}</body></html>"
+    result, _, _ = extract_page(html.encode(), "text/html; charset=utf-8")
+    return result
+
+
+@pytest.mark.parametrize("body_html", [
+    # Layout wrappers whose class mentions a boilerplate word
+    f'<div class="layout has-sidebar"><div class="post">{PARAGRAPH * 3}</div></div>',
+    f'<div class="layout has-sidebar">{PARAGRAPH * 3}</div>',
+    # "unavailable" contains "nav", "shadow" contains "ad": not boilerplate words
+    f'<div class="unavailable-note">{PARAGRAPH * 3}</div>',
+    f'<article><div class="shadow">{PARAGRAPH * 3}</div></article>',
+])
+def test_wrappers_keep_the_article(body_html):
+    result = extract(body_html)
+
+    assert result["word_count"] == ARTICLE_WORDS * 3
+    assert result["content"].count(SENTENCE.strip()) == 12
+
+
+def test_boilerplate_inside_the_container_is_stripped():
+    result = extract(
+        f'<div class="layout has-sidebar"><div class="post">{PARAGRAPH * 2}'
+        '<div class="share-bar"><p>Share this story with your friends and family today</p></div></div>'
+        '<div class="sidebar"><p>Most read: ten other stories you might like to read</p></div></div>'
+    )
+
+    assert "Share this" not in result["content"]
+    assert "Most read" not in result["content"]
+    assert result["word_count"] == ARTICLE_WORDS * 2
+
+
+def test_comment_thread_never_wins_over_the_post():
+    result = extract(f'<div class="entry">{PARAGRAPH}</div><div id="comments">{PARAGRAPH * 4}</div>')
+
+    assert result["word_count"] == ARTICLE_WORDS
+
+
+def test_ad_slots_in_an_article_are_stripped():
+    result = extract(
+        f'<article>{PARAGRAPH}<div class="ad_slot"><p>Buy one get one free at our partner store now</p></div></article>'
+    )
+
+    assert "Buy one" not in result["content"]
+    assert result["word_count"] == ARTICLE_WORDS
@@ -0,0 +1,118 @@
+"""WebSub hub callback: which pushes are accepted and queued."""
+
+import asyncio
+import hashlib
+import hmac
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from routers import websub
+from services import websub_store
+from services.websub_store import WebSubStore, subscription_id
+
+FEED_URL = "https://blog.example.test/feed.xml"
+SECRET = "s3cret"
+TOKEN = "0123456789abcdef0123456789abcdef"
+
+FEED_BODY = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Blog</title>
+<item><title>Pushed post</title><link>https://blog.example.test/post</link>
+<guid>post-1</guid><pubDate>Sun, 18 Oct 2026 08:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = WebSubStore()
+    monkeypatch.setattr(websub_store, "_store", store)
+    return store
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(websub.callback_router, prefix="/websub")
+    return TestClient(app)
+
+
+def save(store, **fields):
+    record = {
+        "subscription_id": subscription_id(FEED_URL),
+        "feed_url": FEED_URL,
+        "topic": FEED_URL,
+        "state": "active",
+        "secret": SECRET,
+        "callback_token": TOKEN,
+        **fields,
+    }
+    asyncio.run(store.save_subscription(record))
+    return record
+
+
+def signed(body, secret=SECRET):
+    return {"X-Hub-Signature": "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()}
+
+
+def callback_path(token=TOKEN):
+    return f"/websub/callback/{subscription_id(FEED_URL)}.{token}"
+
+
+def queued(store):
+    return asyncio.run(store.list_pushes(100))
+
+
+@pytest.mark.parametrize("state", ["active", "pending"])
+def test_signed_push_is_queued(store, client, state):
+    save(store, state=state)
+
+    response = client.post(callback_path(), content=FEED_BODY, headers=signed(FEED_BODY))
+
+    assert response.status_code == 202
+    [push] = queued(store)
+    assert [article["title"] for article in push["articles"]] == ["Pushed post"]
+
+
+def test_unsigned_or_badly_signed_push_is_dropped(store, client):
+    save(store)
+
+    assert client.post(callback_path(), content=FEED_BODY).status_code == 202
+    assert client.post(callback_path(), content=FEED_BODY, headers=signed(FEED_BODY, "guess")).status_code == 202
+    assert queued(store) == []
+
+
+@pytest.mark.parametrize("fields", [
+    {"state": "no_hub", "secret": None},
+    {"state": "failed", "secret": None},
+    {"state": "unsubscribed"},
+    {"state": "denied"},
+    {"state": "active", "secret": None},
+])
+def test_other_states_and_missing_secret_get_410(store, client, fields):
+    save(store, **fields)
+
+    response = client.post(callback_path(), content=FEED_BODY, headers=signed(FEED_BODY))
+
+    assert response.status_code == 410
+    assert queued(store) == []
+
+
+def test_id_derived_from_the_feed_url_is_not_enough(store, client):
+    save(store)
+
+    for path in (f"/websub/callback/{subscription_id(FEED_URL)}", callback_path("f" * 32)):
+        assert client.post(path, content=FEED_BODY, headers=signed(FEED_BODY)).status_code == 410
+        assert client.get(path, params={"hub.mode": "subscribe", "hub.topic": FEED_URL, "hub.challenge": "x"}).status_code == 404
+    assert queued(store) == []
+
+
+def test_verification_echoes_the_challenge(store, client):
+    save(store, state="pending")
+
+    response = client.get(callback_path(), params={
+        "hub.mode": "subscribe", "hub.topic": FEED_URL, "hub.challenge": "abc", "hub.lease_seconds": "3600",
+    })
+
+    assert response.status_code == 200
+    assert response.text == "abc"